@@ -0,0 +1,79 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark the memory used by the intermediate model of rdl2ot.
+
+Compares the slotted model built by `OtInterfaceBuilder` with the dict model rdl2ot used to build,
+which is the json representation returned by `model.to_dict`, on a synthetic design.
+
+Usage: python benchmarks/bench_memory.py [--fields N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from rdl2ot.model import to_dict
+from rdl2ot.rtl_exporter import OtInterfaceBuilder
+from systemrdl import RDLCompiler
+
+FIELDS_PER_REG = 32
+
+
+def _synthetic_rdl(num_fields: int) -> str:
+    """Return an IP block of 32 bit registers made of single bit fields."""
+    fields = "\n".join(
+        f"        field {{}} F{idx}[{idx}:{idx}] = {idx % 2};" for idx in range(FIELDS_PER_REG)
+    )
+    regs = "\n".join(f"    reg_t R{idx};" for idx in range(num_fields // FIELDS_PER_REG))
+    return f"addrmap synthetic {{\n    reg reg_t {{\n{fields}\n    }};\n{regs}\n}};\n"
+
+
+def _deep_size(obj: object, seen: set[int] | None = None) -> int:
+    """Return the size of an object and of everything it references, counting each object once."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(key, seen) + _deep_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, list | tuple):
+        size += sum(_deep_size(item, seen) for item in obj)
+    elif hasattr(type(obj), "__slots__"):
+        size += sum(_deep_size(getattr(obj, slot), seen) for slot in type(obj).__slots__)
+    return size
+
+
+def main() -> None:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fields", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_rdl = Path(tmp) / "synthetic.rdl"
+        input_rdl.write_text(_synthetic_rdl(args.fields), encoding="utf-8")
+        print(f"Compiling a synthetic design of {args.fields} fields...")
+        rdlc = RDLCompiler()
+        rdlc.compile_file(input_rdl)
+        root = rdlc.elaborate().top
+
+    start = time.perf_counter()
+    slotted = OtInterfaceBuilder().parse_ip_block(root)
+    duration = time.perf_counter() - start
+    print(f"Parsed in {duration:.2f} s")
+
+    sizes = {
+        "dict model (before)": _deep_size(to_dict(slotted)),
+        "slotted model": _deep_size(slotted),
+    }
+    for name, size in sizes.items():
+        print(f"  {name:<32} {size / (1024 * 1024):8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark the RDL exported by rdlexporter with and without shared definitions.
+
+Reports the size of the output, the export time and the time to compile and elaborate the output
+again, on the lc_ctrl and uart snapshots and on a synthetic map whose registers are instances of a
+few definitions, as imported from a register database.
+
+Usage: python benchmarks/bench_rdl_export.py [--registers N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from systemrdl import RDLCompiler
+
+from rdlexporter import RdlExporter
+
+SNAPSHOTS_DIR = Path(__file__).parent.parent / "rdlexporter/tests/snapshots"
+REGISTER_SHAPES = 16
+
+
+def _synthetic_rdl(num_registers: int) -> str:
+    """Return an addrmap of registers repeating a few layouts, each with its own definition."""
+    lines = ["addrmap synthetic {"]
+    for idx in range(num_registers):
+        shape = idx % REGISTER_SHAPES
+        width = 4 << (shape % 4)
+        lines.append("    reg {")
+        for lsb in range(0, 32, width):
+            reset = (shape + lsb) % (1 << width)
+            props = f'sw = rw; hw = r; reset = {reset}; desc = "Field of shape {shape}.";'
+            lines.append(f"        field {{ {props} }} F{lsb}[{lsb + width - 1}:{lsb}];")
+        lines.append(f"    }} R{idx} @ 0x{idx * 4:X};")
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def _compile(input_rdl: Path) -> tuple[RDLCompiler, float]:
+    start = time.perf_counter()
+    rdlc = RDLCompiler()
+    rdlc.compile_file(input_rdl)
+    rdlc.elaborate()
+    return rdlc, time.perf_counter() - start
+
+
+def _bench(name: str, input_rdl: Path, out_dir: Path, prefix: str = "") -> None:
+    rdlc, _ = _compile(input_rdl)
+    for share in (False, True):
+        output = out_dir / f"{name}_{'shared' if share else 'inline'}.rdl"
+        output.write_text(prefix, encoding="utf-8")
+        start = time.perf_counter()
+        RdlExporter(rdlc, share_definitions=share).export(output)
+        export_time = time.perf_counter() - start
+        _, compile_time = _compile(output)
+        size = output.stat().st_size / 1024
+        mode = "shared" if share else "inline"
+        print(
+            f"  {name:<10} {mode:<8} {size:10.1f} KiB {export_time * 1000:10.1f} ms"
+            f" {compile_time * 1000:12.1f} ms"
+        )
+
+
+def main() -> None:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--registers", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"  {'design':<10} {'mode':<8} {'output':>14} {'export':>13} {'recompile':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+        # The snapshots use the enums and properties of user_defined.rdl.
+        prefix = f'`include "{SNAPSHOTS_DIR / "user_defined.rdl"}"\n\n'
+        for ip_block in ("lc_ctrl", "uart"):
+            _bench(ip_block, SNAPSHOTS_DIR / f"{ip_block}.rdl", out_dir, prefix)
+
+        input_rdl = out_dir / "synthetic.rdl"
+        input_rdl.write_text(_synthetic_rdl(args.registers), encoding="utf-8")
+        _bench("synthetic", input_rdl, out_dir)
+
+
+if __name__ == "__main__":
+    main()
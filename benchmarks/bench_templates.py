@@ -0,0 +1,122 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark the template loading and rendering of rdl2ot.
+
+Compares the environment created for every block, as rdl2ot used to do, with the shared
+environment backed by a bytecode cache or by precompiled templates.
+
+Usage: python benchmarks/bench_templates.py [--iterations N] [input_rdl]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+from rdl2ot.environment import compile_templates, create_environment
+from rdl2ot.model import IpBlock
+from rdl2ot.renderer import _render_tasks, _variables
+from rdl2ot.rtl_exporter import OtInterfaceBuilder
+from systemrdl import RDLCompiler
+
+from rdl2ot import TEMPLATES_DIR
+
+SNAPSHOTS_DIR = Path(__file__).parent.parent / "rdl2ot/tests/snapshots"
+TEMPLATES = ["reg_pkg.sv.tpl", "reg_top.sv.tpl"]
+
+COLD_START_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from pathlib import Path
+from rdl2ot.environment import create_environment
+compiled, bytecode = (Path(arg) if arg else None for arg in sys.argv[1:3])
+env = create_environment(compiled, bytecode)
+for name in {templates!r}:
+    env.get_template(name)
+print(time.perf_counter() - start)
+"""
+
+
+def _cold_start(compiled_dir: Path | None, bytecode_dir: Path | None, iterations: int) -> float:
+    """Return the median time to load the templates in a fresh interpreter."""
+    script = COLD_START_SCRIPT.format(templates=TEMPLATES)
+    args = [str(compiled_dir or ""), str(bytecode_dir or "")]
+    samples = []
+    for _ in range(iterations):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script, *args], capture_output=True, text=True, check=True
+        )
+        samples.append(float(result.stdout))
+    return statistics.median(samples)
+
+
+def _legacy_environment() -> Environment:
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+    env.filters["camelcase"] = str
+    return env
+
+
+def _render_block(env: Environment, ip_block: IpBlock) -> None:
+    for template_name, data, path in _render_tasks(ip_block, Path()):
+        env.get_template(template_name).render(_variables(template_name, data, path))
+
+
+def _per_block(get_env: Callable[[], Environment], ip_block: IpBlock, iterations: int) -> float:
+    """Return the median time to render all the templates of a block."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        _render_block(get_env(), ip_block)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input_rdl", nargs="?", default=SNAPSHOTS_DIR / "lc_ctrl.rdl", type=Path)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    rdlc = RDLCompiler()
+    rdlc.compile_file(args.input_rdl)
+    ip_block = OtInterfaceBuilder().parse_ip_block(rdlc.elaborate().top)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        compiled_dir = Path(tmp) / "compiled"
+        compiled_dir.mkdir()
+        compile_templates(compiled_dir)
+        bytecode_dir = Path(tmp) / "bytecode"
+        # Populate the bytecode cache.
+        _cold_start(None, bytecode_dir, 1)
+
+        print(f"Cold start, loading {' and '.join(TEMPLATES)}:")
+        cold = {
+            "template sources (before)": _cold_start(None, None, args.iterations),
+            "bytecode cache": _cold_start(None, bytecode_dir, args.iterations),
+            "precompiled modules": _cold_start(compiled_dir, None, args.iterations),
+        }
+        for name, duration in cold.items():
+            print(f"  {name:<32} {duration * 1000:8.2f} ms")
+
+        print(f"Per block render of {args.input_rdl.name}:")
+        shared_env = create_environment(compiled_dir)
+        per_block = {
+            "environment per block (before)": _per_block(
+                _legacy_environment, ip_block, args.iterations
+            ),
+            "shared environment": _per_block(lambda: shared_env, ip_block, args.iterations),
+        }
+        for name, duration in per_block.items():
+            print(f"  {name:<32} {duration * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark how rdl2ot and the rdlexporter scale with the size of a synthetic design.
+
+One dimension of the design, `--axis`, is multiplied by every `--scales` factor, and each phase is
+timed separately. The results are saved to `--output`, compared to a `--baseline` saved by a
+previous run, and the growth of each phase is checked to be at most linear.
+
+Usage: python benchmarks/scaling [--axis registers] [--scales 1 2 4 8] [--output results.json]
+           [--baseline baseline.json]
+"""
+
+import argparse
+import dataclasses
+import json
+import math
+import sys
+from pathlib import Path
+
+from phases import PHASES, measure
+from synthetic import Design
+
+# The phases faster than this at the largest scale are too noisy for the complexity check.
+MIN_DURATION = 0.01
+
+
+def _slope(sizes: list[int], durations: list[float]) -> float:
+    """Return the slope of the least squares fit of the durations to the sizes on a log-log scale.
+
+    The slope is close to 1 for a linear growth, and to 2 for a quadratic one.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(duration, 1e-9)) for duration in durations]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    cov = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys, strict=True))
+    return cov / sum((x - x_mean) ** 2 for x in xs)
+
+
+def _regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """List the phases slower than the baseline by more than `tolerance`, at the same size."""
+    reference = {run["size"]: run["phases"] for run in baseline["runs"]}
+    if baseline["design"] != results["design"] or baseline["axis"] != results["axis"]:
+        print("WARNING: The baseline was measured on another design, comparing the common sizes.")
+    messages = []
+    for run in results["runs"]:
+        for phase, duration in run["phases"].items():
+            before = reference.get(run["size"], {}).get(phase)
+            if before and duration > max(before * (1 + tolerance), before + MIN_DURATION):
+                messages.append(
+                    f"{phase} at {results['axis']}={run['size']}: "
+                    f"{before * 1000:.1f} ms -> {duration * 1000:.1f} ms"
+                )
+    return messages
+
+
+def main() -> None:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    design = Design()
+    for attribute in dataclasses.fields(design):
+        name = attribute.name.replace("_", "-")
+        parser.add_argument(f"--{name}", type=int, default=getattr(design, attribute.name))
+    parser.add_argument(
+        "--axis", choices=[a.name for a in dataclasses.fields(design)], default="registers"
+    )
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--max-slope", type=float, default=1.3)
+    args = parser.parse_args()
+    if len(args.scales) < 2:  # noqa: PLR2004
+        print("Error: At least two scales are needed to check the complexity.")
+        sys.exit(1)
+
+    design = Design(**{a.name: getattr(args, a.name) for a in dataclasses.fields(Design)})
+    results = {"design": dataclasses.asdict(design), "axis": args.axis, "runs": [], "slopes": {}}
+    print(f"{args.axis:>12} " + " ".join(f"{name:>10}" for name in PHASES))
+    for scale in args.scales:
+        size = getattr(design, args.axis) * scale
+        durations = measure(dataclasses.replace(design, **{args.axis: size}), args.repeat)
+        results["runs"].append({"size": size, "phases": durations})
+        row = " ".join(f"{durations[name] * 1000:8.1f}ms" for name in PHASES)
+        print(f"{size:>12} {row}")
+
+    failures = []
+    sizes = [run["size"] for run in results["runs"]]
+    for phase in PHASES:
+        durations = [run["phases"][phase] for run in results["runs"]]
+        slope = results["slopes"][phase] = _slope(sizes, durations)
+        if slope > args.max_slope and durations[-1] >= MIN_DURATION:
+            failures.append(f"{phase} grows superlinearly with {args.axis}, slope {slope:.2f}")
+    print(f"{'slope':>12} " + " ".join(f"{results['slopes'][name]:10.2f}" for name in PHASES))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved {args.output}.")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        failures.extend(
+            f"Regression: {message}" for message in _regressions(results, baseline, args.tolerance)
+        )
+
+    for failure in failures:
+        print(f"Error: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
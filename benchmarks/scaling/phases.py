@@ -0,0 +1,79 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Time each phase of rdl2ot and of the rdlexporter on a design."""
+
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from rdl2ot.environment import get_environment
+from rdl2ot.model import IpBlock, Soc
+from rdl2ot.renderer import _render_tasks, _variables
+from rdl2ot.rtl_exporter import OtInterfaceBuilder
+from synthetic import Design, generate
+from systemrdl import RDLCompiler
+
+from rdlexporter import RdlExporter
+
+PHASES = ("compile", "elaborate", "parse", "render", "write", "rdl_export")
+
+
+class _Timer:
+    """Accumulate the duration of the phases of a run."""
+
+    def __init__(self) -> None:
+        self.durations = {}
+
+    def __call__(self, phase: str, func: Callable, *args: object) -> object:
+        start = time.perf_counter()
+        result = func(*args)
+        self.durations[phase] = time.perf_counter() - start
+        return result
+
+
+def _run(input_rdl: Path, out_dir: Path, is_soc: bool) -> dict[str, float]:
+    timer = _Timer()
+    rdlc = RDLCompiler()
+    timer("compile", rdlc.compile_file, input_rdl)
+    root = timer("elaborate", rdlc.elaborate).top
+
+    builder = OtInterfaceBuilder()
+    obj = timer("parse", builder.parse_soc if is_soc else builder.parse_ip_block, root)
+    ip_blocks = obj.devices if isinstance(obj, Soc) else [obj]
+
+    def render(ip_blocks: list[IpBlock]) -> list[tuple[Path, str]]:
+        env = get_environment()
+        return [
+            (path, env.get_template(template).render(_variables(template, data, path)))
+            for ip_block in ip_blocks
+            for template, data, path in _render_tasks(ip_block, out_dir)
+        ]
+
+    def write(outputs: list[tuple[Path, str]]) -> None:
+        for path, text in outputs:
+            path.write_text(text, encoding="utf-8")
+
+    timer("write", write, timer("render", render, ip_blocks))
+    timer("rdl_export", RdlExporter(rdlc).export, out_dir / "exported.rdl")
+    return timer.durations
+
+
+def measure(design: Design, repeat: int) -> dict[str, float]:
+    """Return the median duration of every phase on `design`, in seconds."""
+    # Load the templates once, their loading time doesn't depend on the design.
+    for template in ("reg_pkg.sv.tpl", "reg_top.sv.tpl"):
+        get_environment().get_template(template)
+
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        input_rdl = Path(tmp) / "synthetic.rdl"
+        input_rdl.write_text(generate(design), encoding="utf-8")
+        for index in range(repeat):
+            out_dir = Path(tmp) / f"run{index}"
+            out_dir.mkdir()
+            samples.append(_run(input_rdl, out_dir, design.is_soc))
+    return {phase: statistics.median(sample[phase] for sample in samples) for phase in PHASES}
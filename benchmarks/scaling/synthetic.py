@@ -0,0 +1,100 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Synthetic SystemRDL designs of a configurable size."""
+
+import dataclasses
+
+REG_WIDTH = 32
+WINDOW_ENTRIES = 16
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class Design:
+    """The size of a synthetic design.
+
+    Every device is an IP block of `interfaces` interfaces, each made of `registers` registers of
+    `fields` fields, repeated `array_size` times if above one, followed by `windows` windows. A
+    design of a single device is an IP block, a SoC otherwise.
+    """
+
+    registers: int = 64
+    fields: int = 4
+    array_size: int = 1
+    interfaces: int = 1
+    windows: int = 0
+    devices: int = 1
+
+    @property
+    def is_soc(self) -> bool:
+        """Whether the design is rendered as a SoC."""
+        return self.devices > 1
+
+    @property
+    def num_fields(self) -> int:
+        """The number of fields of every register element of the design."""
+        return self.devices * self.interfaces * self.registers * self.array_size * self.fields
+
+
+def _register(index: int, fields: int) -> list[str]:
+    """Return the lines of a register of its own definition, so that none is parsed only once."""
+    width = REG_WIDTH // fields
+    lines = ["reg {"]
+    for field in range(fields):
+        lsb = field * width
+        reset = (index + field) % (1 << width)
+        props = f"sw = rw; hw = r; reset = {reset};"
+        lines.append(f"    field {{ {props} }} F{field}[{lsb + width - 1}:{lsb}];")
+    return lines
+
+
+def _interface(design: Design) -> list[str]:
+    """Return the lines of the registers and windows of an interface."""
+    lines = []
+    for index in range(design.registers):
+        array = f"[{design.array_size}]" if design.array_size > 1 else ""
+        lines.extend(_register(index, design.fields))
+        lines.append(f"}} R{index}{array};")
+    for index in range(design.windows):
+        lines.extend(
+            [
+                "external mem {",
+                f"    mementries = {WINDOW_ENTRIES};",
+                f"    memwidth = {REG_WIDTH};",
+                f"}} WIN{index};",
+            ]
+        )
+    return lines
+
+
+def _indent(lines: list[str]) -> list[str]:
+    return [f"    {line}" for line in lines]
+
+
+def generate(design: Design) -> str:
+    """Return the SystemRDL source of a design, the top addrmap being the last definition."""
+    if not 0 < design.fields <= REG_WIDTH:
+        print(f"Error: The number of fields per register must be between 1 and {REG_WIDTH}.")
+        raise ValueError
+
+    body = _interface(design)
+    if design.interfaces > 1:
+        body = [
+            line
+            for index in range(design.interfaces)
+            for line in ["addrmap {", *_indent(body), f"}} IF{index};"]
+        ]
+
+    if not design.is_soc:
+        lines = ["addrmap synthetic {", *_indent(body), "};"]
+        return "\n".join(lines) + "\n"
+
+    # Each device has its own definition, instances of the same definition would be parsed once.
+    lines = []
+    for index in range(design.devices):
+        lines.extend([f"addrmap device{index} {{", *_indent(body), "};", ""])
+    lines.append("addrmap synthetic {")
+    lines.extend(f"    device{index} DEVICE{index};" for index in range(design.devices))
+    lines.append("};")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,31 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Optional wheel build hook precompiling the templates into python modules.
+
+Enable it with `HATCH_BUILD_HOOK_ENABLE_CUSTOM=true uv build`.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CustomBuildHook(BuildHookInterface):
+    """Ship the precompiled templates as `rdl2ot/compiled_templates`."""
+
+    def initialize(self, version: str, build_data: dict) -> None:  # noqa: ARG002
+        """Compile the templates in a temporary directory included in the wheel."""
+        sys.path.insert(0, str(Path(self.root) / "src"))
+        from rdl2ot.environment import compile_templates  # noqa: PLC0415
+
+        self._target = tempfile.TemporaryDirectory()
+        compile_templates(Path(self._target.name))
+        build_data["force_include"][self._target.name] = "rdl2ot/compiled_templates"
+
+    def finalize(self, version: str, build_data: dict, artifact_path: str) -> None:  # noqa: ARG002
+        """Remove the temporary directory."""
+        self._target.cleanup()
@@ -2,4 +2,17 @@
 # Licensed under the Apache License, Version 2.0, see LICENSE for details.
 # SPDX-License-Identifier: Apache-2.0
 
-"""Init."""
+"""Init.
+
+The package is imported by every run of the cli, including `rdl2ot --help`, so it only holds the
+constants the cli needs to build its options and must not import anything else of rdl2ot.
+"""
+
+from pathlib import Path
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+# The address decoder styles of the interfaces, see `rtl_exporter.OtInterfaceBuilder`.
+DECODER_STYLES = ("flat", "indexed")
+DEFAULT_CACHE_SIZE = 512 * 1024 * 1024  # The bound of the build cache, in bytes.
+
+__version__ = "0.2.0"
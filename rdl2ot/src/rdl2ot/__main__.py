@@ -4,7 +4,7 @@
 
 """Main."""
 
-from cli import main
+from rdl2ot.cli import main
 
 if __name__ == "__main__":
-    main()
+    main(prog_name="rdl2ot")
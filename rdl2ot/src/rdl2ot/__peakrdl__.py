@@ -5,27 +5,91 @@
 
 """Generates OpenTitan regblock RTL."""
 
+import argparse
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from peakrdl.plugins.exporter import ExporterSubcommandPlugin  # pylint: disable=import-error
 
-from rdl2ot import rtl_exporter
+from rdl2ot import DECODER_STYLES
 
 if TYPE_CHECKING:
-    import argparse
-
     from systemrdl.node import AddrmapNode
 
 
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer, like the `IntRange(min=1)` of the click CLI."""
+    number = int(value)
+    if number < 1:
+        msg = f"{value} is not a positive integer"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
 class Exporter(ExporterSubcommandPlugin):
     """Generates OpenTitan regblock RTL."""
 
     short_desc = "Generates OpenTitan register block RTL."
 
     def add_exporter_arguments(self, arg_group: "argparse.ArgumentParser") -> None:
-        """No extra arguments."""
+        """Add the exporter arguments."""
+        arg_group.add_argument(
+            "--jobs",
+            "-j",
+            type=_positive_int,
+            default=1,
+            help="Number of processes used to parse the model and render the templates.",
+        )
+        arg_group.add_argument(
+            "--generate-loops",
+            action="store_true",
+            help="Render the homogeneous multiregs with generate loops rather than unrolled.",
+        )
+        arg_group.add_argument(
+            "--decoder",
+            choices=DECODER_STYLES,
+            default="flat",
+            help="Address decoder style, indexed decodes the registers by word or by page.",
+        )
+        arg_group.add_argument(
+            "--profile",
+            action="store_true",
+            help="Report the time and peak memory of every stage.",
+        )
+        arg_group.add_argument(
+            "--profile-json",
+            help="Save the profiling report to this json file, implies --profile.",
+        )
+        arg_group.add_argument(
+            "--profile-pstats",
+            help="Dump the cProfile statistics to this file, implies --profile.",
+        )
 
     def do_export(self, top_node: "AddrmapNode", options: "argparse.Namespace") -> None:
         """Plugin entry function."""
-        rtl_exporter.run(top_node, Path(options.output))
+        from rdl2ot import profiling  # noqa: PLC0415
+
+        if not (options.profile or options.profile_json or options.profile_pstats):
+            self._export(top_node, options)
+            return
+
+        pstats_file = Path(options.profile_pstats) if options.profile_pstats else None
+        with profiling.Profiler(pstats_file) as profiler:
+            self._export(top_node, options)
+        profiler.print_report()
+        if options.profile_json:
+            profiler.save(Path(options.profile_json))
+
+    def _export(self, top_node: "AddrmapNode", options: "argparse.Namespace") -> None:
+        # Imported here, peakrdl loads every plugin to build its help.
+        from rdl2ot import rtl_exporter  # noqa: PLC0415
+        from rdl2ot.cache import bytecode_cache_dir  # noqa: PLC0415
+
+        rtl_exporter.run(
+            top_node,
+            Path(options.output),
+            jobs=options.jobs,
+            generate_loops=options.generate_loops,
+            decoder=options.decoder,
+            bytecode_cache_dir=bytecode_cache_dir(),
+        )
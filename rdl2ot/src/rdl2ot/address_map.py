@@ -0,0 +1,306 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Index of the address map of an IP block or a SoC, to find what lives at an address.
+
+The registers and windows of every device instance and interface are sorted by absolute address
+into a flat interval list, which is searched by bisection. The elements of a register array share
+an interval, the element at an address being computed from the stride of the array.
+
+This module only depends on the model, so the index can be loaded from a saved `rdl.json`:
+```python
+index = AddressIndex.load("rdl.json")
+location = index.lookup(0x4000_0010)
+print(location.path, [field.name for field in location.fields])
+```
+"""
+
+import bisect
+import dataclasses
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from rdl2ot import schema
+from rdl2ot.model import BUS_BYTES, Field, Interface, IpBlock, Register, Soc, Window, from_dict
+
+# The (start, end, path, stride, size) of a region of the address map, the end being excluded: an
+# element of `size` bytes starts every `stride` bytes.
+Span = tuple[int, int, str, int, int]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Region:
+    """A register, a register array or a window of an interface instance."""
+
+    device: IpBlock
+    instance: str
+    interface: Interface
+    target: Register | Window
+    base: int
+    stride: int
+    count: int
+    # The number of bytes of every element.
+    size: int
+
+    @property
+    def path(self) -> str:
+        """The instance, interface and register or window names, separated by dots."""
+        names = (self.instance, self.interface.name, self.target.name)
+        return ".".join(name for name in names if name)
+
+    @property
+    def end(self) -> int:
+        """The address following the last element."""
+        return self.base + (self.count - 1) * self.stride + self.size
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Location:
+    """An element of a region and the byte offset of an address in it."""
+
+    region: Region
+    index: int
+    offset: int
+
+    @property
+    def path(self) -> str:
+        """The path of the region, with the index of the element if it is an array."""
+        return self.region.path + (f"[{self.index}]" if self.region.count > 1 else "")
+
+    @property
+    def device(self) -> IpBlock:
+        """The IP block of the instance."""
+        return self.region.device
+
+    @property
+    def interface(self) -> Interface:
+        """The interface holding the register or window."""
+        return self.region.interface
+
+    @property
+    def register(self) -> Register | None:
+        """The register, None if the address is in a window."""
+        target = self.region.target
+        return target if isinstance(target, Register) else None
+
+    @property
+    def window(self) -> Window | None:
+        """The window, None if the address is in a register."""
+        target = self.region.target
+        return target if isinstance(target, Window) else None
+
+    @property
+    def fields(self) -> list[Field]:
+        """The fields of the register in the bus word at the address.
+
+        Only the fields in that word are returned for a register wider than the bus.
+        """
+        if self.register is None:
+            return []
+        lsb = self.offset // BUS_BYTES * BUS_BYTES * 8
+        msb = lsb + BUS_BYTES * 8 - 1
+        return [field for field in self.register.fields if field.lsb <= msb and field.msb >= lsb]
+
+
+def _instances(device: IpBlock) -> Iterator[tuple[str, int]]:
+    """Yield the name and base address of every instance of an IP block."""
+    instances = [(instance.name, instance.offsets) for instance in device.instances]
+    for name, offsets in instances or [(device.ip_name, offsets) for offsets in device.offsets]:
+        for index, base in enumerate(offsets):
+            yield (f"{name}[{index}]" if len(offsets) > 1 else name), base
+
+
+def regions(device: IpBlock) -> Iterator[Region]:
+    """Yield the regions of every instance of an IP block, in the order of the model."""
+    for instance, base in _instances(device):
+        for interface in device.interfaces:
+            start = base + interface.offset
+            for reg in interface.regs:
+                offsets = reg.offsets
+                yield Region(
+                    device=device,
+                    instance=instance,
+                    interface=interface,
+                    target=reg,
+                    base=start + offsets.start,
+                    stride=offsets.step,
+                    count=len(offsets),
+                    size=reg.width // 8,
+                )
+            for window in interface.windows:
+                yield Region(
+                    device=device,
+                    instance=instance,
+                    interface=interface,
+                    target=window,
+                    base=start + window.offset,
+                    stride=window.size,
+                    count=1,
+                    size=window.size,
+                )
+
+
+def _span(region: Region) -> Span:
+    stride = region.stride if region.count > 1 else region.size
+    return region.base, region.end, region.path, stride, region.size
+
+
+def _collide(first: Span, second: Span) -> bool:
+    """Return whether an element of `first` overlaps an element of `second`, given their spans do.
+
+    The elements of the span with the larger stride are walked over the common range, each one being
+    checked against the single element of the other span which may overlap it.
+    """
+    if first[3] == first[4] and second[3] == second[4]:
+        return True
+    other, walked = sorted((first, second), key=lambda span: span[3])
+    start, end, _, stride, size = walked
+    lo, hi = max(start, other[0]), min(end, other[1])
+    last_start = other[1] - other[4]
+    for addr in range(start + max(0, (lo - start - size) // stride + 1) * stride, hi, stride):
+        index = (min(addr + size - 1, last_start) - other[0]) // other[3]
+        if other[0] + index * other[3] + other[4] > addr:
+            return True
+    return False
+
+
+def check_spans(spans: Iterable[Span]) -> tuple[list[tuple[str, str]], list[tuple[int, int]]]:
+    """Return the (path, path) of the overlapping spans and the (start, end) of the gaps.
+
+    The spans are sorted by address, then scanned once. The spans of sparse arrays may interleave,
+    so every span is checked against the ones it starts in. The gaps are the ranges covered by no
+    span, the holes of a sparse array being given by its stride rather than listed.
+    """
+    overlaps = []
+    gaps = []
+    active: list[Span] = []
+    reach = None
+    for span in sorted(spans):
+        start, end = span[0], span[1]
+        if reach is not None and start > reach:
+            gaps.append((reach, start))
+        active = [other for other in active if other[1] > start]
+        overlaps.extend((other[2], span[2]) for other in active if _collide(other, span))
+        active.append(span)
+        reach = end if reach is None else max(reach, end)
+    return overlaps, gaps
+
+
+def device_spans(device: IpBlock) -> Iterator[Span]:
+    """Yield the span of every register, register array and window of an IP block."""
+    return (_span(region) for region in regions(device))
+
+
+def report_overlaps(spans: Iterable[Span]) -> list[tuple[str, str]]:
+    """Print a warning for every overlap of the address map and return them.
+
+    The gaps are not reported: the devices and the registers of an address map are seldom
+    contiguous, so a warning would be noise. `check_spans` returns them.
+    """
+    overlaps, _ = check_spans(spans)
+    for first, second in overlaps:
+        print(f"Warning: {second} overlaps {first} in the address map.")
+    return overlaps
+
+
+class AddressIndex:
+    """Sorted interval index of the registers and windows of an IP block or a SoC.
+
+    `lookup` is a bisection over the start addresses, the element of an array being computed from
+    its stride. An address in a hole of a sparse array is looked up in the regions starting before
+    it whose span contains it, found by descending a tree of the maximum ends of the regions in
+    O(log n). Only the sparse arrays spanning the address are checked, whatever the number of
+    regions in between. The overlapping regions, see `overlaps`, are not supported: an address
+    resolves to the last region starting at or before it.
+    """
+
+    def __init__(self, devices: Iterable[IpBlock]) -> None:
+        """Index the regions of every instance of the devices."""
+        self._regions = sorted(
+            (region for device in devices for region in regions(device)),
+            key=lambda region: region.base,
+        )
+        self._starts = [region.base for region in self._regions]
+        # A segment tree of the maximum end of the regions, the leaf of a position being at
+        # `_leaves + position`. The padding leaves reach no address.
+        self._leaves = 1 << max(len(self._regions) - 1, 0).bit_length()
+        self._ends = [-1] * (2 * self._leaves)
+        self._ends[self._leaves : self._leaves + len(self._regions)] = [
+            region.end for region in self._regions
+        ]
+        for node in reversed(range(1, self._leaves)):
+            self._ends[node] = max(self._ends[2 * node], self._ends[2 * node + 1])
+
+    @classmethod
+    def from_model(cls, data: IpBlock | Soc) -> "AddressIndex":
+        """Index the model of an IP block or of a SoC."""
+        return cls(data.devices if isinstance(data, Soc) else [data])
+
+    @classmethod
+    def load(cls, path: Path | str) -> "AddressIndex":
+        """Index the model saved in an `rdl.json`."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        schema.validate(data)
+        return cls.from_model(from_dict(data))
+
+    def __len__(self) -> int:
+        """Return the number of regions."""
+        return len(self._starts)
+
+    def _last_reaching(self, pos: int, addr: int) -> int:
+        """Return the last position up to `pos` whose region ends after `addr`, or -1."""
+        if pos < 0:
+            return -1
+        ends = self._ends
+        node = self._leaves + pos
+        if ends[node] > addr:
+            return pos
+        # Go up until the subtree on the left of the positions checked so far reaches `addr`.
+        while node > 1:
+            if node & 1 and ends[node - 1] > addr:
+                node -= 1
+                # Then down to its last leaf reaching `addr`.
+                while node < self._leaves:
+                    node = 2 * node + 1 if ends[2 * node + 1] > addr else 2 * node
+                return node - self._leaves
+            node >>= 1
+        return -1
+
+    def lookup(self, addr: int) -> Location | None:
+        """Return the element of the register or window at `addr`, None if unmapped."""
+        pos = self._last_reaching(bisect.bisect_right(self._starts, addr) - 1, addr)
+        while pos >= 0:
+            region = self._regions[pos]
+            if region.count == 1:
+                index, offset = 0, addr - region.base
+            else:
+                index, offset = divmod(addr - region.base, region.stride)
+            if index < region.count and offset < region.size:
+                return Location(region, index, offset)
+            pos = self._last_reaching(pos - 1, addr)
+        return None
+
+    def lookup_many(self, addrs: Iterable[int]) -> list[Location | None]:
+        """Return the location of every address, each distinct address being looked up once."""
+        locations = {}
+        lookup = self.lookup
+        result = []
+        for addr in addrs:
+            if addr not in locations:
+                locations[addr] = lookup(addr)
+            result.append(locations[addr])
+        return result
+
+    def spans(self) -> Iterator[Span]:
+        """Yield the span of every region, by address."""
+        return (_span(region) for region in self._regions)
+
+    def overlaps(self) -> list[tuple[str, str]]:
+        """Return the (path, path) of the overlapping regions."""
+        return check_spans(self.spans())[0]
+
+    def gaps(self) -> list[tuple[int, int]]:
+        """Return the (start, end) of the unmapped addresses between the regions."""
+        return check_spans(self.spans())[1]
@@ -0,0 +1,195 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Content-addressed cache of the generated RTL.
+
+An entry is addressed by a hash of the input RDL, every file it includes, the templates and the
+rdl2ot version and sources. The list of included files is only known after a compilation, so it is
+recorded in a manifest keyed by the input path and options, similarly to ccache's direct mode.
+
+This module must not import systemrdl or jinja2, a cache hit should be as cheap as copying files.
+"""
+
+import filecmp
+import functools
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from rdl2ot import DEFAULT_CACHE_SIZE, TEMPLATES_DIR, __version__
+
+
+def default_cache_dir() -> Path:
+    """Return the cache location, following the XDG base directory specification."""
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "rdl2ot"
+
+
+def bytecode_cache_dir(cache_dir: Path | None = None) -> Path:
+    """Return the bytecode cache of the templates within `cache_dir`, or the default cache."""
+    return (cache_dir or default_cache_dir()) / "bytecode"
+
+
+def _hash_file(digest: "hashlib._Hash", path: Path) -> None:
+    digest.update(str(path).encode())
+    digest.update(b"\0")
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    digest.update(b"\0")
+
+
+def hash_generator(digest: "hashlib._Hash") -> None:
+    """Hash the rdl2ot version, sources and templates, raising an OSError if one is missing."""
+    digest.update(__version__.encode())
+    # The sources are hashed too, as the version isn't bumped by every change.
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        _hash_file(digest, source)
+    for template in sorted(TEMPLATES_DIR.glob("*.tpl")):
+        _hash_file(digest, template)
+
+
+@functools.cache
+def generator_key() -> str:
+    """Return the hash of rdl2ot, see `hash_generator`, or an empty string if a file is missing."""
+    digest = hashlib.sha256()
+    try:
+        hash_generator(digest)
+    except OSError:
+        return ""
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """On-disk cache of `export-rtl` outputs bounded in size with LRU eviction."""
+
+    def __init__(self, cache_dir: Path, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Create a cache at `cache_dir` holding at most `max_size` bytes of outputs."""
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.manifests_dir = self.cache_dir / "manifests"
+        self.entries_dir = self.cache_dir / "entries"
+
+    def _manifest_path(self, input_file: Path, options: dict) -> Path:
+        key = json.dumps({"input": str(input_file.resolve()), "options": options}, sort_keys=True)
+        return self.manifests_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _content_key(self, dependencies: Iterable[str], options: dict) -> str | None:
+        """Hash the dependencies, rdl2ot and the options, or None if a file is missing."""
+        digest = hashlib.sha256()
+        digest.update(json.dumps(options, sort_keys=True).encode())
+        try:
+            hash_generator(digest)
+            for dependency in sorted(dependencies):
+                _hash_file(digest, Path(dependency))
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def dependencies(self, input_file: Path, options: dict) -> list[str] | None:
+        """Return the input and included files of the last export of `input_file`, if known."""
+        try:
+            manifest = json.loads(self._manifest_path(input_file, options).read_text("utf-8"))
+        except (OSError, ValueError):
+            return None
+        return manifest["dependencies"]
+
+    def restore(self, input_file: Path, options: dict, out_dir: Path) -> list[Path] | None:
+        """Copy the cached outputs to `out_dir` and return them, or None on a cache miss.
+
+        The outputs identical to the cached ones are left untouched, keeping their mtime. An entry
+        that can't be read, for instance as a concurrent rdl2ot evicts it, is a cache miss.
+        """
+        dependencies = self.dependencies(input_file, options)
+        key = self._content_key(dependencies, options) if dependencies is not None else None
+        entry = self.entries_dir / key if key else None
+        if entry is None or not entry.is_dir():
+            return None
+
+        outputs = []
+        try:
+            for cached in sorted(entry.iterdir()):
+                path = out_dir / cached.name
+                if not (path.is_file() and filecmp.cmp(cached, path, shallow=False)):
+                    shutil.copyfile(cached, path)
+                outputs.append(path)
+            # The entry mtime tracks its last use for the eviction.
+            os.utime(entry)
+        except OSError:
+            return None
+        return outputs
+
+    def store(
+        self, input_file: Path, options: dict, dependencies: Iterable[str], outputs: list[Path]
+    ) -> None:
+        """Save the `outputs` produced from `input_file` and its included `dependencies`.
+
+        The outputs are already generated, so a cache that can't be written is only reported.
+        """
+        dependencies = sorted({str(Path(dep).resolve()) for dep in [input_file, *dependencies]})
+        key = self._content_key(dependencies, options)
+        if key is None:
+            return
+        try:
+            self._store(input_file, options, dependencies, key, outputs)
+        except OSError as error:
+            print(f"Warning: The outputs couldn't be saved in the cache {self.cache_dir}: {error}")
+
+    def _store(
+        self,
+        input_file: Path,
+        options: dict,
+        dependencies: list[str],
+        key: str,
+        outputs: list[Path],
+    ) -> None:
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._manifest_path(input_file, options)
+        manifest.write_text(json.dumps({"dependencies": dependencies}, indent=2), "utf-8")
+
+        entry = self.entries_dir / key
+        if not entry.is_dir():
+            # Populate a temporary directory first so a concurrent reader never sees a partial
+            # entry.
+            staging = Path(tempfile.mkdtemp(dir=self.entries_dir, prefix=".tmp"))
+            try:
+                for output in outputs:
+                    shutil.copyfile(output, staging / output.name)
+                staging.rename(entry)
+            except OSError:
+                shutil.rmtree(staging, ignore_errors=True)
+                # The rename fails if a concurrent rdl2ot stored the same entry first.
+                if not entry.is_dir():
+                    raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in `max_size`."""
+        if not self.entries_dir.is_dir():
+            return
+        entries = []
+        total = 0
+        for entry in self.entries_dir.iterdir():
+            if entry.name.startswith("."):
+                continue
+            # A concurrent rdl2ot may be evicting the entry, the eviction must never fail the build.
+            try:
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            entries.append((mtime, entry, size))
+            total += size
+
+        for _mtime, entry, size in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
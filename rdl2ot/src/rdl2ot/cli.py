@@ -4,14 +4,20 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-"""Cli."""
+"""Cli.
 
+Only click is imported at startup, the subcommands import the modules they need, so `--help` and
+the exports forwarded to a server or restored from the cache don't pay for systemrdl and jinja2.
+The import time is bounded by `test_startup_time`.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import click
-from systemrdl import RDLCompiler
 
-from rdl2ot import rtl_exporter
+from rdl2ot import DECODER_STYLES, DEFAULT_CACHE_SIZE
 
 
 @click.group()
@@ -19,6 +25,21 @@ def main() -> None:
     """Cli."""
 
 
+@contextmanager
+def _profile(enabled: bool, json_file: str | None, pstats_file: str | None) -> Iterator[None]:
+    """Profile the stages run in the context and print the report, if enabled."""
+    if not (enabled or json_file or pstats_file):
+        yield
+        return
+    from rdl2ot import profiling  # noqa: PLC0415
+
+    with profiling.Profiler(Path(pstats_file) if pstats_file else None) as profiler:
+        yield
+    profiler.print_report()
+    if json_file:
+        profiler.save(Path(json_file))
+
+
 @main.command()
 @click.argument(
     "input_file",
@@ -33,19 +54,319 @@ def main() -> None:
     "--soc",
     is_flag=True,
 )
-def export_rtl(input_file: str, out_dir: str, soc: bool = False) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to parse the model and render the templates.",
+)
+@click.option(
+    "--generate-loops",
+    is_flag=True,
+    help="Render the homogeneous multiregs with generate loops rather than unrolled.",
+)
+@click.option(
+    "--decoder",
+    type=click.Choice(DECODER_STYLES),
+    default="flat",
+    show_default=True,
+    help="Address decoder style, indexed decodes the registers by word or by page.",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Parse, save and render the SoC devices one at a time to bound the memory.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always regenerate the outputs, bypassing the build cache.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Location of the build cache, defaults to $XDG_CACHE_HOME/rdl2ot.",
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=0),
+    default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+    show_default=True,
+    help="Maximum size of the build cache in MiB.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Report the time and peak memory of every stage.",
+)
+@click.option(
+    "--profile-json",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Save the profiling report to this json file, implies --profile.",
+)
+@click.option(
+    "--profile-pstats",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Dump the cProfile statistics to this file, implies --profile.",
+)
+@click.option(
+    "--no-server",
+    is_flag=True,
+    help="Export in this process even if an rdl2ot server is running.",
+)
+def export_rtl(  # noqa: PLR0913
+    input_file: str,
+    out_dir: str,
+    soc: bool = False,
+    jobs: int = 1,
+    generate_loops: bool = False,
+    decoder: str = "flat",
+    stream: bool = False,
+    no_cache: bool = False,
+    cache_dir: str | None = None,
+    cache_size: int = DEFAULT_CACHE_SIZE // (1024 * 1024),
+    profile: bool = False,
+    profile_json: str | None = None,
+    profile_pstats: str | None = None,
+    no_server: bool = False,
+) -> None:
     """Export opentitan rtl.
 
     INPUT_FILE: The input RDL
     OUT_DIR: The destination dir to generate the output
     SOC: Indicates that the input RDL is a SoC top
+    JOBS: Number of processes used to parse the model and render the templates
+    GENERATE_LOOPS: Render the homogeneous multiregs with generate loops
+    DECODER: The address decoder style
+    STREAM: Parse, save and render the SoC devices one at a time
+    PROFILE: Report the time and peak memory of every stage
+    NO_SERVER: Don't forward the export to the server started by `rdl2ot serve`
+
+    """
+    if not no_server:
+        from rdl2ot import server  # noqa: PLC0415
+
+        # The paths are resolved here, the server runs in another directory.
+        paths = {"cache_dir": cache_dir, "profile_json": profile_json}
+        paths["profile_pstats"] = profile_pstats
+        request = {
+            "input_file": str(Path(input_file).resolve()),
+            "out_dir": str(Path(out_dir).resolve()),
+            "soc": soc,
+            "options": {
+                "jobs": jobs,
+                "generate_loops": generate_loops,
+                "decoder": decoder,
+                "stream": stream,
+                "no_cache": no_cache,
+                "cache_size": cache_size,
+                "profile": profile,
+                **{name: str(Path(path).resolve()) for name, path in paths.items() if path},
+            },
+        }
+        response = server.forward(server.default_socket_path(), request)
+        if response is not None:
+            print(response["output"], end="")
+            if response["returncode"]:
+                raise SystemExit(response["returncode"])
+            return
+
+    from rdl2ot import incremental  # noqa: PLC0415
+    from rdl2ot.cache import BuildCache, bytecode_cache_dir, default_cache_dir  # noqa: PLC0415
+
+    with _profile(profile, profile_json, profile_pstats):
+        # The streaming mode is left out, the outputs are identical.
+        options = {"soc": soc, "generate_loops": generate_loops, "decoder": decoder}
+        cache = None
+        if not no_cache:
+            cache = BuildCache(
+                Path(cache_dir) if cache_dir else default_cache_dir(), cache_size << 20
+            )
+            outputs = cache.restore(Path(input_file), options, Path(out_dir))
+            if outputs is not None:
+                for path in outputs:
+                    print(f"Restored {path} from cache.")
+                dependencies = cache.dependencies(Path(input_file), options)
+                incremental.write_depfile(outputs, dependencies)
+                print("Successfully finished!\n")
+                return
+
+        # Only pay for the systemrdl and jinja2 imports on a cache miss.
+        from systemrdl import RDLCompiler  # noqa: PLC0415
+
+        from rdl2ot import profiling, rtl_exporter  # noqa: PLC0415
+
+        print(f"Compiling file: {input_file}...")
+        rdlc = RDLCompiler()
+        with profiling.stage("compile"):
+            file_info = rdlc.compile_file(input_file)
+        with profiling.stage("elaborate"):
+            root = rdlc.elaborate()
 
+        # Nothing is cached without the build cache, not even the compiled templates.
+        bytecode_dir = None if no_cache else bytecode_cache_dir(cache_dir and Path(cache_dir))
+        outputs = rtl_exporter.run(
+            root.top, Path(out_dir), soc, jobs, generate_loops, decoder, stream, bytecode_dir
+        )
+        if cache is not None:
+            cache.store(Path(input_file), options, file_info.included_files, outputs)
+        dependencies = [input_file, *file_info.included_files]
+        incremental.write_depfile(outputs, dependencies)
+
+        print("Successfully finished!\n")
+
+
+@main.command()
+@click.argument(
+    "input_file",
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.argument(
+    "out_dir",
+    default="./result",
+    type=click.Path(file_okay=False, writable=True),
+)
+@click.option(
+    "--soc",
+    is_flag=True,
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to parse the model and render the templates.",
+)
+@click.option(
+    "--generate-loops",
+    is_flag=True,
+    help="Render the homogeneous multiregs with generate loops rather than unrolled.",
+)
+@click.option(
+    "--decoder",
+    type=click.Choice(DECODER_STYLES),
+    default="flat",
+    show_default=True,
+    help="Address decoder style, indexed decodes the registers by word or by page.",
+)
+@click.option(
+    "--poll",
+    is_flag=True,
+    help="Poll the files rather than using inotify.",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.01),
+    default=0.5,
+    show_default=True,
+    help="Polling interval in seconds.",
+)
+def watch(  # noqa: PLR0913
+    input_file: str,
+    out_dir: str,
+    soc: bool = False,
+    jobs: int = 1,
+    generate_loops: bool = False,
+    decoder: str = "flat",
+    poll: bool = False,
+    interval: float = 0.5,
+) -> None:
+    """Export opentitan rtl, then again whenever the input RDL or a file it includes changes.
+
+    Only the outputs of the interfaces whose model changed are rendered again.
+
+    INPUT_FILE: The input RDL
+    OUT_DIR: The destination dir to generate the output
+    """
+    from rdl2ot.watch import watch as watch_rtl  # noqa: PLC0415
+
+    watch_rtl(Path(input_file), Path(out_dir), soc, jobs, generate_loops, decoder, poll, interval)
+
+
+@main.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Unix socket to listen on, defaults to $RDL2OT_SOCKET or $XDG_RUNTIME_DIR/rdl2ot.sock.",
+)
+def serve(socket_path: str | None = None) -> None:
+    """Serve the exports requested by export-rtl, keeping systemrdl and the templates loaded.
+
+    SOCKET_PATH: The Unix socket to listen on
+    """
+    from rdl2ot import server  # noqa: PLC0415
+
+    server.serve(Path(socket_path) if socket_path else server.default_socket_path())
+
+
+@main.command()
+@click.argument(
+    "json_file",
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.argument(
+    "out_dir",
+    default="./result",
+    type=click.Path(writable=True),
+)
+@click.option(
+    "--device",
+    "devices",
+    multiple=True,
+    help="Only render this SoC device, can be repeated.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to render the templates.",
+)
+@click.option(
+    "--generate-loops",
+    is_flag=True,
+    help="Render the homogeneous multiregs with generate loops rather than unrolled.",
+)
+@click.option(
+    "--decoder",
+    type=click.Choice(DECODER_STYLES),
+    help="Address decoder style overriding the one saved in the model.",
+)
+def render_json(  # noqa: PLR0913
+    json_file: str,
+    out_dir: str,
+    devices: tuple[str, ...],
+    jobs: int = 1,
+    generate_loops: bool = False,
+    decoder: str | None = None,
+) -> None:
+    """Render opentitan rtl from a rdl.json saved by export-rtl, without compiling the RDL.
+
+    JSON_FILE: The rdl.json generated by export-rtl
+    OUT_DIR: The destination dir to generate the output
     """
-    print(f"Compiling file: {input_file}...")
-    rdlc = RDLCompiler()
-    rdlc.compile_file(input_file)
-    root = rdlc.elaborate()
+    from rdl2ot import renderer, schema  # noqa: PLC0415
+    from rdl2ot.cache import bytecode_cache_dir  # noqa: PLC0415
 
-    rtl_exporter.run(root.top, Path(out_dir), soc)
+    try:
+        renderer.render_json(
+            Path(json_file),
+            Path(out_dir),
+            jobs,
+            devices or None,
+            generate_loops,
+            decoder,
+            bytecode_cache_dir(),
+        )
+    except schema.SchemaError as error:
+        msg = f"Invalid {json_file}: {error}"
+        raise click.ClickException(msg) from error
+    except renderer.UnknownDeviceError as error:
+        raise click.ClickException(str(error)) from error
 
     print("Successfully finished!\n")
@@ -0,0 +1,91 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Jinja environment shared by every render of a process.
+
+Templates are loaded, in order of preference, from the modules precompiled when building the wheel,
+from the bytecode cache or from the template sources.
+
+This module must only depend on jinja2, as it is also used by the wheel build hook.
+"""
+
+import functools
+import hashlib
+import sys
+from pathlib import Path
+
+import jinja2
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+)
+
+from rdl2ot import TEMPLATES_DIR
+
+COMPILED_TEMPLATES_DIR = Path(__file__).parent / "compiled_templates"
+CHECKSUM_FILE = "checksum"
+
+
+def _camelcase(value: str) -> str:
+    words = value.split("_")
+    return "".join(word.capitalize() for word in words)
+
+
+def templates_checksum() -> str:
+    """Hash the template sources, jinja2 and python versions, to detect stale precompiled templates.
+
+    The precompiled modules depend on the runtime of the jinja2 and python that generated them.
+    """
+    digest = hashlib.sha256()
+    digest.update(jinja2.__version__.encode())
+    digest.update(sys.version.encode())
+    for template in sorted(TEMPLATES_DIR.glob("*.tpl")):
+        digest.update(template.name.encode())
+        digest.update(template.read_bytes())
+    return digest.hexdigest()
+
+
+def create_environment(
+    compiled_dir: Path | None = None, bytecode_cache_dir: Path | None = None
+) -> Environment:
+    """Create an environment preferring the precompiled templates of `compiled_dir` if current.
+
+    BYTECODE_CACHE_DIR: Directory where the compiled templates are cached between runs.
+    """
+    loader: BaseLoader = FileSystemLoader(TEMPLATES_DIR)
+    checksum = compiled_dir / CHECKSUM_FILE if compiled_dir else None
+    if checksum and checksum.is_file() and checksum.read_text() == templates_checksum():
+        loader = ChoiceLoader([ModuleLoader(compiled_dir), loader])
+
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        try:
+            bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+        except OSError:
+            print(f"Warning: Can't create {bytecode_cache_dir}, disabling the bytecode cache.")
+
+    env = Environment(loader=loader, bytecode_cache=bytecode_cache)
+    env.filters["camelcase"] = _camelcase
+    return env
+
+
+@functools.cache
+def get_environment(bytecode_cache_dir: Path | None = None) -> Environment:
+    """Return the environment of this process, created on the first call.
+
+    BYTECODE_CACHE_DIR: Directory where the compiled templates are cached, not cached if None.
+    """
+    return create_environment(COMPILED_TEMPLATES_DIR, bytecode_cache_dir)
+
+
+def compile_templates(target: Path) -> None:
+    """Precompile the templates into python modules that can be loaded by `create_environment`."""
+    env = create_environment()
+    env.compile_templates(target, zip=None, ignore_errors=False)
+    (target / CHECKSUM_FILE).write_text(templates_checksum())
@@ -0,0 +1,133 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Incremental regeneration of the outputs.
+
+Every output is keyed by a hash of the model it is rendered from, the template and rdl2ot itself.
+The keys are recorded in a manifest next to `rdl.json` with a hash of every output, and the outputs
+whose key is unchanged are not rendered again, unless they were edited since. The outputs are also
+only written if their content changes, so their mtime only moves when the downstream build has to
+run again. The manifest and the depfile are named after the top, so that several tops can be
+exported to the same directory.
+"""
+
+import filecmp
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TextIO
+
+from rdl2ot.cache import generator_key
+
+MANIFEST_SUFFIX = "_manifest.json"
+DEPFILE_SUFFIX = ".d"
+
+
+def _hash_output(path: Path) -> str | None:
+    """Return the hash of an output, or None if it is missing."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+@contextmanager
+def write_if_changed(path: Path) -> Iterator[TextIO]:
+    """Write a file through a temporary one, which only replaces it if their contents differ.
+
+    The temporary file is named after the process and thread writing it, so that concurrent
+    writers never mix their outputs. Unlike a `tempfile`, it is created with the default mode.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            yield f
+        if path.is_file() and filecmp.cmp(tmp, path, shallow=False):
+            tmp.unlink()
+        else:
+            tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+class Manifest:
+    """The keys of the outputs of a directory."""
+
+    def __init__(self, out_dir: Path, top: str) -> None:
+        """Load the manifest of `top` in `out_dir`, empty if missing or made by another rdl2ot."""
+        self.path = Path(out_dir) / f"{top.lower()}{MANIFEST_SUFFIX}"
+        self.keys = {}
+        self.previous = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        # Without a key for rdl2ot, the outputs are never considered up to date.
+        if generator_key() and data.get("generator") == generator_key():
+            self.previous = data["outputs"]
+
+    def key(self, template_name: str, data: dict) -> str:
+        """Return the key of the output of `template_name` rendered with the variables `data`."""
+        # Imported here, a cache hit only writes the depfile and shouldn't build the model classes.
+        from rdl2ot import model  # noqa: PLC0415
+
+        variables = {name: model.to_dict(value) for name, value in data.items()}
+        digest = hashlib.sha256(template_name.encode())
+        digest.update(json.dumps(variables).encode())
+        return digest.hexdigest()
+
+    def is_fresh(self, path: Path, key: str) -> bool:
+        """Record the key of an output, and return whether the output is up to date.
+
+        An output edited or truncated since it was rendered isn't up to date.
+        """
+        self.keys[path.name] = key
+        previous = self.previous.get(path.name)
+        if previous is None or previous["key"] != key:
+            return False
+        digest = _hash_output(path)
+        return digest is not None and digest == previous["hash"]
+
+    def save(self) -> Path:
+        """Save the keys recorded with the hashes of the outputs, and return the manifest path."""
+        outputs = {
+            name: {"key": key, "hash": _hash_output(self.path.parent / name)}
+            for name, key in self.keys.items()
+        }
+        with write_if_changed(self.path) as f:
+            json.dump({"generator": generator_key(), "outputs": outputs}, f, indent=2)
+        return self.path
+
+
+def _escape(path: object) -> str:
+    """Escape the characters of a path that are special in a Make rule."""
+    text = str(path).replace("$", "$$")
+    for char in " #:":
+        text = text.replace(char, f"\\{char}")
+    return text
+
+
+def depfile_path(outputs: Iterable[Path]) -> Path:
+    """Return the depfile of an export, named after the top like the manifest among `outputs`."""
+    manifest = next(path for path in outputs if path.name.endswith(MANIFEST_SUFFIX))
+    return manifest.with_name(manifest.name.removesuffix(MANIFEST_SUFFIX) + DEPFILE_SUFFIX)
+
+
+def write_depfile(outputs: list[Path], inputs: Iterable[str | Path]) -> Path:
+    """Write a Make and Ninja depfile listing the RDL `inputs` of every output, and return it.
+
+    The inputs are resolved, so that the depfile doesn't depend on how the files were found.
+    """
+    path = depfile_path(outputs)
+    # Everything is sorted, the order of the included files varies between compilations and the
+    # outputs restored from the cache are listed by name.
+    inputs = {str(Path(dep).resolve()) for dep in inputs}
+    dependencies = " ".join(_escape(dep) for dep in sorted(inputs))
+    with write_if_changed(path) as f:
+        f.writelines(f"{_escape(output)}: {dependencies}\n" for output in sorted(outputs))
+    return path
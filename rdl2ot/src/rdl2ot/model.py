@@ -0,0 +1,303 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Intermediate model consumed by the templates.
+
+The classes are slotted, a design can hold hundreds of thousands of fields and a dict per field
+dominates the memory. `to_dict` and `from_dict` convert the model to and from the `rdl.json`
+representation described in `rdl2ot/schema.py`.
+
+The address offsets of the elements of an array are ranges, so the size of the model doesn't grow
+with the number of elements. They are serialized as `{"base", "stride", "count"}` objects.
+
+Attributes with an `optional` metadata are left out of the json when equal to their default,
+`key` is the json name of attributes named after a python keyword.
+"""
+
+import dataclasses
+
+OPTIONAL = {"optional": True}
+# The number of address bits decoded by the second level of the paged decoder.
+DECODER_PAGE_BITS = 8
+# The width of the TL-UL data bus in bytes, the registers of a "dense" interface being a word apart.
+BUS_BYTES = 4
+
+_model = dataclasses.dataclass(slots=True, kw_only=True)
+
+
+@_model
+class Field:
+    """A field of a register."""
+
+    name: str
+    type: str = dataclasses.field(default="field", init=False)
+    desc: str
+    parent_name: str
+    lsb: int
+    msb: int
+    width: int
+    bitmask: int
+    reset: int | None = dataclasses.field(default=None, metadata=OPTIONAL)
+    hw_readable: bool
+    hw_writable: bool
+    sw_readable: bool
+    sw_writable: bool
+    sw_write_en: bool
+    # The field gating the writes of this field.
+    write_en_signal: "Field | None" = None
+    hw_write_en: bool
+    swmod: bool
+    clear_onread: bool
+    set_onread: bool
+    encode: str = dataclasses.field(default="", metadata=OPTIONAL)
+    async_: object = dataclasses.field(default=None, metadata={"key": "async"})
+    sync: object = None
+    reggen_sw_access: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Field":
+        """Build a field from its json representation."""
+        signal = data["write_en_signal"]
+        return cls(**_kwargs(cls, data, write_en_signal=signal and cls.from_dict(signal)))
+
+
+@_model
+class Register:
+    """A register, or an array of registers."""
+
+    name: str
+    type: str = dataclasses.field(default="reg", init=False)
+    width: int
+    hw_readable: bool
+    hw_writable: bool
+    sw_readable: bool
+    sw_writable: bool
+    swmod: bool | None
+    async_clk: object
+    external: bool
+    shadowed: object
+    hwre: object
+    offsets: range
+    is_multireg: bool = dataclasses.field(default=False, metadata=OPTIONAL)
+    fields: list[Field]
+    msb: int
+    # The remaining attributes are derived from the fields.
+    permit: int = 0
+    sw_write_en: bool = False
+    bitmask: int = 0
+    reset: int = 0
+    async_: bool = dataclasses.field(default=False, metadata={"key": "async"})
+    needs_write_en: bool = False
+    needs_read_en: bool = False
+    needs_qe: bool = False
+    needs_int_qe: bool = False
+    fields_no_write_en: int = 0
+    is_multifields: bool = False
+    is_homogeneous: bool = False
+
+    @property
+    def fits_generate_loop(self) -> bool:
+        """Whether the elements of the array can be rendered by a generate loop.
+
+        Only the homogeneous single field arrays, with a synchronous and not shadowed storage, are.
+        """
+        return (
+            self.is_multireg
+            and len(self.offsets) > 1
+            and self.is_homogeneous
+            and not self.is_multifields
+            and not self.async_clk
+            and not self.shadowed
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Register":
+        """Build a register from its json representation."""
+        fields = [Field.from_dict(field) for field in data["fields"]]
+        return cls(**_kwargs(cls, data, offsets=_range(data["offsets"]), fields=fields))
+
+
+@_model
+class Window:
+    """A memory window."""
+
+    name: str
+    entries: int
+    sw_writable: bool
+    sw_readable: bool
+    width: int
+    offset: int
+    size: int
+    integrity_bypass: object
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Window":
+        """Build a window from its json representation."""
+        return cls(**_kwargs(cls, data))
+
+
+@_model
+class Interface:
+    """A bus interface of an IP block, rendered to its own reg_top."""
+
+    name: str = dataclasses.field(default="", metadata=OPTIONAL)
+    # The address of the interface in its IP block.
+    offset: int = dataclasses.field(default=0, metadata=OPTIONAL)
+    regs: list[Register]
+    windows: list[Window]
+    addr_width: int
+    num_regs: int
+    num_windows: int
+    # The (index, register) with an async clock.
+    async_registers: list[tuple[int, str]]
+    needs_aw: bool
+    any_async_clk: bool
+    all_async_clk: bool
+    any_shadowed_reg: bool
+    any_integrity_bypass: bool
+    alerts: list[str]
+    # The address decoder style: "flat", "dense" or "paged", see `OtInterfaceBuilder`.
+    decoder: str = dataclasses.field(default="flat", metadata=OPTIONAL)
+
+    @property
+    def decoder_pages(self) -> list[tuple[int, list[tuple[int, int]]]]:
+        """Group the (addr_hit index, offset in the page) of the registers by address page."""
+        pages = {}
+        offsets = (offset for reg in self.regs for offset in reg.offsets)
+        for index, offset in enumerate(offsets):
+            page = pages.setdefault(offset >> DECODER_PAGE_BITS, [])
+            page.append((index, offset & ((1 << DECODER_PAGE_BITS) - 1)))
+        return sorted(pages.items())
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Interface":
+        """Build an interface from its json representation."""
+        return cls(
+            **_kwargs(
+                cls,
+                data,
+                regs=[Register.from_dict(reg) for reg in data["regs"]],
+                windows=[Window.from_dict(window) for window in data["windows"]],
+                async_registers=[tuple(item) for item in data["async_registers"]],
+            )
+        )
+
+
+@_model
+class Parameter:
+    """A localparam of an IP block."""
+
+    name: str
+    type: str
+    value: object
+
+
+@_model
+class Instance:
+    """An instance of an IP block in a SoC."""
+
+    name: str
+    offsets: range
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Instance":
+        """Build an instance from its json representation."""
+        return cls(name=data["name"], offsets=_range(data["offsets"]))
+
+
+@_model
+class IpBlock:
+    """An IP block, rendered to a reg_pkg and a reg_top per interface."""
+
+    parameters: list[Parameter] = dataclasses.field(default_factory=list, metadata=OPTIONAL)
+    ip_name: str
+    # The offsets of every instance of the IP block.
+    offsets: list[range]
+    interfaces: list[Interface]
+    alerts: list[str]
+    instances: list[Instance] = dataclasses.field(default_factory=list, metadata=OPTIONAL)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IpBlock":
+        """Build an IP block from its json representation."""
+        return cls(
+            **_kwargs(
+                cls,
+                data,
+                parameters=[Parameter(**param) for param in data.get("parameters", [])],
+                offsets=[_range(offsets) for offsets in data["offsets"]],
+                instances=[Instance.from_dict(instance) for instance in data.get("instances", [])],
+                interfaces=[Interface.from_dict(interface) for interface in data["interfaces"]],
+            )
+        )
+
+
+@_model
+class Soc:
+    """A SoC made of IP blocks."""
+
+    devices: list[IpBlock]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Soc":
+        """Build a SoC from its json representation."""
+        return cls(devices=[IpBlock.from_dict(device) for device in data["devices"]])
+
+
+def select_decoder(style: str, regs: list[Register], addr_width: int) -> str:
+    """Return the address decoder of an interface made of `regs`, for a `DECODER_STYLES` style."""
+    offsets = [offset for reg in regs for offset in reg.offsets]
+    if style == "flat" or len(offsets) < 2:  # noqa: PLR2004
+        return "flat"
+    if offsets == list(range(offsets[0], offsets[0] + len(offsets) * BUS_BYTES, BUS_BYTES)):
+        return "dense"
+    return "paged" if addr_width > DECODER_PAGE_BITS else "flat"
+
+
+def _key(attribute: dataclasses.Field) -> str:
+    return attribute.metadata.get("key", attribute.name)
+
+
+def _default(attribute: dataclasses.Field) -> object:
+    if attribute.default_factory is not dataclasses.MISSING:
+        return attribute.default_factory()
+    return attribute.default
+
+
+def _range(data: dict) -> range:
+    start = data["base"]
+    return range(start, start + data["count"] * data["stride"], data["stride"])
+
+
+def _kwargs(cls: type, data: dict, **nested: object) -> dict:
+    """Map the json keys of `data` to the init arguments of `cls`, `nested` taking precedence."""
+    kwargs = {
+        attribute.name: data[_key(attribute)]
+        for attribute in dataclasses.fields(cls)
+        if attribute.init and _key(attribute) in data
+    }
+    kwargs.update(nested)
+    return kwargs
+
+
+def to_dict(value: object) -> object:
+    """Convert the model to its json representation, keeping the order of the attributes."""
+    if isinstance(value, range):
+        return {"base": value.start, "stride": value.step, "count": len(value)}
+    if isinstance(value, list | tuple):
+        return [to_dict(item) for item in value]
+    if not dataclasses.is_dataclass(value):
+        return value
+    obj = {}
+    for attribute in dataclasses.fields(value):
+        item = getattr(value, attribute.name)
+        if attribute.metadata.get("optional") and item == _default(attribute):
+            continue
+        obj[_key(attribute)] = to_dict(item)
+    return obj
+
+
+def from_dict(data: dict) -> IpBlock | Soc:
+    """Build the model of an IP block or of a SoC from its json representation."""
+    return Soc.from_dict(data) if "devices" in data else IpBlock.from_dict(data)
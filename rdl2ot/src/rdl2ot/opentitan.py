@@ -4,15 +4,18 @@
 
 """Functions with opentitan specific logic."""
 
+import dataclasses
 import re
 
 from systemrdl import node
 from systemrdl.rdltypes import AccessType, OnReadType, OnWriteType
 
+from rdl2ot.model import Field, Register
 
-def register_permit_mask(reg: dict) -> int:
+
+def register_permit_mask(reg: Register) -> int:
     """One bit presents one byte in the register, so in total 4 bits are used."""
-    w = reg["msb"] + 1
+    w = reg.msb + 1
     if w > 24:  # noqa: PLR2004
         return 0b1111
     if w > 16:  # noqa: PLR2004
@@ -22,7 +25,7 @@ def register_permit_mask(reg: dict) -> int:
     return 0b0001
 
 
-def needs_read_en(reg: dict) -> bool:
+def needs_read_en(reg: Register) -> bool:
     """Return true if at least one field needs a read-enable.
 
     This is true if any of the following are true:
@@ -40,34 +43,33 @@ def needs_read_en(reg: dict) -> bool:
       - The register is hwext and allows reads (in which case the hardware
         side might need the re signal)
     """
-    return reg["shadowed"] or any(
-        (field["clear_onread"] or (reg["external"] and field["sw_readable"]))
-        for field in reg["fields"]
+    return reg.shadowed or any(
+        (field.clear_onread or (reg.external and field.sw_readable)) for field in reg.fields
     )
 
 
-def needs_write_en(reg: dict) -> bool:
+def needs_write_en(reg: Register) -> bool:
     """Return register for this field should have a write-enable signal.
 
     This is almost the same as allows_write(), but doesn't return true for
     RC registers, which should use a read-enable signal (connected to their
     prim_subreg's we port).
     """
-    return any((not field["clear_onread"] and field["sw_writable"]) for field in reg["fields"])
+    return any((not field.clear_onread and field.sw_writable) for field in reg.fields)
 
 
-def needs_qe(reg: dict) -> bool:
+def needs_qe(reg: Register) -> bool:
     """Return true if the register or at least one field needs a q-enable."""
-    return any(field["swmod"] for field in reg["fields"])
+    return any(field.swmod for field in reg.fields)
 
 
-def needs_int_qe(reg: dict) -> bool:
+def needs_int_qe(reg: Register) -> bool:
     """Return true if the register or at least one field needs an internal q-enable.
 
     An internal q-enable means the net may be consumed by other reg logic but will
     not be exposed in the package file.
     """
-    return (bool(reg["async_clk"]) and reg["hw_writable"]) or needs_qe(reg)
+    return (bool(reg.async_clk) and reg.hw_writable) or needs_qe(reg)
 
 
 def get_bit_width(offset: int) -> int:
@@ -98,32 +100,33 @@ def get_sw_access_enum(field: node.FieldNode) -> str:
     return "NONE"
 
 
-def fields_no_write_en(reg: dict) -> int:
+def fields_no_write_en(reg: Register) -> int:
     """Count how many fields has write enable."""
     res = 0
-    for idx, field in enumerate(reg["fields"]):
+    for idx, field in enumerate(reg.fields):
         res |= (not needs_we(field)) << idx
     return res
 
 
-def needs_we(field: dict) -> bool:
+def needs_we(field: Field) -> bool:
     """True if the register for this field should have a write-enable signal.
 
     This is almost the same as allows_write(), but doesn't return true for
     RC registers, which should use a read-enable signal (connected to their
     prim_subreg's we port).
     """
-    return field["reggen_sw_access"] != "RC" and field["sw_writable"]
+    return field.reggen_sw_access != "RC" and field.sw_writable
 
 
-def is_homogeneous(reg: dict) -> bool:
+def is_homogeneous(reg: Register) -> bool:
     """Return true if all fields of a register are equal.
 
     The offset are excluded from the comparison.
     """
     exclude = ["name", "msb", "lsb", "bitmask", "type"]
     unamed_fields = [
-        {key: value for key, value in f.items() if key not in exclude} for f in reg["fields"]
+        [getattr(f, attr.name) for attr in dataclasses.fields(f) if attr.name not in exclude]
+        for f in reg.fields
     ]
-    names = {re.sub(r"_\d+$", "", f["name"]) for f in reg["fields"]}
+    names = {re.sub(r"_\d+$", "", f.name) for f in reg.fields}
     return all(f == unamed_fields[0] for f in unamed_fields[1:]) and len(names) == 1
@@ -0,0 +1,374 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Render plan of the reg_top template.
+
+The reg_top template iterates the elements of every register several times, and used to derive the
+same signal names with jinja filters on every pass, which dominated the rendering time. The plan
+computes those names, bit slices, reset literals and indices once per register element, or once per
+register rendered by a generate loop, so the template only interpolates them.
+"""
+
+import dataclasses
+
+from rdl2ot.model import Field, Interface, Register
+
+CLK_PREFIX = "aon_"  # The prefix of the signals of the asynchronous clock domain.
+
+_plan = dataclasses.dataclass(slots=True, kw_only=True)
+
+
+@_plan
+class FieldPlan:
+    """The signals of a field of a register element."""
+
+    field: Field
+    name: str  # The name of the field signals, `<reg>[_<idx>][_<field>[_<idx>]]`.
+    width: str  # The packed dimension of the field signals, if wider than a bit.
+    resval: str
+    comment: str
+    # The write data of the write-enable logic and the read data of the read mux.
+    wd: str
+    rdata: str
+    # The ports of the subreg instance.
+    re_port: str
+    we_port: str
+    wd_port: str
+    de_port: str
+    d_port: str
+    qre_port: str
+    qe_port: str
+    q_port: str
+    ds_port: str
+    qs_port: str
+    sig_name: str  # The path of the field in the reg2hw and hw2reg structs.
+    err_update: str
+    err_storage: str
+    # The signals of the clock domain crossing of an asynchronous register.
+    cdc_name: str
+    cdc_width: str
+    cdc_index: str
+
+
+@_plan
+class ElementPlan:
+    """The signals of an element of a register, or of a register if it isn't an array."""
+
+    index: int  # The index of the element in the interface.
+    padded_index: str
+    name: str  # `<reg>[_<idx>]`.
+    clk_name: str  # `name` in the clock domain of the register.
+    clk_prefix: str
+    offset_name: str
+    we_check: str
+    rdata_async: str
+    flds_we_decl: str
+    qe_expr: str
+    flop_name: str
+    flop_d: str
+    regwen_expr: str
+    # The clock domain crossing of an asynchronous register.
+    cdc_name: str
+    src_we: str
+    src_wd: str
+    src_re: str
+    src_regwen: str
+    dst_we: str
+    dst_wd: str
+    dst_re: str
+    dst_qe: str
+    dst_wr_req: str
+    dst_ds: str
+    dst_regwen: str
+    reset: str
+    bitmask: str
+    fields: tuple[FieldPlan, ...]
+
+
+@_plan
+class LoopPlan:
+    """The signals of a register array rendered by a generate loop, indexed by the genvar `i`."""
+
+    size: int
+    array: str  # The unpacked dimension of the array signals.
+    width: str  # The packed dimension of the field signals, if wider than a bit.
+    offset_name: str
+    stride_name: str
+    flds_we_decl: str
+    unused_flds_we: str
+    qe_expr: str
+    flop_d: str
+    regwen_expr: str
+    resval: str
+    wd: str
+    we_check: str
+    rdata: str
+    # The ports of the subreg instance.
+    re_port: str
+    we_port: str
+    wd_port: str
+    de_port: str
+    d_port: str
+    qre_port: str
+    qe_port: str
+    q_port: str
+    qs_port: str
+
+
+@_plan
+class RegisterPlan:
+    """A register and the plan of its elements."""
+
+    reg: Register
+    name: str
+    index: int  # The index of the first element in the interface.
+    # The plan of the generate loop rendering the elements, None if they are unrolled.
+    loop: LoopPlan | None
+    subreg: str
+    unused_flds_we: str
+    elements: tuple[ElementPlan, ...]
+
+
+@_plan
+class InterfacePlan:
+    """The plan of every register of an interface."""
+
+    regs: list[RegisterPlan]
+    permit: str
+    reg_idx_width: int
+
+
+def _hex(width: int, value: int) -> str:
+    return f"{width}'h{value:x}"
+
+
+def _bits(field: Field) -> str:
+    return f"{field.msb}:{field.lsb}" if field.width > 1 else str(field.msb)
+
+
+def _regwen_expr(reg: Register, name: str) -> str:
+    """Return the expression enabling the software writes of a register element."""
+    signal = reg.fields[0].write_en_signal
+    if signal and "MultiBitBool" in signal.encode:
+        width = signal.width
+        return (
+            f"prim_mubi_pkg::mubi{width}_test_true_strict("
+            f"prim_mubi_pkg::mubi{width}_t'({signal.name}_qs))"
+        ).lower()
+    if reg.async_clk:
+        return f"{CLK_PREFIX}{name}_regwen"
+    return _regwen_qs(reg)
+
+
+def _regwen_qs(reg: Register) -> str:
+    # Only the write enable of the first field is considered, the name is empty if it has none.
+    signal = reg.fields[0].write_en_signal
+    return f"{signal.parent_name.lower() if signal else ''}_qs"
+
+
+def _plan_field(  # noqa: PLR0913
+    reg: Register,
+    field: Field,
+    position: int,
+    element: int,
+    suffix: str,
+    rdata_suffix: str,
+) -> FieldPlan:
+    """Plan a field of the `element` of a register, `position` being its index in the register."""
+    reg_name = reg.name.lower()
+    name = reg_name + suffix
+    field_suffix = f"_{field.name}{suffix}".lower() if reg.is_multifields else ""
+    clk_prefix = CLK_PREFIX if reg.async_clk else ""
+    bits = _bits(field)
+    bit_index = f"[{bits}]"
+
+    struct_index = position if reg.is_homogeneous and reg.is_multifields else element
+    sig_name = reg.name + (f"[{struct_index}]" if reg.is_multireg else "")
+    if reg.is_multifields and not reg.is_homogeneous:
+        sig_name += f".{field.name}"
+    sig_name = sig_name.lower()
+
+    rdata_field = f"_{field.name.lower()}{rdata_suffix}" if reg.is_multifields else ""
+    rdata = f"{reg.name}{rdata_suffix}{rdata_field}_qs" if field.sw_readable else "'0"
+    write = "re" if field.clear_onread else "we"
+    gated = "_gated" if field.sw_write_en else ""
+    int_suffix = "_int" if reg.async_clk else ""
+    if reg.async_clk:
+        wd_port = f"{clk_prefix}{name}_wdata{bit_index}"
+        err_name = f"async_{name}{field_suffix}_err"
+        err_update, err_storage = f"{err_name}_update", f"{err_name}_storage"
+    else:
+        wd_port = f"{name}{field_suffix}_wd"
+        err_update, err_storage = (
+            f"{name}{field_suffix}_update_err",
+            f"{name}{field_suffix}_storage_err",
+        )
+
+    return FieldPlan(
+        field=field,
+        name=name + field_suffix,
+        width=f"[{field.width - 1}:0] " if field.width > 1 else "",
+        resval=_hex(field.width, field.reset or 0),
+        comment=f"[{field.name}{suffix}]: {field.msb}:{field.lsb}".lower(),
+        wd="'1" if field.clear_onread else f"reg_wdata[{bits}]",
+        rdata=f"[{bits}] = {rdata}".lower(),
+        re_port=(
+            f"{clk_prefix}{reg.name}{suffix}_re".lower()
+            if field.sw_readable or reg.shadowed
+            else "1'b0"
+        ),
+        we_port=f"{clk_prefix}{name}{gated}_{write}" if field.sw_writable else "1'b0",
+        wd_port=wd_port if field.sw_writable else "'0",
+        de_port=f"hw2reg.{sig_name}.de" if field.hw_writable else "1'b0",
+        d_port=f"hw2reg.{sig_name}.d" if field.hw_writable else "'0",
+        qre_port=f"reg2hw.{sig_name}.re" if reg.hwre or reg.shadowed else "",
+        qe_port=f"{name}_flds_we[{position}]" if reg.needs_int_qe else "",
+        q_port=f"reg2hw.{sig_name}.q" if field.hw_readable else "",
+        ds_port=(
+            f"{clk_prefix}{name}{field_suffix}_ds{int_suffix}"
+            if reg.async_clk and reg.hw_writable
+            else ""
+        ),
+        qs_port=f"{clk_prefix}{name}{field_suffix}_qs{int_suffix}" if field.sw_readable else "",
+        sig_name=sig_name,
+        err_update=err_update,
+        err_storage=err_storage,
+        cdc_name=f"{CLK_PREFIX}{name}{field_suffix}",
+        cdc_width=f"[{field.width - 1}:0] " if field.msb != field.lsb else "",
+        cdc_index=bit_index if reg.is_multifields else "",
+    )
+
+
+def _plan_element(
+    ip_name: str, reg: Register, element: int, index: int, index_width: int
+) -> ElementPlan:
+    """Plan the `element` of a register, `index` being its index in the interface."""
+    is_array = len(reg.offsets) > 1
+    suffix = f"_{element}" if is_array else ""
+    rdata_suffix = suffix if not (reg.is_homogeneous and reg.is_multifields) else ""
+    name = reg.name.lower() + suffix
+    clk_prefix = CLK_PREFIX if reg.async_clk else ""
+    cdc_name = CLK_PREFIX + name
+    num_fields = len(reg.fields)
+    mask = _hex(num_fields, reg.fields_no_write_en) if reg.fields_no_write_en > 0 else ""
+    flds_we = f"{name}_flds_we"
+    gated = "_gated" if not reg.async_clk and reg.sw_write_en else ""
+
+    return ElementPlan(
+        index=index,
+        padded_index=f"{index:>{index_width}}",
+        name=name,
+        clk_name=clk_prefix + name,
+        clk_prefix=clk_prefix,
+        offset_name=f"{ip_name}_{reg.name}{suffix}_OFFSET".upper(),
+        we_check=f"{name}{gated}_we" if reg.needs_write_en else "1'b0",
+        rdata_async=f"DW'({reg.name.lower()}{rdata_suffix}_qs)",
+        flds_we_decl=f"[{num_fields - 1}:0] {name}",
+        qe_expr=f"&({flds_we} | {mask})" if mask else f"&{flds_we}",
+        flop_name=f"u_{reg.name.lower()}{element}_qe",
+        flop_d=f"&({flds_we} {'| ' + mask if mask else ''})",
+        regwen_expr=_regwen_expr(reg, name) if reg.sw_write_en else "",
+        cdc_name=cdc_name,
+        src_we=f"{name}_we" if reg.needs_write_en else "'0",
+        src_wd=f"reg_wdata[{reg.msb}:0]" if reg.needs_write_en else "'0",
+        src_re=f"{name}_re" if reg.needs_read_en else "'0",
+        src_regwen=_regwen_qs(reg) if reg.sw_write_en else "'0",
+        dst_we=f"{cdc_name}_we" if reg.needs_write_en else "",
+        dst_wd=f"{cdc_name}_wdata" if reg.needs_write_en else "",
+        dst_re=f"{cdc_name}_re" if reg.needs_read_en else "",
+        dst_qe=f"{cdc_name}_qe" if reg.hw_writable else "'0",
+        dst_wr_req="1" if reg.hw_writable else "0",
+        dst_ds=f"{cdc_name}_ds" if reg.hw_writable else "'0",
+        dst_regwen=f"{cdc_name}_regwen" if reg.sw_write_en else "",
+        reset=_hex(reg.msb + 1, reg.reset),
+        bitmask=_hex(reg.msb + 1, reg.bitmask),
+        fields=tuple(
+            _plan_field(reg, field, position, element, suffix, rdata_suffix)
+            for position, field in enumerate(reg.fields)
+        ),
+    )
+
+
+def _plan_loop(ip_name: str, reg: Register) -> LoopPlan:
+    """Plan a register array rendered by a generate loop, which has a single field."""
+    name = reg.name.lower()
+    field = reg.fields[0]
+    num_fields = len(reg.fields)
+    mask = _hex(num_fields, reg.fields_no_write_en) if reg.fields_no_write_en > 0 else ""
+    flds_we = f"{name}_flds_we[i]"
+    gated = "_gated" if field.sw_write_en else ""
+    write = "re" if field.clear_onread else "we"
+    offset_name = f"{ip_name}_{reg.name}".upper()
+    rdata = f"{name}_qs[i]" if field.sw_readable else "'0"
+
+    return LoopPlan(
+        size=len(reg.offsets),
+        array=f" [{len(reg.offsets)}]",
+        width=f"[{field.width - 1}:0] " if field.width > 1 else "",
+        offset_name=f"{offset_name}_OFFSET",
+        stride_name=f"{offset_name}_STRIDE",
+        flds_we_decl=f"[{num_fields - 1}:0] {name}",
+        unused_flds_we=f"^({flds_we} & {_hex(num_fields, reg.fields_no_write_en)})",
+        qe_expr=f"&({flds_we} | {mask})" if mask else f"&{flds_we}",
+        flop_d=f"&({flds_we} {'| ' + mask if mask else ''})",
+        regwen_expr=_regwen_expr(reg, name) if reg.sw_write_en else "",
+        resval=_hex(field.width, field.reset or 0),
+        wd="'1" if field.clear_onread else f"reg_wdata[{_bits(field)}]",
+        we_check=(
+            f"{name}{'_gated' if reg.sw_write_en else ''}_we[i]" if reg.needs_write_en else "1'b0"
+        ),
+        rdata=f"[{_bits(field)}] = {rdata}".lower(),
+        re_port=f"{name}_re[i]" if field.sw_readable else "1'b0",
+        we_port=f"{name}{gated}_{write}[i]" if field.sw_writable else "1'b0",
+        wd_port=f"{name}_wd[i]" if field.sw_writable else "'0",
+        de_port=f"hw2reg.{name}[i].de" if field.hw_writable else "1'b0",
+        d_port=f"hw2reg.{name}[i].d" if field.hw_writable else "'0",
+        qre_port=f"reg2hw.{name}[i].re" if reg.hwre else "",
+        qe_port=f"{flds_we}[0]" if reg.needs_int_qe else "",
+        q_port=f"reg2hw.{name}[i].q" if field.hw_readable else "",
+        qs_port=f"{name}_qs[i]" if field.sw_readable else "",
+    )
+
+
+def plan_interface(
+    ip_name: str, interface: Interface, generate_loops: bool = False
+) -> InterfacePlan:
+    """Plan the registers of an interface of the ip block `ip_name`."""
+    index_width = len(str(interface.num_regs))
+    regs = []
+    index = 0
+    for reg in interface.regs:
+        loop = _plan_loop(ip_name, reg) if generate_loops and reg.fits_generate_loop else None
+        # The elements of a generate loop aren't unrolled.
+        elements = (
+            ()
+            if loop
+            else tuple(
+                _plan_element(ip_name, reg, element, index + element, index_width)
+                for element in range(len(reg.offsets))
+            )
+        )
+        num_fields = len(reg.fields)
+        regs.append(
+            RegisterPlan(
+                reg=reg,
+                name=reg.name.lower(),
+                index=index,
+                loop=loop,
+                subreg="prim_subreg"
+                + ("_ext" if reg.external else "_shadow" if reg.shadowed else ""),
+                unused_flds_we=(
+                    f"^({reg.name.lower()}_flds_we & {_hex(num_fields, reg.fields_no_write_en)})"
+                ),
+                elements=elements,
+            )
+        )
+        index += len(reg.offsets)
+
+    interface_name = f"_{interface.name}" if interface.name else ""
+    return InterfacePlan(
+        regs=regs,
+        permit=f"{ip_name}{interface_name}_PERMIT".upper(),
+        reg_idx_width=max((interface.num_regs - 1).bit_length(), 1),
+    )
@@ -0,0 +1,154 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Instrumentation of the stages of an export.
+
+The stages are reported with their wall time and the peak memory traced by `tracemalloc`. They are
+only measured while a `Profiler` is active, `stage` costs nothing otherwise:
+
+    with profiling.Profiler(pstats_file=Path("rdl2ot.pstats")) as profiler:
+        rtl_exporter.run(root_node, out_dir)
+    profiler.print_report()
+
+The devices parsed and the templates rendered by a pool of processes are reported as a single
+parse and render stage.
+
+A profiler only measures the stages of the thread which activated it, so the concurrent exports of
+`rdl2ot serve` aren't reported in each other's profile. As `tracemalloc` traces the whole process,
+the profilers of several threads are active one at a time, and the peak memory of a stage includes
+the allocations of the other threads.
+"""
+
+import cProfile
+import dataclasses
+import json
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # typing.Self is only available from Python 3.11.
+    from typing_extensions import Self
+
+_active: ContextVar["Profiler | None"] = ContextVar("profiler", default=None)
+# Held by the profiler active in the process, as tracemalloc is global.
+_lock = threading.Lock()
+
+
+@dataclasses.dataclass(slots=True)
+class Stage:
+    """The measures of a stage, `depth` being its nesting level."""
+
+    name: str
+    depth: int
+    duration: float = 0.0  # In seconds.
+    # The peak of the memory traced during the stage over the memory traced at its start, in bytes.
+    peak_memory: int = 0
+
+
+class Profiler:
+    """Measure the stages run while it is active, and optionally profile them with cProfile."""
+
+    def __init__(self, pstats_file: Path | None = None) -> None:
+        """Create a profiler dumping the cProfile statistics to `pstats_file`, if set."""
+        self.pstats_file = pstats_file
+        self.stages: list[Stage] = []
+        self.total = Stage("total", 0)
+        # The stages being measured and the memory traced at their start.
+        self._open: list[tuple[Stage, int]] = []
+        self._depth = 0
+        self._token = None
+        self._profile = None
+        self._start = 0.0
+        self._tracing = False
+
+    def __enter__(self) -> "Self":
+        """Activate the profiler, waiting for the profiler of another thread to finish."""
+        if _active.get() is not None:
+            print("Error: A profiler is already active.")
+            raise RuntimeError
+        _lock.acquire()
+        self._token = _active.set(self)
+        self._tracing = not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._open.append((self.total, tracemalloc.get_traced_memory()[0]))
+        if self.pstats_file:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Deactivate the profiler and dump the cProfile statistics."""
+        self.total.duration = time.perf_counter() - self._start
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(self.pstats_file)
+        self._update_peaks()
+        self._open.pop(0)
+        if self._tracing:
+            tracemalloc.stop()
+        _active.reset(self._token)
+        _lock.release()
+
+    def _update_peaks(self) -> None:
+        """Fold the peak traced since the last update into every open stage."""
+        peak = tracemalloc.get_traced_memory()[1]
+        for stage, start in self._open:
+            stage.peak_memory = max(stage.peak_memory, peak - start)
+        tracemalloc.reset_peak()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        """Measure a stage, which can be nested in another one."""
+        self._depth += 1
+        stage = Stage(name, self._depth)
+        self._update_peaks()
+        self.stages.append(stage)
+        self._open.append((stage, tracemalloc.get_traced_memory()[0]))
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.duration = time.perf_counter() - start
+            self._depth -= 1
+            self._update_peaks()
+            self._open = [item for item in self._open if item[0] is not stage]
+
+    def report(self) -> dict:
+        """Return the measures as a json serializable dict, the durations being in seconds."""
+        return {
+            "total": dataclasses.asdict(self.total),
+            "stages": [dataclasses.asdict(stage) for stage in self.stages],
+        }
+
+    def print_report(self) -> None:
+        """Print the measures of every stage."""
+        print(f"{'Stage':<60} {'Time (ms)':>10} {'Peak (MiB)':>10}")
+        for stage in [*self.stages, self.total]:
+            name = "  " * (stage.depth - 1) + stage.name
+            memory = stage.peak_memory / (1024 * 1024)
+            print(f"{name:<60} {stage.duration * 1000:10.1f} {memory:10.2f}")
+
+    def save(self, json_file: Path) -> None:
+        """Save the report to `json_file`."""
+        Path(json_file).write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf-8")
+
+
+@contextmanager
+def stage(name: str) -> Iterator[Stage | None]:
+    """Measure a stage if a profiler is active, and yield its measures or None."""
+    profiler = _active.get()
+    if profiler is None:
+        yield None
+        return
+    with profiler.stage(name) as measures:
+        yield measures
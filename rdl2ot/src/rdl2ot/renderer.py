@@ -0,0 +1,197 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Render the opentitan RTL from the intermediate model.
+
+This module doesn't depend on systemrdl, so the RTL can be rendered from a saved `rdl.json` without
+compiling any RDL.
+"""
+
+import dataclasses
+import functools
+import json
+import multiprocessing
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+
+from rdl2ot import incremental, model, plan, profiling, schema
+from rdl2ot.environment import get_environment
+
+
+class UnknownDeviceError(ValueError):
+    """A device to render isn't in the model."""
+
+
+def _render_tasks(
+    ip_block: model.IpBlock, out_dir: Path, generate_loops: bool = False
+) -> list[tuple[str, dict, Path]]:
+    """List the (template, data, output path) to be rendered for an ip block."""
+    ip_name = ip_block.ip_name.lower()
+    # The attributes of the ip block are the variables of the reg_pkg template.
+    data = {attr.name: getattr(ip_block, attr.name) for attr in dataclasses.fields(ip_block)}
+    data["generate_loops"] = generate_loops
+    tasks = [("reg_pkg.sv.tpl", data, out_dir / f"{ip_name}_reg_pkg.sv")]
+    for interface in ip_block.interfaces:
+        name = f"_{interface.name.lower()}" if interface.name else ""
+        data_ = {
+            "ip_name": ip_name,
+            "interface": interface,
+            "generate_loops": generate_loops,
+            "page_bits": model.DECODER_PAGE_BITS,
+            "word_bits": model.BUS_BYTES.bit_length() - 1,
+        }
+        tasks.append(("reg_top.sv.tpl", data_, out_dir / f"{ip_name}{name}_reg_top.sv"))
+    return tasks
+
+
+def _strip_trailing_spaces(chunks: Iterable[str]) -> Iterator[str]:
+    r"""Drop the space preceding every newline of a stream of chunks.
+
+    This matches `str.replace(" \n", "\n")` on the joined chunks.
+    """
+    carry = ""
+    for chunk in chunks:
+        text = carry + chunk
+        # Hold back a trailing space, as the next chunk may start with a newline.
+        carry = " " if text.endswith(" ") else ""
+        yield text[: len(text) - len(carry)].replace(" \n", "\n")
+    yield carry
+
+
+def _variables(template_name: str, data: dict, path: Path) -> dict:
+    """Return the variables of a template, adding the plan of the interface of a reg_top.
+
+    The plan is derived from the data, so it is only computed for the outputs being rendered.
+    """
+    if template_name != "reg_top.sv.tpl":
+        return data
+    with profiling.stage(f"plan {path.name}"):
+        interface_plan = plan.plan_interface(
+            data["ip_name"], data["interface"], data["generate_loops"]
+        )
+    return {**data, "plan": interface_plan}
+
+
+def _render(
+    task: tuple[str, dict | None, Path], bytecode_cache_dir: Path | None = None
+) -> tuple[Path, bool]:
+    """Render a template to a file chunk by chunk, never holding the whole output in memory.
+
+    Return the output and whether it was rendered, it is skipped if the data is None.
+    """
+    template_name, data, path = task
+    if data is None:
+        return path, False
+    variables = _variables(template_name, data, path)
+    with profiling.stage(f"render {path.name}"):
+        chunks = get_environment(bytecode_cache_dir).get_template(template_name).generate(variables)
+        if template_name == "reg_top.sv.tpl":
+            chunks = _strip_trailing_spaces(chunks)
+        with incremental.write_if_changed(path) as f:
+            f.writelines(chunks)
+    return path, True
+
+
+def _imap(executor: Executor, func: Callable, items: Iterable, window: int) -> Iterator:
+    """Map `func` on the items in order, submitting at most `window` items ahead of the results.
+
+    Unlike `Executor.map`, the items are taken lazily, so they can be produced on the fly.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Return the context starting the render processes.
+
+    A process running other threads, such as `rdl2ot serve`, spawns them, since a forked child
+    inherits the locks held by the other threads.
+    """
+    return multiprocessing.get_context("spawn" if threading.active_count() > 1 else None)
+
+
+def export(  # noqa: PLR0913
+    ip_blocks: Iterable[model.IpBlock],
+    out_dir: Path,
+    jobs: int = 1,
+    generate_loops: bool = False,
+    bytecode_cache_dir: Path | None = None,
+    top: str = "rdl",
+) -> list[Path]:
+    """Render the templates of every ip block, using a pool of `jobs` processes if above one.
+
+    The outputs are returned and reported in the same order regardless of the number of jobs.
+    The homogeneous multiregs are rendered with generate loops if `generate_loops` is set.
+    The ip blocks are taken one at a time, so they can be produced and released on the fly.
+    The outputs rendered from an unchanged model are skipped, see `rdl2ot/incremental.py`.
+    The compiled templates are cached in `bytecode_cache_dir`, unless None.
+    The manifest is named after `top`.
+    """
+    manifest = incremental.Manifest(out_dir, top)
+
+    def tasks() -> Iterator[tuple[str, dict | None, Path]]:
+        for ip_block in ip_blocks:
+            for template_name, data, path in _render_tasks(ip_block, out_dir, generate_loops):
+                fresh = manifest.is_fresh(path, manifest.key(template_name, data))
+                # The up to date outputs are passed without their data, to be skipped.
+                yield template_name, None if fresh else data, path
+
+    render = functools.partial(_render, bytecode_cache_dir=bytecode_cache_dir)
+    outputs = []
+    with (
+        profiling.stage("render"),
+        ProcessPoolExecutor(jobs, _pool_context()) if jobs > 1 else nullcontext() as executor,
+    ):
+        results = _imap(executor, render, tasks(), 2 * jobs) if executor else map(render, tasks())
+        for path, rendered in results:
+            print(f"Generated {path}." if rendered else f"Unchanged {path}.")
+            outputs.append(path)
+    return [*outputs, manifest.save()]
+
+
+def render_json(  # noqa: PLR0913
+    json_file: Path,
+    out_dir: Path,
+    jobs: int = 1,
+    devices: Iterable[str] | None = None,
+    generate_loops: bool = False,
+    decoder: str | None = None,
+    bytecode_cache_dir: Path | None = None,
+) -> list[Path]:
+    """Render the RTL from a `rdl.json` saved by `rtl_exporter.run`.
+
+    DEVICES: Names of the SoC devices to render, all of them by default. An UnknownDeviceError is
+        raised if one of them isn't in the model.
+    DECODER: The address decoder style overriding the one the model was parsed with.
+    BYTECODE_CACHE_DIR: Directory where the compiled templates are cached, not cached if None.
+    """
+    data = json.loads(Path(json_file).read_text(encoding="utf-8"))
+    schema.validate(data)
+
+    data = model.from_dict(data)
+    ip_blocks = data.devices if isinstance(data, model.Soc) else [data]
+    if devices is not None:
+        devices = {name.lower() for name in devices}
+        names = [ip_block.ip_name for ip_block in ip_blocks]
+        unknown = devices - {name.lower() for name in names}
+        if unknown:
+            msg = f"Unknown device {', '.join(sorted(unknown))}, expected one of {', '.join(names)}"
+            raise UnknownDeviceError(msg)
+        ip_blocks = [ip_block for ip_block in ip_blocks if ip_block.ip_name.lower() in devices]
+    if decoder is not None:
+        for interface in (interface for ip_block in ip_blocks for interface in ip_block.interfaces):
+            interface.decoder = model.select_decoder(decoder, interface.regs, interface.addr_width)
+    # The top isn't saved, the manifest is named after the json file instead.
+    return export(
+        ip_blocks, out_dir, jobs, generate_loops, bytecode_cache_dir, Path(json_file).stem
+    )
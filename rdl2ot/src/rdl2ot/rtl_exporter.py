@@ -4,281 +4,445 @@
 
 """Export RDL to opentitan RTL."""
 
+import dataclasses
+import functools
 import json
+import math
+import multiprocessing
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
 from systemrdl import node
+from systemrdl.component import Component
 from systemrdl.rdltypes import OnReadType
+from systemrdl.rdltypes.references import ComponentRef
+
+from rdl2ot import (
+    DECODER_STYLES,
+    address_map,
+    incremental,
+    opentitan,
+    profiling,
+    renderer,
+    schema,
+)
+from rdl2ot.model import (
+    Field,
+    Instance,
+    Interface,
+    IpBlock,
+    Parameter,
+    Register,
+    Soc,
+    Window,
+    select_decoder,
+    to_dict,
+)
 
-from rdl2ot import opentitan
-
-TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 DEFAULT_INTERFACE_NAME = "regs"
 
-
-def _camelcase(value: str) -> str:
-    words = value.split("_")
-    return "".join(word.capitalize() for word in words)
+# The parse tasks of the processes forked by `_parse_forked`, which inherit them.
+_forked_tasks: list[Callable[[], object]] = []
 
 
-def run(root_node: node.AddrmapNode, out_dir: Path, is_soc: bool = False) -> None:
-    """Export RDL to opentitan RTL.
+def _get_offsets(addressable: node.AddressableNode) -> range:
+    """Return the address offsets of the elements of an addressable node as a range.
 
-    IS_SOC: True if the root node is a SoC with peripherals/devices.
+    The elements of a multidimensional array are evenly spaced in row-major order, so they are
+    flattened into a single range.
     """
-    factory = OtInterfaceBuilder()
-    data = factory.parse_soc(root_node) if is_soc else factory.parse_ip_block(root_node)
+    if not addressable.is_array:
+        offset = addressable.address_offset
+        return range(offset, offset + addressable.size, addressable.size)
+    count = math.prod(addressable.array_dimensions)
+    offset = addressable.raw_address_offset
+    return range(offset, offset + count * addressable.array_stride, addressable.array_stride)
 
-    Path(out_dir / "rdl.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
 
-    if not is_soc:
-        _export(data, out_dir)
-        return
+def _fingerprint_value(value: object) -> object:
+    if isinstance(value, ComponentRef):
+        # References are relative to a scope, so compare their path rather than their target.
+        return tuple((name, repr(idx)) for name, idx, _src_ref in value.ref_elements)
+    if isinstance(value, str | int | float | Enum | type):
+        return value
+    # Fallback to the representation, unknown objects are then only equal to themselves.
+    return repr(value)
 
-    for ip_block in data["devices"]:
-        _export(ip_block, out_dir)
 
+def _fingerprint_properties(component: Component) -> tuple:
+    return tuple(
+        (name, _fingerprint_value(value)) for name, value in sorted(component.properties.items())
+    )
 
-def _export(ip_block: dict, out_dir: Path) -> None:
-    file_loader = FileSystemLoader(TEMPLATES_DIR)
-    env = Environment(loader=file_loader)
-    env.filters["camelcase"] = _camelcase
 
-    ip_name = ip_block["ip_name"].lower()
-    reg_pkg_tpl = env.get_template("reg_pkg.sv.tpl")
-    stream = reg_pkg_tpl.render(ip_block)
-    path = out_dir / f"{ip_name}_reg_pkg.sv"
-    path.open("w").write(stream)
-    print(f"Generated {path}.")
+def _fingerprint(components: list[Component]) -> tuple:
+    """Build a hashable summary of a component tree, without the cost of the node API.
 
-    reg_top_tpl = env.get_template("reg_top.sv.tpl")
-    for interface in ip_block["interfaces"]:
-        name = "_{}".format(interface["name"].lower()) if "name" in interface else ""
-        data_ = {"ip_name": ip_name, "interface": interface}
-        stream = reg_top_tpl.render(data_).replace(" \n", "\n")
-        path = out_dir / f"{ip_name}{name}_reg_top.sv"
-        path.open("w").write(stream)
-        print(f"Generated {path}.")
+    Instances of a definition are deep copies, so this detects the ones customised through dynamic
+    property assignments.
+    """
+    return tuple(
+        (
+            type(comp).__name__,
+            comp.inst_name,
+            getattr(comp, "external", None),
+            getattr(comp, "addr_offset", None),
+            repr(getattr(comp, "array_dimensions", None)),
+            getattr(comp, "array_stride", None),
+            getattr(comp, "lsb", None),
+            getattr(comp, "msb", None),
+            _fingerprint_properties(comp),
+            _fingerprint(comp.children),
+        )
+        for comp in components
+    )
+
+
+def run(  # noqa: PLR0913
+    root_node: node.AddrmapNode,
+    out_dir: Path,
+    is_soc: bool = False,
+    jobs: int = 1,
+    generate_loops: bool = False,
+    decoder: str = "flat",
+    stream: bool = False,
+    bytecode_cache_dir: Path | None = None,
+) -> list[Path]:
+    """Export RDL to opentitan RTL and return the paths of the generated files.
 
+    IS_SOC: True if the root node is a SoC with peripherals/devices.
+    JOBS: Number of processes used to parse the devices or interfaces, see `_parse_forked`, and to
+        render the templates. The devices of the streaming mode are parsed serially.
+    GENERATE_LOOPS: Render the homogeneous multiregs with generate loops rather than unrolled.
+    DECODER: The address decoder style, one of `DECODER_STYLES`.
+    STREAM: Parse, save and render the devices of a SoC one at a time, so that the memory is bounded
+        by the largest device rather than by the SoC. The outputs are identical.
+    BYTECODE_CACHE_DIR: Directory where the compiled templates are cached, not cached if None.
+    The overlaps of the address map are reported as warnings.
+    """
+    factory = OtInterfaceBuilder(decoder)
+    path = out_dir / "rdl.json"
+    top = root_node.inst_name
+    if is_soc and stream:
+        spans = []
+        devices = _stream_devices(factory.iter_soc(root_node), path, spans)
+        outputs = [
+            path,
+            *renderer.export(devices, out_dir, jobs, generate_loops, bytecode_cache_dir, top),
+        ]
+        address_map.report_overlaps(spans)
+        return outputs
 
-class OtInterfaceBuilder:
-    """OpenTitan Interface Builder."""
+    with profiling.stage("parse"):
+        parse = factory.parse_soc if is_soc else factory.parse_ip_block
+        data = parse(root_node, jobs)
+    ip_blocks = data.devices if is_soc else [data]
+    address_map.report_overlaps(
+        span for device in ip_blocks for span in address_map.device_spans(device)
+    )
+
+    with profiling.stage("write rdl.json"), incremental.write_if_changed(path) as f:
+        f.write(json.dumps(schema.versioned(to_dict(data)), indent=2))
+
+    outputs = renderer.export(ip_blocks, out_dir, jobs, generate_loops, bytecode_cache_dir, top)
+    return [path, *outputs]
+
+
+def _stream_devices(
+    devices: Iterable[IpBlock], path: Path, spans: list[address_map.Span]
+) -> Iterator[IpBlock]:
+    """Append every device to the `rdl.json` of a SoC, then yield it.
+
+    The file is identical to the `rdl.json` saved from the model of the whole SoC. The address spans
+    of the devices are appended to `spans`.
+    """
+    with incremental.write_if_changed(path) as f:
+        f.write(f'{{\n  "schema_version": {schema.SCHEMA_VERSION},\n  "devices": [')
+        separator = "\n"
+        for device in devices:
+            with profiling.stage("write rdl.json"):
+                # The strings of a json document hold no raw newline.
+                text = json.dumps(to_dict(device), indent=2).replace("\n", "\n    ")
+                f.write(f"{separator}    {text}")
+            separator = ",\n"
+            spans.extend(address_map.device_spans(device))
+            yield device
+        f.write("]\n}" if separator == "\n" else "\n  ]\n}")
+
+
+@dataclasses.dataclass
+class InterfaceState:
+    """Accumulators of the interface being parsed."""
 
     num_regs: int = 0  # The number of registers of an interface
-    num_windows: int = 0  # The number of registers of an interface
+    num_windows: int = 0  # The number of windows of an interface
     any_async_clk: bool = False  # Whether is there any register with async clock in the interface
     all_async_clk: bool = True  # Whether all registers have async clock in the interface
-    async_registers: list = [(int, str)]  # List of all the (index, register) with async clock
+    # List of all the (index, register) with async clock
+    async_registers: list[tuple[int, str]] = dataclasses.field(default_factory=list)
+    # The model of the fields used as write enable, by path.
+    write_en_signals: dict[str, Field] = dataclasses.field(default_factory=dict)
+    # The registers already parsed, by definition.
+    registers: dict[tuple, Register] = dataclasses.field(default_factory=dict)
     any_shadowed_reg: bool = False
     reg_index: int = 0
 
-    def get_field(self, field: node.FieldNode) -> dict:
-        """Parse a field and return a dictionary."""
-        obj = {}
-        obj["name"] = field.inst_name
-        obj["type"] = "field"
-        obj["desc"] = field.get_property("desc", default="")
-        obj["parent_name"] = field.parent.inst_name
-        obj["lsb"] = field.lsb
-        obj["msb"] = field.msb
-        obj["width"] = field.msb - field.lsb + 1
-        obj["bitmask"] = (1 << (field.msb + 1)) - (1 << field.lsb)
-        if isinstance(field.get_property("reset"), int):
-            obj["reset"] = field.get_property("reset")
-        obj["hw_readable"] = field.is_hw_readable
-        obj["hw_writable"] = field.is_hw_writable
-        obj["sw_readable"] = field.is_sw_readable
-        obj["sw_writable"] = field.is_sw_writable
+
+def _run_forked_task(index: int) -> object:
+    return _forked_tasks[index]()
+
+
+def _parse_forked(tasks: list[Callable[[], object]], jobs: int) -> list:
+    """Run the parse `tasks` in a pool of `jobs` processes and return their results in order.
+
+    The systemrdl nodes can't be pickled, so the processes are forked and inherit the tasks, only
+    the models being pickled back. The tasks run serially without fork, or if other threads run,
+    as a forked child inherits the locks they hold.
+    """
+    forkable = "fork" in multiprocessing.get_all_start_methods()
+    if jobs < 2 or len(tasks) < 2 or not forkable or threading.active_count() > 1:  # noqa: PLR2004
+        return [task() for task in tasks]
+    _forked_tasks[:] = tasks
+    try:
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(min(jobs, len(tasks)), context) as executor:
+            return list(executor.map(_run_forked_task, range(len(tasks))))
+    finally:
+        _forked_tasks.clear()
+
+
+class OtInterfaceBuilder:
+    """OpenTitan Interface Builder.
+
+    The builder keeps no state between calls, so it can be reused and shared between threads.
+    `parse_soc` and `parse_ip_block` parse the devices or the interfaces in a pool of forked
+    processes if given several jobs, see `_parse_forked`.
+
+    With the "indexed" decoder style, the address of an interface whose registers are contiguous is
+    decoded by indexing them by word ("dense"). Otherwise, if the interface spans several pages of
+    `DECODER_PAGE_BITS`, it is decoded by page first ("paged"). The other interfaces keep the
+    "flat" decoder comparing the address to every register offset.
+    """
+
+    def __init__(self, decoder: str = "flat") -> None:
+        """Create a builder selecting the address decoders of the `decoder` style."""
+        if decoder not in DECODER_STYLES:
+            print(f"Error: Unsupported decoder style {decoder}, expected one of {DECODER_STYLES}.")
+            raise ValueError
+        self.decoder = decoder
+
+    def get_field(self, field: node.FieldNode, state: InterfaceState) -> Field:
+        """Parse a field and return its model."""
         swwe = field.get_property("swwe")
-        obj["sw_write_en"] = bool(swwe)
-        obj["write_en_signal"] = (
-            self.get_field(swwe) if obj["sw_write_en"] and not isinstance(swwe, bool) else None
-        )
-        obj["hw_write_en"] = bool(field.get_property("we"))
-        obj["swmod"] = field.get_property("swmod")
-        obj["clear_onread"] = field.get_property("onread") == OnReadType.rclr
-        obj["set_onread"] = field.get_property("onread") == OnReadType.rset
+        write_en_signal = None
+        if swwe and not isinstance(swwe, bool):
+            # Every field gated by a register write enable shares the model of its signal.
+            path = swwe.get_path()
+            write_en_signal = state.write_en_signals.get(path)
+            if write_en_signal is None:
+                write_en_signal = state.write_en_signals[path] = self.get_field(swwe, state)
+        reset = field.get_property("reset")
         encode = field.get_property("encode", default=None)
-        if encode:
-            obj["encode"] = encode.type_name
-        obj["async"] = field.get_property("async", default=None)
-        obj["sync"] = field.get_property("sync", default=None)
-        obj["reggen_sw_access"] = opentitan.get_sw_access_enum(field)
-        return obj
+        return Field(
+            name=field.inst_name,
+            desc=field.get_property("desc", default=""),
+            parent_name=field.parent.inst_name,
+            lsb=field.lsb,
+            msb=field.msb,
+            width=field.msb - field.lsb + 1,
+            bitmask=(1 << (field.msb + 1)) - (1 << field.lsb),
+            reset=reset if isinstance(reset, int) else None,
+            hw_readable=field.is_hw_readable,
+            hw_writable=field.is_hw_writable,
+            sw_readable=field.is_sw_readable,
+            sw_writable=field.is_sw_writable,
+            sw_write_en=bool(swwe),
+            write_en_signal=write_en_signal,
+            hw_write_en=bool(field.get_property("we")),
+            swmod=field.get_property("swmod"),
+            clear_onread=field.get_property("onread") == OnReadType.rclr,
+            set_onread=field.get_property("onread") == OnReadType.rset,
+            encode=encode.type_name if encode else "",
+            async_=field.get_property("async", default=None),
+            sync=field.get_property("sync", default=None),
+            reggen_sw_access=opentitan.get_sw_access_enum(field),
+        )
 
-    def get_mem(self, mem: node.FieldNode) -> dict:
-        """Parse a memory and return a dictionary representing a window."""
-        obj = {}
-        obj["name"] = mem.inst_name
-        obj["entries"] = mem.get_property("mementries")
-        obj["sw_writable"] = mem.is_sw_writable
-        obj["sw_readable"] = mem.is_sw_readable
-        obj["width"] = mem.get_property("memwidth")
-        obj["offset"] = mem.address_offset
-        obj["size"] = obj["width"] * obj["entries"] // 8
-        obj["integrity_bypass"] = mem.get_property("integrity_bypass", default=False)
-        self.all_async_clk &= bool(mem.get_property("async_clk", default=False))
-        self.num_windows += 1
-        return obj
+    def get_mem(self, mem: node.MemNode, state: InterfaceState) -> Window:
+        """Parse a memory and return the model of a window."""
+        width = mem.get_property("memwidth")
+        entries = mem.get_property("mementries")
+        state.all_async_clk &= bool(mem.get_property("async_clk", default=False))
+        state.num_windows += 1
+        return Window(
+            name=mem.inst_name,
+            entries=entries,
+            sw_writable=mem.is_sw_writable,
+            sw_readable=mem.is_sw_readable,
+            width=width,
+            offset=mem.address_offset,
+            size=width * entries // 8,
+            integrity_bypass=mem.get_property("integrity_bypass", default=False),
+        )
 
-    def get_reg(self, reg: node.RegNode) -> dict:
-        """Parse a register and return a dictionary."""
-        obj = {}
-        obj["name"] = reg.inst_name
-        obj["type"] = "reg"
-        obj["width"] = reg.get_property("regwidth")
-        obj["hw_readable"] = reg.has_hw_readable
-        obj["hw_writable"] = reg.has_hw_writable
-        obj["sw_readable"] = reg.has_sw_readable
-        obj["sw_writable"] = reg.has_sw_writable
-        obj["swmod"] = reg.get_property("swmod", default=None)
-        obj["async_clk"] = reg.get_property("async_clk", default=None)
-        obj["external"] = reg.external
-        obj["shadowed"] = reg.get_property("shadowed", default=False)
-        obj["hwre"] = reg.get_property("hwre", default=False)
-
-        obj["offsets"] = []
-        if reg.is_array:
-            obj["is_multireg"] = True
-            self.num_regs += reg.array_dimensions[0]
-            offset = reg.raw_address_offset
-            for _idx in range(reg.array_dimensions[0]):
-                obj["offsets"].append(offset)
-                offset += reg.array_stride
+    def get_reg(self, reg: node.RegNode, state: InterfaceState) -> Register:
+        """Parse a register and return its model.
+
+        The instances of a register definition are parsed once, then cloned with their own name
+        and offsets.
+        """
+        offsets = _get_offsets(reg)
+        state.num_regs += len(offsets)
+
+        # Dynamic property assignments customise an instance without changing its definition, so
+        # the key also summarises the properties. References are resolved from the parent scope.
+        key = (
+            reg.inst.original_def,
+            reg.type_name,
+            reg.external,
+            reg.parent.get_path(),
+            _fingerprint_properties(reg.inst),
+            _fingerprint(reg.inst.children),
+        )
+        obj = state.registers.get(key)
+        if obj is None:
+            obj = state.registers[key] = self._parse_reg(reg, offsets, state)
         else:
-            self.num_regs += 1
-            obj["offsets"].append(reg.address_offset)
-
-        obj["fields"] = []
-        sw_write_en = False
-        msb = 0
-        reset_val = 0
-        bitmask = 0
-        for f in reg.fields():
-            field = self.get_field(f)
-            obj["fields"].append(field)
-            sw_write_en |= field["sw_write_en"]
-            msb = max(msb, field["msb"])
-            bitmask |= field["bitmask"]
-            reset_val |= field.get("reset", 0) << field["lsb"]
-
-        obj["msb"] = msb
-        obj["permit"] = opentitan.register_permit_mask(obj)
-        obj["sw_write_en"] = sw_write_en
-        obj["bitmask"] = bitmask
-        obj["reset"] = reset_val
-        obj["async"] = False
-        obj["needs_write_en"] = opentitan.needs_write_en(obj)
-        obj["needs_read_en"] = opentitan.needs_read_en(obj)
-        obj["needs_qe"] = opentitan.needs_qe(obj)
-        obj["needs_int_qe"] = opentitan.needs_int_qe(obj)
-        obj["fields_no_write_en"] = opentitan.fields_no_write_en(obj)
-        obj["is_multifields"] = len(obj["fields"]) > 1
-        obj["is_homogeneous"] = opentitan.is_homogeneous(obj)
-
-        self.any_async_clk |= bool(obj["async_clk"])
-        self.all_async_clk &= bool(obj["async_clk"])
-        self.any_shadowed_reg |= bool(obj["shadowed"])
-
-        array_size = len(obj["offsets"])
-        if bool(obj["async_clk"]):
+            obj = dataclasses.replace(
+                obj,
+                name=reg.inst_name,
+                offsets=offsets,
+                is_multireg=reg.is_array,
+                fields=[dataclasses.replace(f, parent_name=reg.inst_name) for f in obj.fields],
+            )
+
+        state.any_async_clk |= bool(obj.async_clk)
+        state.all_async_clk &= bool(obj.async_clk)
+        state.any_shadowed_reg |= bool(obj.shadowed)
+
+        array_size = len(offsets)
+        if bool(obj.async_clk):
             for index in range(array_size):
                 reg_name = reg.inst_name + (f"_{index}" if array_size > 1 else "")
-                self.async_registers.append((self.reg_index + index, reg_name))
-        self.reg_index += array_size
+                state.async_registers.append((state.reg_index + index, reg_name))
+        state.reg_index += array_size
         return obj
 
-    def get_paramesters(self, obj: node.AddrmapNode | node.RegfileNode) -> [dict]:
-        """Parse the custom property localparams and return a list of  dictionaries."""
+    def _parse_reg(self, reg: node.RegNode, offsets: range, state: InterfaceState) -> Register:
+        fields = [self.get_field(f, state) for f in reg.fields()]
+        obj = Register(
+            name=reg.inst_name,
+            width=reg.get_property("regwidth"),
+            hw_readable=reg.has_hw_readable,
+            hw_writable=reg.has_hw_writable,
+            sw_readable=reg.has_sw_readable,
+            sw_writable=reg.has_sw_writable,
+            swmod=reg.get_property("swmod", default=None),
+            async_clk=reg.get_property("async_clk", default=None),
+            external=reg.external,
+            shadowed=reg.get_property("shadowed", default=False),
+            hwre=reg.get_property("hwre", default=False),
+            offsets=offsets,
+            is_multireg=reg.is_array,
+            fields=fields,
+            msb=max((field.msb for field in fields), default=0),
+            sw_write_en=any(field.sw_write_en for field in fields),
+        )
+        for field in fields:
+            obj.bitmask |= field.bitmask
+            obj.reset |= (field.reset or 0) << field.lsb
+
+        obj.permit = opentitan.register_permit_mask(obj)
+        obj.needs_write_en = opentitan.needs_write_en(obj)
+        obj.needs_read_en = opentitan.needs_read_en(obj)
+        obj.needs_qe = opentitan.needs_qe(obj)
+        obj.needs_int_qe = opentitan.needs_int_qe(obj)
+        obj.fields_no_write_en = opentitan.fields_no_write_en(obj)
+        obj.is_multifields = len(fields) > 1
+        obj.is_homogeneous = opentitan.is_homogeneous(obj)
+        return obj
+
+    def get_paramesters(self, obj: node.AddrmapNode | node.RegfileNode) -> list[Parameter]:
+        """Parse the custom property localparams and return a list of parameters."""
         return [
-            {"name": param.name, "type": "int", "value": param.get_value()}
+            Parameter(name=param.name, type="int", value=param.get_value())
             for param in obj.inst.parameters
         ]
 
-    def get_interface(self, addrmap: node.AddrmapNode, defalt_name: None | str = None) -> dict:
-        """Parse an interface and return a dictionary."""
-        self.num_regs = 0
-        self.num_windows = 0
-        self.any_async_clk = False
-        self.all_async_clk = True
-        self.any_shadowed_reg = False
-        self.async_registers.clear()
-
-        interface = {}
-        if defalt_name:
-            interface["name"] = addrmap.inst_name or defalt_name
-
-        interface["regs"] = []
-        interface["windows"] = []
+    def get_decoder(self, regs: list[Register], addr_width: int) -> str:
+        """Return the address decoder style of an interface made of `regs`."""
+        return select_decoder(self.decoder, regs, addr_width)
+
+    def get_interface(self, addrmap: node.AddrmapNode, defalt_name: str | None = None) -> Interface:
+        """Parse an interface and return its model."""
+        with profiling.stage(f"parse interface {addrmap.get_path()}"):
+            return self._get_interface(addrmap, defalt_name)
+
+    def _get_interface(self, addrmap: node.AddrmapNode, defalt_name: str | None) -> Interface:
+        state = InterfaceState()
+
+        regs = []
+        windows = []
         for child in addrmap.children():
             if isinstance(child, node.RegNode):
-                child_obj = self.get_reg(child)
-                interface["regs"].append(child_obj)
+                regs.append(self.get_reg(child, state))
             elif isinstance(child, node.RegfileNode):
-                for reg in child.children():
-                    child_obj = self.get_reg(reg)
-                    interface["regs"].append(child_obj)
+                regs.extend(self.get_reg(reg, state) for reg in child.children())
             elif isinstance(child, node.MemNode):
-                child_obj = self.get_mem(child)
-                interface["windows"].append(child_obj)
+                windows.append(self.get_mem(child, state))
             else:
                 print(f"WARNING: Unsupported type: {type(child)}, skiping...")
                 continue
 
-        last_addr = interface["regs"][-1]["offsets"][-1] + 4 if len(interface["regs"]) > 0 else 0
-        if len(interface["windows"]) > 0:
-            last_addr = max(
-                last_addr, interface["windows"][-1]["offset"] + interface["windows"][-1]["size"]
-            )
-        interface["addr_width"] = (last_addr - 1).bit_length()
-        interface["num_regs"] = self.num_regs
-        interface["num_windows"] = self.num_windows
-        interface["async_registers"] = self.async_registers
-        interface["needs_aw"] = (
-            interface["num_regs"] > 0
-            or interface["num_windows"] > 1
-            or interface["windows"][0]["offset"] > 0
-            or interface["windows"][0]["size"] != (1 << interface["addr_width"])
+        # The registers and windows are not necessarily sorted by address.
+        last_addr = max(
+            (
+                *(reg.offsets[-1] + reg.width // 8 for reg in regs),
+                *(window.offset + window.size for window in windows),
+            ),
+            default=0,
         )
-        interface["any_async_clk"] = self.any_async_clk
-        interface["all_async_clk"] = self.all_async_clk
-        interface["any_shadowed_reg"] = self.any_shadowed_reg
-        interface["any_integrity_bypass"] = any(
-            win["integrity_bypass"] for win in interface["windows"]
+        addr_width = (last_addr - 1).bit_length()
+        return Interface(
+            name=(addrmap.inst_name or defalt_name) if defalt_name else "",
+            # The registers of the IP block itself are in an interface at its own address.
+            offset=addrmap.address_offset if defalt_name else 0,
+            regs=regs,
+            windows=windows,
+            addr_width=addr_width,
+            num_regs=state.num_regs,
+            num_windows=state.num_windows,
+            async_registers=state.async_registers,
+            needs_aw=(
+                state.num_regs > 0
+                or state.num_windows > 1
+                or windows[0].offset > 0
+                or windows[0].size != (1 << addr_width)
+            ),
+            any_async_clk=state.any_async_clk,
+            all_async_clk=state.all_async_clk,
+            any_shadowed_reg=state.any_shadowed_reg,
+            any_integrity_bypass=any(win.integrity_bypass for win in windows),
+            alerts=[f.name for reg in regs for f in reg.fields if reg.name == "ALERT_TEST"],
+            decoder=self.get_decoder(regs, addr_width),
         )
-        interface["alerts"] = [
-            f["name"]
-            for reg in interface["regs"]
-            for f in reg["fields"]
-            if reg["name"] == "ALERT_TEST"
-        ]
-        return interface
-
-    def parse_ip_block(self, ip_block: node.AddrmapNode) -> dict:
-        """Parse the ip_block node of an IP block and return a dictionary."""
-        obj = {}
-        params = self.get_paramesters(ip_block)
-        if params:
-            obj["parameters"] = params
-        obj["ip_name"] = ip_block.inst_name
-
-        obj["offsets"] = []
-        if ip_block.is_array:
-            offset = ip_block.raw_address_offset
-            for _idx in range(ip_block.array_dimensions[0]):
-                obj["offsets"].append(offset)
-                offset += ip_block.array_stride
-        else:
-            obj["offsets"].append(ip_block.address_offset)
 
-        obj["interfaces"] = []
-        obj["alerts"] = []
+    def parse_ip_block(self, ip_block: node.AddrmapNode, jobs: int = 1) -> IpBlock:
+        """Parse the ip_block node of an IP block and return its model.
+
+        JOBS: Number of processes parsing the interfaces.
+        """
+        with profiling.stage(f"parse device {ip_block.get_path()}"):
+            return self._parse_ip_block_interfaces(ip_block, jobs)
+
+    def _parse_ip_block_interfaces(self, ip_block: node.AddrmapNode, jobs: int) -> IpBlock:
+        interfaces = []
         for child in ip_block.children():
             if isinstance(child, node.AddrmapNode):
-                child_obj = self.get_interface(child, DEFAULT_INTERFACE_NAME)
-                obj["interfaces"].append(child_obj)
-                obj["alerts"].extend(child_obj["alerts"])
+                interfaces.append(child)
             elif isinstance(child, node.RegNode | node.MemNode | node.RegfileNode):
                 continue
             else:
@@ -288,16 +452,31 @@ class OtInterfaceBuilder:
                 )
                 raise TypeError
 
+        tasks = [
+            functools.partial(self.get_interface, child, DEFAULT_INTERFACE_NAME)
+            for child in interfaces
+        ]
         # If the ip_block contain imediate registers, use a default interface name
         if len(ip_block.registers()) > 0:
-            interface = self.get_interface(ip_block)
-            obj["interfaces"].append(interface)
-            obj["alerts"].extend(interface["alerts"])
+            tasks.append(functools.partial(self.get_interface, ip_block))
+        interfaces = _parse_forked(tasks, jobs)
+
+        return IpBlock(
+            parameters=self.get_paramesters(ip_block),
+            ip_name=ip_block.inst_name,
+            offsets=[_get_offsets(ip_block)],
+            interfaces=interfaces,
+            alerts=[alert for interface in interfaces for alert in interface.alerts],
+        )
 
-        return obj
+    def _soc_groups(self, root: node.AddrmapNode) -> list[tuple[str, list[node.AddrmapNode]]]:
+        """Group the instances of the same IP type, which share their parsed model and RTL.
 
-    def parse_soc(self, root: node.AddrmapNode) -> dict:
-        """Parse the SoC root node and return a dictionary."""
+        Return the IP name and the instances of every group. A group with a single instance keeps
+        its name, a group with several is named after their type. An anonymous definition is
+        only shared by the instances declared with it. The names are unique once lowercased, as
+        they are the stems of the generated files.
+        """
         if root.is_array:
             print("Error: Unsupported array type on the top")
             raise RuntimeError
@@ -305,7 +484,64 @@ class OtInterfaceBuilder:
             print("Error: Top level must be an addrmap")
             raise TypeError
 
-        obj = {"devices": []}
+        groups = {}
         for child in root.children():
-            obj["devices"].append(self.parse_ip_block(child))
-        return obj
+            definition = child.inst.original_def
+            key = (
+                definition if definition is not None else child.inst_name,
+                child.type_name,
+                _fingerprint_properties(child.inst),
+                _fingerprint(child.inst.children),
+            )
+            groups.setdefault(key, []).append(child)
+
+        stems = set()
+        named_groups = []
+        for instances in groups.values():
+            name = instances[0].inst_name
+            if len(instances) > 1:
+                name = instances[0].type_name or name
+            if name.lower() in stems:
+                name = instances[0].inst_name
+            unique_name, suffix = name, 0
+            while unique_name.lower() in stems:
+                suffix += 1
+                unique_name = f"{name}_{suffix}"
+            if unique_name != name:
+                print(f"Warning: Renamed the device {name} to {unique_name}, its name is taken.")
+            stems.add(unique_name.lower())
+            named_groups.append((unique_name, instances))
+        return named_groups
+
+    def _soc_device(
+        self, name: str, instances: list[node.AddrmapNode], ip_block: IpBlock
+    ) -> IpBlock:
+        """Complete the model of the IP block of a group of instances."""
+        ip_block.ip_name = name
+        ip_block.instances = [
+            Instance(name=child.inst_name, offsets=_get_offsets(child)) for child in instances
+        ]
+        ip_block.offsets = [instance.offsets for instance in ip_block.instances]
+        return ip_block
+
+    def parse_soc(self, root: node.AddrmapNode, jobs: int = 1) -> Soc:
+        """Parse the SoC root node and return its model.
+
+        JOBS: Number of processes parsing the devices.
+        """
+        tasks = [
+            functools.partial(self._parse_soc_device, name, instances)
+            for name, instances in self._soc_groups(root)
+        ]
+        return Soc(devices=_parse_forked(tasks, jobs))
+
+    def _parse_soc_device(self, name: str, instances: list[node.AddrmapNode]) -> IpBlock:
+        return self._soc_device(name, instances, self.parse_ip_block(instances[0]))
+
+    def iter_soc(self, root: node.AddrmapNode) -> Iterator[IpBlock]:
+        """Parse the SoC root node and yield the model of its devices one at a time.
+
+        Only the device being parsed is held.
+        """
+        for name, instances in self._soc_groups(root):
+            yield self._parse_soc_device(name, instances)
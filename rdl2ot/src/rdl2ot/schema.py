@@ -0,0 +1,178 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Versioned schema of the intermediate model saved in `rdl.json`.
+
+Bump `SCHEMA_VERSION` whenever the model changes in a way that the templates or other consumers
+would notice.
+
+A schema is a dict mapping every key to its expected type, keys ending with `?` are optional. The
+type is either a python type, a tuple of types, a nested schema, a `(schema, None)` tuple for a
+nested schema that may be null or a list holding the schema of the elements. User defined
+properties can hold any value, noted as `object`, and `Positive` is an int above zero.
+"""
+
+SCHEMA_VERSION = 3
+
+
+class Positive:
+    """An int above zero, in a schema."""
+
+
+# The address offsets of the elements of an array.
+RANGE = {"base": int, "stride": Positive, "count": int}
+
+FIELD = {
+    "name": str,
+    "type": str,
+    "desc": str,
+    "parent_name": str,
+    "lsb": int,
+    "msb": int,
+    "width": int,
+    "bitmask": int,
+    "reset?": int,
+    "hw_readable": bool,
+    "hw_writable": bool,
+    "sw_readable": bool,
+    "sw_writable": bool,
+    "sw_write_en": bool,
+    "hw_write_en": bool,
+    "swmod": bool,
+    "clear_onread": bool,
+    "set_onread": bool,
+    "encode?": str,
+    "async": object,
+    "sync": object,
+    "reggen_sw_access": str,
+}
+# The field gating the writes of another field.
+FIELD["write_en_signal"] = (FIELD, None)
+
+REGISTER = {
+    "name": str,
+    "type": str,
+    "width": int,
+    "hw_readable": bool,
+    "hw_writable": bool,
+    "sw_readable": bool,
+    "sw_writable": bool,
+    "swmod": (bool, type(None)),
+    "async_clk": object,
+    "external": bool,
+    "shadowed": object,
+    "hwre": object,
+    "offsets": RANGE,
+    "is_multireg?": bool,
+    "fields": [FIELD],
+    "msb": int,
+    "permit": int,
+    "sw_write_en": bool,
+    "bitmask": int,
+    "reset": int,
+    "async": bool,
+    "needs_write_en": bool,
+    "needs_read_en": bool,
+    "needs_qe": bool,
+    "needs_int_qe": bool,
+    "fields_no_write_en": int,
+    "is_multifields": bool,
+    "is_homogeneous": bool,
+}
+
+WINDOW = {
+    "name": str,
+    "entries": int,
+    "sw_writable": bool,
+    "sw_readable": bool,
+    "width": int,
+    "offset": int,
+    "size": int,
+    "integrity_bypass": object,
+}
+
+INTERFACE = {
+    "name?": str,
+    "offset?": int,
+    "regs": [REGISTER],
+    "windows": [WINDOW],
+    "addr_width": int,
+    "num_regs": int,
+    "num_windows": int,
+    "async_registers": [list],
+    "needs_aw": bool,
+    "any_async_clk": bool,
+    "all_async_clk": bool,
+    "any_shadowed_reg": bool,
+    "any_integrity_bypass": bool,
+    "alerts": [str],
+    "decoder?": str,
+}
+
+IP_BLOCK = {
+    "parameters?": [{"name": str, "type": str, "value": object}],
+    "ip_name": str,
+    "offsets": [RANGE],
+    "instances?": [{"name": str, "offsets": RANGE}],
+    "interfaces": [INTERFACE],
+    "alerts": [str],
+}
+
+SOC = {"devices": [IP_BLOCK]}
+
+
+class SchemaError(ValueError):
+    """The model doesn't match the schema."""
+
+
+def _check_object(value: object, expected: dict, path: str) -> None:
+    if not isinstance(value, dict):
+        msg = f"{path}: expected an object"
+        raise SchemaError(msg)
+    for key, key_type in expected.items():
+        name = key.removesuffix("?")
+        if name in value:
+            _check(value[name], key_type, f"{path}.{name}")
+        elif not key.endswith("?"):
+            msg = f"{path}: missing key '{name}'"
+            raise SchemaError(msg)
+
+
+def _check_array(value: object, expected: object, path: str) -> None:
+    if not isinstance(value, list):
+        msg = f"{path}: expected an array"
+        raise SchemaError(msg)
+    for index, item in enumerate(value):
+        _check(item, expected, f"{path}[{index}]")
+
+
+def _check(value: object, expected: object, path: str) -> None:
+    if isinstance(expected, dict):
+        _check_object(value, expected, path)
+    elif isinstance(expected, list):
+        _check_array(value, expected[0], path)
+    elif isinstance(expected, tuple) and isinstance(expected[0], dict):
+        if value is not None:
+            _check_object(value, expected[0], path)
+    elif expected is Positive:
+        if not isinstance(value, int) or value < 1:
+            msg = f"{path}: expected a positive integer"
+            raise SchemaError(msg)
+    elif not isinstance(value, expected):
+        msg = f"{path}: unexpected type {type(value).__name__}"
+        raise SchemaError(msg)
+
+
+def versioned(data: dict) -> dict:
+    """Return the model tagged with the current schema version."""
+    return {"schema_version": SCHEMA_VERSION, **data}
+
+
+def validate(data: dict) -> None:
+    """Raise a SchemaError if `data` is not a model of the current schema version."""
+    version = data.get("schema_version") if isinstance(data, dict) else None
+    if version != SCHEMA_VERSION:
+        msg = f"Unsupported schema version {version}, expected {SCHEMA_VERSION}"
+        raise SchemaError(msg)
+    _check(data, SOC if "devices" in data else IP_BLOCK, "rdl")
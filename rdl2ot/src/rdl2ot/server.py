@@ -0,0 +1,214 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Export server listening on a Unix socket, and its client.
+
+`rdl2ot serve` imports systemrdl and jinja2 and loads the templates once, then runs the exports
+requested by `rdl2ot export-rtl`, which forwards its arguments when a server is running. Each
+request is handled by its own thread and compiler, the templates and caches are shared. The
+requests for the same output directory run one at a time, as do the profiled requests, see
+`rdl2ot/profiling.py`.
+
+A request is a json line `{"input_file", "out_dir", "soc", "options", "generator"}`, the paths
+being absolute, the options being the other arguments of `export-rtl` and the generator being the
+`cache.generator_key` of the client. The server first answers a json line `{"generator"}` with its
+own key, and only runs the export if both match. The response is then a json line
+`{"returncode", "output"}`, the output being what the export printed. The client exports in its own
+process if the keys differ or if the server fails to respond. Once the export started, the client
+fails if the server doesn't respond in time, as the server may still be writing the outputs.
+
+This module must not import systemrdl or jinja2, the client should start as fast as possible.
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from pathlib import Path
+
+from rdl2ot.cache import default_cache_dir, generator_key
+
+# The time given to a server to accept a request and answer its handshake, in seconds.
+HANDSHAKE_TIMEOUT = 5.0
+# The time given to a server to run an export, in seconds.
+EXPORT_TIMEOUT = 600.0
+
+
+def default_socket_path() -> Path:
+    """Return the socket of the server, `$RDL2OT_SOCKET` or a socket in the runtime directory."""
+    if path := os.environ.get("RDL2OT_SOCKET"):
+        return Path(path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    return Path(runtime_dir) / "rdl2ot.sock" if runtime_dir else default_cache_dir() / "server.sock"
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(HANDSHAKE_TIMEOUT)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _read(f: io.BufferedRWPair, *keys: str) -> dict:
+    """Read a json line holding the `keys`, raising a ValueError if it doesn't."""
+    message = json.loads(f.readline())
+    if not isinstance(message, dict) or not all(key in message for key in keys):
+        raise ValueError(message)
+    return message
+
+
+def forward(socket_path: Path, request: dict) -> dict | None:
+    """Send an export request to the server and return its response, or None to export locally.
+
+    None is returned if no server is running, if it runs another rdl2ot, or if it fails to respond
+    with a valid response, which is the case of a server crashing during the export. A failed
+    response is returned if the export times out, a second export would write the same outputs.
+    """
+    sock = _connect(socket_path)
+    if sock is None:
+        return None
+    key = generator_key()
+    try:
+        with sock, sock.makefile("rwb") as f:
+            f.write(json.dumps({**request, "generator": key}).encode() + b"\n")
+            f.flush()
+            if _read(f, "generator")["generator"] != key:
+                print("Warning: The rdl2ot server runs another rdl2ot, exporting in this process.")
+                return None
+            sock.settimeout(EXPORT_TIMEOUT)
+            return _read(f, "returncode", "output")
+    except TimeoutError:
+        output = (
+            f"Error: The rdl2ot server didn't finish the export in {EXPORT_TIMEOUT:g} s,"
+            f" it may still be writing {request.get('out_dir')}.\n"
+        )
+        return {"returncode": 1, "output": output}
+    except (OSError, ValueError):
+        print("Warning: The rdl2ot server failed to respond, exporting in this process.")
+        return None
+
+
+class _ThreadOutput(io.TextIOBase):
+    """Redirect the prints of every request thread to its own buffer."""
+
+    def __init__(self, stream: io.TextIOBase) -> None:
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self) -> None:
+        buffer = getattr(self.local, "buffer", None)
+        (buffer or self.stream).flush()
+
+
+def _arguments(request: dict) -> list[str]:
+    """Convert a request to the arguments of `export-rtl`."""
+    args = ["export-rtl", request["input_file"], request["out_dir"], "--no-server"]
+    if request.get("soc"):
+        args.append("--soc")
+    for name, value in request.get("options", {}).items():
+        option = f"--{name.replace('_', '-')}"
+        if value is True:
+            args.append(option)
+        elif value not in (None, False):
+            args.extend([option, str(value)])
+    return args
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        import click  # noqa: PLC0415
+
+        from rdl2ot import cli  # noqa: PLC0415
+
+        request = json.loads(self.rfile.readline())
+        self.wfile.write(json.dumps({"generator": generator_key()}).encode() + b"\n")
+        self.wfile.flush()
+        if request.get("generator") != generator_key():
+            # The client exports in its own process.
+            return
+
+        output = io.StringIO()
+        sys.stdout.local.buffer = output
+        try:
+            with self.server.out_dir_lock(request["out_dir"]):
+                cli.main.main(_arguments(request), standalone_mode=False)
+            returncode = 0
+        except click.ClickException as error:
+            print(f"Error: {error.format_message()}")
+            returncode = error.exit_code
+        except Exception:  # noqa: BLE001
+            # Report the failure to the client, the server keeps serving the other requests.
+            traceback.print_exc(file=output)
+            returncode = 1
+        finally:
+            sys.stdout.local.buffer = None
+        response = {"returncode": returncode, "output": output.getvalue()}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class ExportServer(socketserver.ThreadingUnixStreamServer):
+    """Serve the export requests, each in its own thread."""
+
+    daemon_threads = True
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        """Create the server, see `socketserver.UnixStreamServer`."""
+        super().__init__(*args, **kwargs)
+        self.locks = {}
+        self.locks_lock = threading.Lock()
+
+    def out_dir_lock(self, out_dir: str) -> threading.Lock:
+        """Return the lock serializing the exports into `out_dir`."""
+        with self.locks_lock:
+            return self.locks.setdefault(out_dir, threading.Lock())
+
+
+def create_server(socket_path: Path) -> ExportServer:
+    """Load the exporter and the templates, and listen on `socket_path`."""
+    from rdl2ot import rtl_exporter  # noqa: F401, PLC0415
+    from rdl2ot.cache import bytecode_cache_dir  # noqa: PLC0415
+    from rdl2ot.environment import get_environment  # noqa: PLC0415
+
+    # The environment of the exports using the default cache, the others load their own.
+    for template in ("reg_pkg.sv.tpl", "reg_top.sv.tpl"):
+        get_environment(bytecode_cache_dir()).get_template(template)
+    # Keyed by the sources loaded, a client of a later rdl2ot exports in its own process.
+    generator_key()
+
+    if socket_path.exists():
+        sock = _connect(socket_path)
+        if sock is not None:
+            sock.close()
+            print(f"Error: A server is already listening on {socket_path}.")
+            raise RuntimeError
+        # A stale socket left by a server that didn't exit cleanly.
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if not isinstance(sys.stdout, _ThreadOutput):
+        sys.stdout = _ThreadOutput(sys.stdout)
+    return ExportServer(str(socket_path), _Handler)
+
+
+def serve(socket_path: Path) -> None:
+    """Serve the export requests on `socket_path` until interrupted."""
+    with create_server(socket_path) as server:
+        print(f"Listening on {socket_path}, press Ctrl-C to stop.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
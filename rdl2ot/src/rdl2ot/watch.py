@@ -0,0 +1,257 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Regenerate the RTL whenever the input RDL or a file it includes changes.
+
+The process stays alive between the exports, so systemrdl, jinja2 and the templates are only loaded
+once, and the outputs of the unchanged interfaces are skipped, see `rdl2ot/incremental.py`.
+
+The files are watched with inotify on Linux, and polled otherwise.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from systemrdl import RDLCompileError, RDLCompiler
+
+from rdl2ot import incremental, rtl_exporter
+from rdl2ot.cache import bytecode_cache_dir
+from rdl2ot.environment import get_environment
+
+# Wait for the editors to finish writing every file of a change before exporting.
+SETTLE_TIME = 0.05
+# The inotify events of a file being written, created, replaced or deleted.
+IN_MODIFY = 0x2
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+# The event of a watch removed, explicitly or because its directory was deleted.
+IN_IGNORED = 0x8000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+_EVENT = struct.Struct("iIII")
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    """Return the mtime and size of a file, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _modified_since(paths: Iterable[Path], since: int | None) -> set[Path]:
+    """Return the files modified at or after `since`, a time in ns, or none if None."""
+    if since is None:
+        return set()
+    return {path for path in paths if (stat := _stat(path)) is not None and stat[0] >= since}
+
+
+class PollingWatcher:
+    """Detect the changes of files by comparing their mtime and size."""
+
+    def __init__(self, interval: float = 0.5) -> None:
+        """Create a watcher checking the files every `interval` seconds."""
+        self.interval = interval
+        self.stats = {}
+        self.pending = set()
+
+    def watch(self, paths: Iterable[Path], since: int | None = None) -> None:
+        """Set the files to watch, their current state being the reference.
+
+        The files changed since their previous reference, or modified after `since` if they weren't
+        watched, were changed during the export and are reported by the next `wait`.
+        """
+        stats = {path: _stat(path) for path in paths}
+        self.pending |= {path for path, stat in stats.items() if self.stats.get(path, stat) != stat}
+        self.pending |= _modified_since(stats.keys() - self.stats.keys(), since)
+        self.stats = stats
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block until a file changes or `timeout` seconds elapse, and return the files changed."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = {path for path, stat in self.stats.items() if _stat(path) != stat}
+            changed |= self.pending
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if changed or (remaining is not None and remaining <= 0):
+                self.stats = {path: _stat(path) for path in self.stats}
+                self.pending = set()
+                return changed
+            time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+    def close(self) -> None:
+        """Release the watcher."""
+
+
+class InotifyWatcher:
+    """Detect the changes of files with inotify, through ctypes.
+
+    The directories are watched rather than the files, as editors often replace a file on save.
+    """
+
+    def __init__(self) -> None:
+        """Create an inotify instance, raising an OSError if unavailable."""
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self.dirs = {}  # The directory of every watch descriptor.
+        self.paths = set()
+        self.pending = set()
+
+    def watch(self, paths: Iterable[Path], since: int | None = None) -> None:
+        """Set the files to watch, removing the watches of the directories no longer needed.
+
+        The events of the directories already watched are queued during the export. The files of
+        the other ones modified after `since` were changed during the export and are reported by the
+        next `wait`.
+        """
+        self.paths = {path.resolve() for path in paths}
+        directories = {path.parent for path in self.paths}
+        new_directories = directories - set(self.dirs.values())
+        for wd, directory in list(self.dirs.items()):
+            if directory not in directories:
+                # Fails if the directory was deleted, its watch being already removed.
+                self.libc.inotify_rm_watch(self.fd, wd)
+                del self.dirs[wd]
+        for directory in new_directories:
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_add_watch", str(directory))
+            self.dirs[wd] = directory
+        new_paths = {path for path in self.paths if path.parent in new_directories}
+        self.pending |= _modified_since(new_paths, since)
+
+    def _read(self) -> set[Path]:
+        changed = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_IGNORED:
+                # The directory is watched again by the next `watch` if still needed.
+                self.dirs.pop(wd, None)
+                continue
+            path = self.dirs.get(wd, Path()) / os.fsdecode(name)
+            if path in self.paths:
+                changed.add(path)
+        return changed
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block until a file changes or `timeout` seconds elapse, and return the files changed."""
+        if self.pending:
+            changed, self.pending = self.pending, set()
+            return changed
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            changed = self._read() if ready else set()
+            if changed or not ready:
+                return changed
+
+    def close(self) -> None:
+        """Release the inotify instance."""
+        os.close(self.fd)
+
+
+def create_watcher(poll: bool = False, interval: float = 0.5) -> InotifyWatcher | PollingWatcher:
+    """Return an inotify watcher if available and not `poll`, a polling watcher otherwise."""
+    if not poll:
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            print("Inotify is unavailable, polling the files instead.")
+    return PollingWatcher(interval)
+
+
+def _export(input_file: Path, out_dir: Path, **options: object) -> list[Path] | None:
+    """Export the RTL and return the files the export depends on, or None on an error.
+
+    Any error is reported rather than raised, so the watch goes on with the next change.
+    """
+    rdlc = RDLCompiler()
+    try:
+        file_info = rdlc.compile_file(input_file)
+        root = rdlc.elaborate()
+        dependencies = [input_file, *map(Path, file_info.included_files)]
+        outputs = rtl_exporter.run(root.top, out_dir, **options)
+        incremental.write_depfile(outputs, dependencies)
+    except RDLCompileError:
+        print("Error: The compilation failed, waiting for the next change.")
+        return None
+    except Exception as error:  # noqa: BLE001
+        print(f"Error: The export failed ({error!r}), waiting for the next change.")
+        return None
+    return dependencies
+
+
+def watch(  # noqa: PLR0913
+    input_file: Path,
+    out_dir: Path,
+    is_soc: bool = False,
+    jobs: int = 1,
+    generate_loops: bool = False,
+    decoder: str = "flat",
+    poll: bool = False,
+    interval: float = 0.5,
+    max_cycles: int | None = None,
+) -> None:
+    """Export the RTL, then export it again on every change of its inputs.
+
+    The latency between the last edit of a change and the end of its export is reported.
+    MAX_CYCLES: The number of changes handled before returning, unlimited if None.
+    """
+    options = {"is_soc": is_soc, "jobs": jobs, "generate_loops": generate_loops, "decoder": decoder}
+    options["bytecode_cache_dir"] = bytecode_cache_dir()
+    input_file = Path(input_file).resolve()
+    for template in ("reg_pkg.sv.tpl", "reg_top.sv.tpl"):
+        get_environment(options["bytecode_cache_dir"]).get_template(template)
+
+    watcher = create_watcher(poll, interval)
+    # The files edited during an export are taken as a change once the export is done.
+    started = time.time_ns()
+    dependencies = _export(input_file, out_dir, **options) or [input_file]
+    watcher.watch(dependencies, started)
+    print(f"Watching {len(dependencies)} files, press Ctrl-C to stop.")
+    cycles = 0
+    try:
+        while max_cycles is None or cycles < max_cycles:
+            changed = watcher.wait()
+            # Gather the other files of the same change.
+            while more := watcher.wait(SETTLE_TIME):
+                changed |= more
+            edit_time = max((path.stat().st_mtime for path in changed if path.exists()), default=0)
+            print(f"Changed: {', '.join(str(path) for path in sorted(changed))}")
+            started = time.time_ns()
+            dependencies = _export(input_file, out_dir, **options) or dependencies
+            watcher.watch(dependencies, started)
+            if edit_time:
+                latency = (time.time() - edit_time) * 1000
+                print(f"Regenerated {latency:.0f} ms after the edit.")
+            cycles += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
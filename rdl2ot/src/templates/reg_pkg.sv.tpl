@@ -141,16 +141,23 @@ package {{ ip_name }}_reg_pkg;
   {%- set printed.header = false %}
     {%- set addr_width = interface.addr_width %}
     {%- for reg in registers %}
+      {%- if not printed.header %}
+
+  // Register offsets for {{ interface.name|lower}} interface
+        {%- set printed.header = true %}
+      {%- endif %}
+      {%- if generate_loops and reg.fits_generate_loop %}
+        {%- set reg_name = "{}_{}".format(ip_name, reg.name)|upper %}
+  parameter logic [{{ addr_with_name }}-1:0] {{ "{}_OFFSET = {}'h {:x}".format(reg_name, addr_width, reg.offsets.start) }};
+  parameter int unsigned      {{ reg_name }}_STRIDE = 'h {{ "{:x}".format(reg.offsets.step) }};
+  parameter int unsigned      {{ reg_name }}_COUNT  = {{ reg.offsets|length }};
+      {%- else %}
       {%- for offset in reg.offsets %}
         {%- set index = "_{}".format(loop.index0) if reg.offsets|length > 1 %}
         {%- set offset_name = "{}_{}{}_OFFSET".format(ip_name, reg.name, index)|upper %}
-        {%- if not printed.header %}
-
-  // Register offsets for {{ interface.name|lower}} interface
-          {%- set printed.header = true %}
-        {%- endif %}
   parameter logic [{{ addr_with_name }}-1:0] {{ "{} = {}'h {:x}".format(offset_name, addr_width, offset) }};
       {%- endfor %}
+      {%- endif %}
     {%- endfor %}
 
   {%- if registers|length > 0 %}
@@ -167,7 +174,7 @@ package {{ ip_name }}_reg_pkg;
           {%- set regname = (reg.name ~ index)|upper %}
   parameter logic {{ "[{}:0] {}_{}_RESVAL = {}'h {:x}".format(reg.msb, ip_name|upper, regname, reg.msb + 1, reg.reset) }};
           {%- for field in reg.fields  %}
-            {%- if 'reset' in field %}
+            {%- if field.reset is not none %}
   parameter logic {{ "[{}:0] {}_{}_{}{}_RESVAL = {}'h {:x}".format(field.width - 1, ip_name|upper, regname, field.name|upper, index, field.width, field.reset) }};
             {%- endif -%}
           {%- endfor %}
@@ -10,7 +10,6 @@
 {%- set has_windows = windows|length > 0 %}
 {%- set has_regs = registers|length > 0 %}
 {%- set interface_name = ("_" + interface.name|lower) if interface.name %}
-{%- set num_regs_digits = interface.num_regs | string | length %}
 {%- set clk_name = "aon_" %}
 
 module {{ ip_name|lower }}{{interface_name}}_reg_top (
@@ -275,35 +274,48 @@ module {{ ip_name|lower }}{{interface_name}}_reg_top (
   // Format: <reg>_<field>_{wd|we|qs}
   //        or <reg>_{wd|we|qs} if field == 1 or 0
 {%- endif %}
-{%- for reg in registers  %}
-  {%- for offset in reg.offsets %}
-    {%- set multireg_idx = loop.index0 %}
-    {%- set reg_suffix = ('_' ~ multireg_idx|string) if reg.offsets|length > 1 %}
+{%- for reg_plan in plan.regs  %}{%- set reg = reg_plan.reg %}
+  {%- if reg_plan.loop %}
+    {%- set lp = reg_plan.loop %}
+    {%- set field = reg.fields[0] %}
     {%- if reg.needs_read_en %}
-  logic {{ reg.name|lower }}{{ reg_suffix }}_re;
+  logic {{ reg_plan.name }}_re{{ lp.array }};
     {%- endif %}
     {%- if reg.needs_write_en %}
-  logic {{ reg.name|lower }}{{ reg_suffix }}_we;
+  logic {{ reg_plan.name }}_we{{ lp.array }};
     {%- endif %}
-    {%- for field in reg.fields %}
-      {%- set field_name = ('_' ~ field.name|lower ~ reg_suffix) if reg.is_multifields %}
-      {%- set width = "[{}:0] ".format(field.width - 1) if field.width > 1 %}
+    {%- if field.sw_readable %}
+  logic {{ lp.width ~ reg_plan.name }}_qs{{ lp.array }};
+    {%- endif %}
+    {%- if field.sw_writable %}
+  logic {{ lp.width ~ reg_plan.name }}_wd{{ lp.array }};
+    {%- endif %}
+  {%- else %}
+  {%- for elem in reg_plan.elements %}
+    {%- if reg.needs_read_en %}
+  logic {{ elem.name }}_re;
+    {%- endif %}
+    {%- if reg.needs_write_en %}
+  logic {{ elem.name }}_we;
+    {%- endif %}
+    {%- for fp in elem.fields %}{%- set field = fp.field %}
       {%- if not reg.async_clk and field.sw_readable %} 
-  logic {{ width ~ reg.name|lower ~ reg_suffix ~ field_name }}_qs;
+  logic {{ fp.width ~ fp.name }}_qs;
       {%- endif %}
       {%- if not reg.async_clk and field.sw_writable %} 
-  logic {{ width ~ reg.name|lower ~ reg_suffix ~ field_name }}_wd;
+  logic {{ fp.width ~ fp.name }}_wd;
       {%- endif %}
       {%- if reg.shadowed and not reg.external %}
-  logic {{ reg.name|lower ~ reg_suffix ~ field_name }}_storage_err;
-  logic {{ reg.name|lower ~ reg_suffix ~ field_name }}_update_err;
+  logic {{ fp.name }}_storage_err;
+  logic {{ fp.name }}_update_err;
       {%- endif %}
     {%- endfor %}
     {%- if reg.async_clk %} 
-  logic [{{ reg.msb }}:0] {{reg.name|lower ~ reg_suffix }}_qs;
-  logic {{ reg.name|lower ~ reg_suffix }}_busy;
+  logic [{{ reg.msb }}:0] {{ elem.name }}_qs;
+  logic {{ elem.name }}_busy;
     {%- endif %}
   {%- endfor %}
+  {%- endif %}
 {%- endfor %}
 
 {%- if interface.any_async_clk %}
@@ -311,40 +323,22 @@ module {{ ip_name|lower }}{{interface_name}}_reg_top (
   // Define register CDC handling.
   // CDC handling is done on a per-reg instead of per-field boundary.
 {{ space }}  
-  {%- for reg in registers  %}
+  {%- for reg_plan in plan.regs  %}{%- set reg = reg_plan.reg %}
     {%- if reg.async_clk %} 
-      {%- for offset in reg.offsets %}
-
-        {%- set multireg_idx = loop.index0 %}
-        {%- set index = ('_' ~ multireg_idx|string) if reg.offsets|length > 1 %}
-        {%- set sig_name = (clk_name ~ reg.name ~ index)|lower %}
-
-        {%- set src_we_expr = "{}_we".format(reg.name|lower ~ index) if reg.needs_write_en else "'0" %}
-        {%- set src_wd_expr = "reg_wdata[{}:0]".format(reg.msb) if reg.needs_write_en else "'0" %}
-        {%- set src_re_expr = "{}_re".format(reg.name|lower ~ index) if reg.needs_read_en else "'0" %}
-        {%- set src_regwen_expr = "{}_qs".format(reg.fields[0].write_en_signal.parent_name|lower) if reg.sw_write_en else "'0" %}
-        {%- set dst_we_expr = "{}_we".format(sig_name) if reg.needs_write_en %}
-        {%- set dst_wd_expr = "{}_wdata".format(sig_name) if reg.needs_write_en %}
-        {%- set dst_re_expr = "{}_re".format(sig_name) if reg.needs_read_en %}
-        {%- set dst_qe_expr = "{}_qe".format(sig_name) if reg.hw_writable else "'0" %}
-        {%- set dst_wr_req = "1" if reg.hw_writable else "0" %}
-        {%- set dst_ds_expr = "{}_ds".format(sig_name) if reg.hw_writable else "'0" %}
-        {%- set dst_regwen_expr = "{}_regwen".format(sig_name) if reg.sw_write_en %}
-        {%- set reset_expr = "{}'h{:x}".format(reg.msb + 1, reg.reset)  %}
-
-        {%- for field in reg.fields %}
-          {%- set bit_index = "[{}:0] ".format(field.width - 1) if field.msb != field.lsb %}
-          {%- set field_name = ('_' ~ field.name|lower ~ index) if reg.is_multifields %}
+      {%- for elem in reg_plan.elements %}
+        {%- set sig_name = elem.cdc_name %}
+
+        {%- for fp in elem.fields %}
           {%- if reg.hw_writable %}
-  logic {{ bit_index }} {{ (sig_name ~ field_name)|lower }}_ds_int;
+  logic {{ fp.cdc_width }} {{ fp.cdc_name }}_ds_int;
           {%- endif %}
-          {%- if field.sw_readable %}
-  logic {{ bit_index }} {{ (sig_name ~ field_name)|lower }}_qs_int;
+          {%- if fp.field.sw_readable %}
+  logic {{ fp.cdc_width }} {{ fp.cdc_name }}_qs_int;
           {%- endif %}
         {%- endfor %}
         {%- if reg.hw_writable %}
   logic [{{ reg.msb }}:0] {{ sig_name }}_ds;
-  logic {{ dst_qe_expr }};
+  logic {{ elem.dst_qe }};
         {%- endif %}
   logic [{{ reg.msb }}:0] {{ sig_name }}_qs;
         {%- if reg.needs_write_en %}
@@ -353,55 +347,52 @@ module {{ ip_name|lower }}{{interface_name}}_reg_top (
   logic unused_{{ sig_name }}_wdata;
         {%- endif %}
         {%- if reg.needs_read_en %}
-  logic {{ dst_re_expr }};
+  logic {{ elem.dst_re }};
         {%- endif %}
         {%- if reg.sw_write_en %}
-  logic {{ dst_regwen_expr }};
+  logic {{ elem.dst_regwen }};
         {%- endif %}
 
   always_comb begin
-    {{ sig_name }}_qs = {{ reset_expr }};
+    {{ sig_name }}_qs = {{ elem.reset }};
         {%- if reg.hw_writable %}
-    {{ dst_ds_expr }} = {{ reset_expr }};
+    {{ elem.dst_ds }} = {{ elem.reset }};
         {%- endif %}
-        {%- for field in reg.fields %}
-          {%- set bits = "{}:{}".format(field.msb, field.lsb) if field.msb != field.lsb else field.msb %}
-          {%- set bit_index = "[{}]".format(bits) if reg.is_multifields %}
-          {%- set field_name = ('_' ~ field.name|lower ~ index) if reg.is_multifields %}
+        {%- for fp in elem.fields %}
 
-          {%- if reg.hw_writable and field.sw_readable %}
-    {{ dst_ds_expr }}{{ bit_index }} = {{ sig_name ~ field_name}}_ds_int;
+          {%- if reg.hw_writable and fp.field.sw_readable %}
+    {{ elem.dst_ds }}{{ fp.cdc_index }} = {{ fp.cdc_name }}_ds_int;
           {%- endif %}
 
-          {%- if field.sw_readable %}
-    {{ sig_name }}_qs{{ bit_index }} = {{ sig_name  ~ field_name}}_qs_int;
+          {%- if fp.field.sw_readable %}
+    {{ sig_name }}_qs{{ fp.cdc_index }} = {{ fp.cdc_name }}_qs_int;
           {%- endif %}
         {%- endfor %}
   end
 
   prim_reg_cdc #(
     .DataWidth({{ reg.msb + 1 }}),
-    .ResetVal({{ reset_expr }}),
-    .BitMask({{ "{}'h{:x}".format(reg.msb + 1, reg.bitmask) }}),
-    .DstWrReq({{ dst_wr_req }})
-  ) u_{{ reg.name|lower ~ index }}_cdc (
+    .ResetVal({{ elem.reset }}),
+    .BitMask({{ elem.bitmask }}),
+    .DstWrReq({{ elem.dst_wr_req }})
+  ) u_{{ elem.name }}_cdc (
     .clk_src_i    (clk_i),
     .rst_src_ni   (rst_ni),
     .clk_dst_i    (clk_{{ clk_name }}i),
     .rst_dst_ni   (rst_{{ clk_name }}ni),
-    .src_regwen_i ({{ src_regwen_expr }}),
-    .src_we_i     ({{ src_we_expr }}),
-    .src_re_i     ({{ src_re_expr }}),
-    .src_wd_i     ({{ src_wd_expr }}),
-    .src_busy_o   ({{ reg.name|lower ~ index }}_busy),
-    .src_qs_o     ({{ reg.name|lower ~ index }}_qs), // for software read back
-    .dst_update_i ({{ dst_qe_expr }}),
-    .dst_ds_i     ({{ dst_ds_expr }}),
+    .src_regwen_i ({{ elem.src_regwen }}),
+    .src_we_i     ({{ elem.src_we }}),
+    .src_re_i     ({{ elem.src_re }}),
+    .src_wd_i     ({{ elem.src_wd }}),
+    .src_busy_o   ({{ elem.name }}_busy),
+    .src_qs_o     ({{ elem.name }}_qs), // for software read back
+    .dst_update_i ({{ elem.dst_qe }}),
+    .dst_ds_i     ({{ elem.dst_ds }}),
     .dst_qs_i     ({{ sig_name }}_qs),
-    .dst_we_o     ({{ dst_we_expr }}),
-    .dst_re_o     ({{ dst_re_expr }}),
-    .dst_regwen_o ({{ dst_regwen_expr }}),
-    .dst_wd_o     ({{ dst_wd_expr }})
+    .dst_we_o     ({{ elem.dst_we }}),
+    .dst_re_o     ({{ elem.dst_re }}),
+    .dst_regwen_o ({{ elem.dst_regwen }}),
+    .dst_wd_o     ({{ elem.dst_wd }})
   );
         {%- if reg.needs_write_en %}
   assign unused_{{ sig_name }}_wdata =
@@ -418,16 +409,88 @@ module {{ ip_name|lower }}{{interface_name}}_reg_top (
   // Register instances
 {%- endif %}
 
-{%- set assign = namespace(expr="") %}
-{%- for reg in registers  %}
+{%- for reg_plan in plan.regs  %}{%- set reg = reg_plan.reg %}
 {{- space }}
-  {%- for offset in reg.offsets %}
-    {%- set multireg_idx = loop.index0 if reg.is_multireg %}
-    {%- set multireg_suffix = "_{}".format(multireg_idx) if reg.offsets|length > 1 %}
-    {%- set regname = reg.name|lower ~ multireg_suffix %}
-    {%- set clk_prefix = clk_name if reg.async_clk %}
+  {%- if reg_plan.loop %}
+    {%- set lp = reg_plan.loop %}
+    {%- set name = reg_plan.name %}
+    {%- set field = reg.fields[0] %}
+
+  // Multireg {{ name }}, {{ lp.size }} subregisters
+  // R[{{ name }}]: V({{ reg.external }})
+    {%- if reg.needs_qe %}
+  logic {{ name }}_qe{{ lp.array }};
+    {%- endif %}
+    {%- if reg.needs_int_qe %}
+  logic {{ lp.flds_we_decl }}_flds_we{{ lp.array }};
+    {%- endif %}
+    {%- if reg.sw_write_en and reg.needs_write_en %}
+  logic {{ name }}_gated_we{{ lp.array }};
+    {%- endif %}
+  for (genvar i = 0; i < {{ lp.size }}; i++) begin : gen_{{ name }}
+    {%- if reg.needs_qe  %}
+      {%- if reg.external %}
+        {%- if reg.fields_no_write_en > 0 %}
+    // This ignores QEs that are set to constant 0 due to read-only fields.
+    logic unused_flds_we;
+    assign unused_flds_we = {{ lp.unused_flds_we }};
+        {%- endif %}
+    assign {{ name }}_qe[i] = {{ lp.qe_expr }};
+      {%- else %}
+    prim_flop #(
+      .Width(1),
+      .ResetValue(0)
+    ) u_{{ name }}_qe (
+      .clk_i(clk_i),
+      .rst_ni(rst_ni),
+      .d_i({{ lp.flop_d }}),
+      .q_o({{ name }}_qe[i])
+    );
+      {%- endif %}
+    {%- endif %}
+    {%- if reg.sw_write_en and reg.needs_write_en %}
+    // Create REGWEN-gated WE signal
+    assign {{ name }}_gated_we[i] = {{ name }}_we[i] & {{ lp.regwen_expr }};
+    {%- endif %}
+    prim_subreg{{ '_ext' if reg.external }} #(
+      .DW    ({{ field.width }})
+    {%- if not reg.external -%}
+      ,
+      .SwAccess(prim_subreg_pkg::SwAccess{{ field.reggen_sw_access }}),
+      .RESVAL  ({{ lp.resval }}),
+      .Mubi    (1'b{{ ("MultiBitBool" in field.encode)|int }})
+    {%- endif %}
+    ) u_{{ name }} (
+    {%- if not reg.external %}
+      .clk_i   (clk_i),
+      .rst_ni  (rst_ni),
+    {%- else %}
+      .re     ({{ lp.re_port }}),
+    {%- endif %}
+      .we     ({{ lp.we_port }}),
+      .wd     ({{ lp.wd_port }}),
+    {%- if not reg.external %}
+      .de     ({{ lp.de_port }}),
+    {%- endif %}
+      .d      ({{ lp.d_port }}),
+    {%- if reg.external %}
+      .qre    ({{ lp.qre_port }}),
+    {%- endif %}
+      .qe     ({{ lp.qe_port }}),
+      .q      ({{ lp.q_port }}),
+      .ds     (),
+      .qs     ({{ lp.qs_port }})
+    );
+    {%- if field.hw_readable and field.swmod %}
+    assign reg2hw.{{ name }}[i].qe = {{ name }}_qe[i];
+    {%- endif %}
+  end : gen_{{ name }}
+{{ space }}
+  {%- else %}
+  {%- for elem in reg_plan.elements %}
+    {%- set regname = elem.name %}
     {%- if reg.is_multireg %}
-  // Subregister {{multireg_idx}} of Multireg {{ reg.name|lower }}
+  // Subregister {{ loop.index0 }} of Multireg {{ reg_plan.name }}
     {%- endif %}
 {{- space }}
   // R[{{ regname }}]: V({{ reg.external }})
@@ -435,91 +498,73 @@ module {{ ip_name|lower }}{{interface_name}}_reg_top (
   logic {{ regname }}_qe;
     {%- endif %}
     {%- if reg.needs_int_qe %}
-  logic {{ '[{}:0] {}'.format(reg.fields|length - 1, regname) }}_flds_we;
+  logic {{ elem.flds_we_decl }}_flds_we;
     {%- endif %}
     {%- if reg.needs_qe  %}
       {%- if reg.external %}
         {%- if reg.fields_no_write_en > 0 %}
   // This ignores QEs that are set to constant 0 due to read-only fields.
-  logic unused_{{ reg.name|lower }}_flds_we;
-  assign unused_{{ reg.name|lower }}_flds_we = {{ "^({}_flds_we & {}'h{:x})".format(reg.name|lower, reg.fields|length, reg.fields_no_write_en ) }};
+  logic unused_{{ reg_plan.name }}_flds_we;
+  assign unused_{{ reg_plan.name }}_flds_we = {{ reg_plan.unused_flds_we }};
       {%- endif %}
-      {%- set right_expr = "{}_flds_we".format(regname) %}
-      {%- set right_expr = right_expr ~ (" | {}'h{:x}".format(reg.fields|length, reg.fields_no_write_en ) if reg.fields_no_write_en > 0) %}
-  assign {{regname }}_qe = &{{ "({})".format(right_expr) if reg.fields_no_write_en > 0 else "{}".format(right_expr) }};
+  assign {{regname }}_qe = {{ elem.qe_expr }};
       {%- else %}
   prim_flop #(
     .Width(1),
     .ResetValue(0)
-  ) u_{{ reg.name|lower ~ loop.index0}}_qe (
+  ) {{ elem.flop_name }} (
     .clk_i(clk_i),
     .rst_ni(rst_ni),
-    .d_i(&({{ regname }}_flds_we {{"| {}'h{:x}".format(reg.fields|length, reg.fields_no_write_en) if reg.fields_no_write_en }})),
+    .d_i({{ elem.flop_d }}),
     .q_o({{ regname }}_qe)
   );
       {%- endif %}
     {%- endif %}
     {%- if reg.async_clk and reg.hw_writable %}
-  assign {{clk_prefix ~ regname }}_qe = |{{"{}".format(regname) }}_flds_we;
+  assign {{ elem.clk_name }}_qe = |{{ regname }}_flds_we;
     {%- endif %}
     {%- if reg.sw_write_en and reg.needs_write_en %}
   // Create REGWEN-gated WE signal
-  logic {{clk_prefix ~ regname }}_gated_we;
-      {%- set assign.expr = (clk_prefix ~ regname ~ '_we')|lower %}
-      {%- if reg.sw_write_en %}
-        {%- set wr_en_sig_name = reg.fields[0].write_en_signal.name|lower %}
-        {%- set wr_en_reg_name = reg.fields[0].write_en_signal.parent_name|lower %}
-        {%- set assign.expr = (clk_prefix ~ regname|lower ~ '_regwen') if reg.async_clk else "{}_qs".format(wr_en_reg_name) %}
-        {%- if "MultiBitBool" in reg.fields[0].write_en_signal.encode %}
-          {%- set width = reg.fields[0].write_en_signal.width %}
-          {%- set assign.expr = "prim_mubi_pkg::mubi{}_test_true_strict(prim_mubi_pkg::mubi{}_t'({}_qs))".format(width, width, wr_en_sig_name)|lower %}
-        {%- endif %}
-      {%- endif %}
-  assign {{ clk_prefix ~ regname }}_gated_we = {{ clk_prefix ~ regname }}_we & {{ assign.expr }};
+  logic {{ elem.clk_name }}_gated_we;
+  assign {{ elem.clk_name }}_gated_we = {{ elem.clk_name }}_we & {{ elem.regwen_expr }};
     {%- endif %}
-    {%- for field in reg.fields  %}
-      {%- set field_name = "_{}{}".format(field.name, multireg_suffix)|lower if reg.is_multifields %}
-      {%- set property = ".{}".format(field.name)|lower if reg.is_multifields and not reg.is_homogeneous %}
-      {%- set bit_index = "[{}:{}]".format(field.msb, field.lsb) if field.msb != field.lsb else "[{}]".format(field.msb) %}
+    {%- for fp in elem.fields  %}{%- set field = fp.field %}
       {%- if reg.is_multifields %}
-  //   F{{ '[{}{}]: {}:{}'.format(field.name, multireg_suffix, field.msb, field.lsb)|lower }}
+  //   F{{ fp.comment }}
       {%- endif %}
-  prim_subreg{{ '_ext' if reg.external else ('_shadow' if reg.shadowed) }} #(
+  {{ reg_plan.subreg }} #(
     .DW    ({{ field.width }})
       {%- if not reg.external -%}
     ,
     .SwAccess(prim_subreg_pkg::SwAccess{{ field.reggen_sw_access }}),
-    .RESVAL  ({{ "{}'h{:x}".format(field.width, (field.reset if field.reset else 0)) }}),
+    .RESVAL  ({{ fp.resval }}),
     .Mubi    (1'b{{ ("MultiBitBool" in field.encode)|int }})
       {%- endif %}
-  ) u_{{ regname ~ field_name }} (
+  ) u_{{ fp.name }} (
       {%- if not reg.external %}
-    .clk_i   (clk_{{ clk_prefix if reg.async_clk }}i),
-    .rst_ni  (rst_{{ clk_prefix if reg.async_clk }}ni),
+    .clk_i   (clk_{{ elem.clk_prefix }}i),
+    .rst_ni  (rst_{{ elem.clk_prefix }}ni),
       {%- if reg.shadowed %}
     .rst_shadowed_ni (rst_shadowed_ni),
       {%- endif %}
       {%- endif %}
 {{- space }}
-    {%- set idx = loop.index0 if reg.is_homogeneous and reg.is_multifields else multireg_idx %}
-    {%- set sig_name = (reg.name ~ ("[{}]".format(idx) if reg.is_multireg) ~ property)|lower -%}
-    {%- set suffix = "_int" if reg.async_clk %}
       {%- if reg.external or reg.shadowed %}
-    .re     ({{ "{}{}{}_re".format(clk_prefix, reg.name, multireg_suffix)|lower if field.sw_readable or reg.shadowed else "1'b0" }}),
+    .re     ({{ fp.re_port }}),
       {%- endif %}
-    .we     ({{ "{}{}_{}".format(clk_prefix ~ regname, ("_gated" if field.sw_write_en), "re" if field.clear_onread  else "we") if field.sw_writable else "1'b0"  }}),
-    .wd     ({{ "{}{}{}_wd{}{}".format(clk_prefix, regname, field_name if not reg.async_clk, "ata" if reg.async_clk, bit_index if reg.async_clk) if field.sw_writable else "'0"  }}),
+    .we     ({{ fp.we_port }}),
+    .wd     ({{ fp.wd_port }}),
       {%- if not reg.external %}
-    .de     ({{ "hw2reg.{}.de".format(sig_name ) if field.hw_writable else "1'b0" }}),
+    .de     ({{ fp.de_port }}),
       {%- endif %}
-    .d      ({{ "hw2reg.{}.d".format(sig_name ) if field.hw_writable else "'0" }}),
+    .d      ({{ fp.d_port }}),
       {%- if reg.external %}
-    .qre    ({{  "reg2hw.{}.re".format(sig_name) if reg.hwre or reg.shadowed }}),
+    .qre    ({{ fp.qre_port }}),
       {%- endif %}
-    .qe     ({{ "{}_flds_we[{}]".format(regname, loop.index0) if reg.needs_int_qe  }}),
-    .q      ({{ "reg2hw.{}.q".format(sig_name) if field.hw_readable }}),
-    .ds     ({{ "{}{}{}_ds{}".format(clk_prefix, regname, field_name, suffix) if reg.async_clk and reg.hw_writable }}),
-    .qs     ({{ "{}{}_qs{}".format(clk_prefix, regname ~ field_name, suffix) if field.sw_readable }})
+    .qe     ({{ fp.qe_port }}),
+    .q      ({{ fp.q_port }}),
+    .ds     ({{ fp.ds_port }}),
+    .qs     ({{ fp.qs_port }})
       {%- if not reg.external and reg.shadowed -%}
       ,
 
@@ -527,125 +572,217 @@ module {{ ip_name|lower }}{{interface_name}}_reg_top (
     .phase  (),
 
     // Shadow register error conditions
-        {%- if reg.async_clk %}
-    .err_update  (async_{{ regname ~ field_name }}_err_update),
-    .err_storage (async_{{ regname ~ field_name }}_err_storage)
-        {%- else %}
-    .err_update  ({{ regname ~ field_name }}_update_err),
-    .err_storage ({{ regname ~ field_name }}_storage_err)
-        {%- endif %}
+    .err_update  ({{ fp.err_update }}),
+    .err_storage ({{ fp.err_storage }})
       {%- endif %}
   );
     {%- if field.hw_readable and field.swmod %}
-  assign reg2hw.{{ sig_name }}.qe = {{ regname }}_qe;
+  assign reg2hw.{{ fp.sig_name }}.qe = {{ regname }}_qe;
     {%- endif %}
 {{- space }}
 {{ space }}
     {%- endfor %}
 {{ space }}
   {%- endfor %}
+  {%- endif %}
 {%- endfor %}
 
 {%- if has_regs %}
 
   logic [{{interface.num_regs - 1 }}:0] addr_hit;
+  {%- if interface.decoder != "flat" %}
+  {%- set idx_width = plan.reg_idx_width %}
+  logic [{{ idx_width - 1 }}:0] reg_idx;
+  {%- endif %}
+  {%- if interface.decoder == "dense" %}
+  // The registers are contiguous, the address is decoded by indexing them by word.
+  logic [AW-1:0] reg_offset;
+  assign reg_offset = reg_addr - AW'({{ registers[0].offsets[0] }});
+  assign reg_idx = {{ idx_width }}'(reg_offset[AW-1:{{ word_bits }}]);
   always_comb begin
-  {%- set ns = namespace(counter=0) %}
-  {%- for reg in registers %}
-    {%- for offset in reg.offsets %}
-      {%- set index = "{num:>{width}}".format(num=ns.counter, width=num_regs_digits) %}
-      {%- set ns.counter = ns.counter + 1 %}
-    addr_hit[{{ index }}] = (reg_addr == {{ (ip_name ~ '_' ~ reg.name)|upper }}{% if reg.offsets|length > 1 %}_{{ loop.index0 }}{% endif %}_OFFSET);
+    addr_hit = '0;
+    if (reg_offset[{{ word_bits - 1 }}:0] == '0 && reg_offset[AW-1:{{ word_bits }}] < {{ interface.num_regs }}) begin
+      addr_hit[reg_idx] = 1'b1;
+    end
+  end
+  {%- elif interface.decoder == "paged" %}
+  // The registers are sparse, the address is decoded by page first.
+  always_comb begin
+    addr_hit = '0;
+    reg_idx = '0;
+    unique case (reg_addr[AW-1:{{ page_bits }}])
+    {%- for page, hits in interface.decoder_pages %}
+      {{ page }}: begin
+        unique case (reg_addr[{{ page_bits - 1 }}:0])
+      {%- for index, offset in hits %}
+          {{ page_bits }}'h{{ "{:x}".format(offset) }}: begin
+            addr_hit[{{ index }}] = 1'b1;
+            reg_idx = {{ idx_width }}'d{{ index }};
+          end
+      {%- endfor %}
+          default: ;
+        endcase
+      end
+    {%- endfor %}
+      default: ;
+    endcase
+  end
+  {%- else %}
+  always_comb begin
+  {%- for reg_plan in plan.regs %}{%- set reg = reg_plan.reg %}
+    {%- if reg_plan.loop %}
+    for (int i = 0; i < {{ reg_plan.loop.size }}; i++) begin : addr_hit_{{ reg_plan.name }}
+      addr_hit[{{ reg_plan.index }} + i] = (reg_addr == AW'({{ reg_plan.loop.offset_name }} + i * {{ reg_plan.loop.stride_name }}));
+    end : addr_hit_{{ reg_plan.name }}
+    {%- else %}
+    {%- for elem in reg_plan.elements %}
+    addr_hit[{{ elem.padded_index }}] = (reg_addr == {{ elem.offset_name }});
     {%- endfor %}
+    {%- endif %}
   {%- endfor %}
   end
+  {%- endif %}
 
   assign addrmiss = (reg_re || reg_we) ? ~|addr_hit : 1'b0 ;
 
   // Check sub-word write is permitted
   always_comb begin
+  {%- if interface.decoder != "flat" %}
+    wr_err = reg_we & (|addr_hit) & (|({{ plan.permit }}[reg_idx] & ~reg_be));
+  {%- elif generate_loops %}
+    wr_err = 1'b0;
+    {%- for reg_plan in plan.regs %}
+      {%- if reg_plan.loop %}
+    for (int i = 0; i < {{ reg_plan.loop.size }}; i++) begin : wr_err_{{ reg_plan.name }}
+      wr_err |= addr_hit[{{ reg_plan.index }} + i] & (|({{ plan.permit }}[{{ reg_plan.index }} + i] & ~reg_be));
+    end : wr_err_{{ reg_plan.name }}
+      {%- else %}
+        {%- for elem in reg_plan.elements %}
+    wr_err |= addr_hit[{{ elem.index }}] & (|({{ plan.permit }}[{{ elem.index }}] & ~reg_be));
+        {%- endfor %}
+      {%- endif %}
+    {%- endfor %}
+    wr_err &= reg_we;
+  {%- else %}
     wr_err = (reg_we &
-  {%- set ns = namespace(counter=0) %}
-  {%- set interface_name = ("_" + interface.name|lower) if interface.name -%}
-  {%- for reg in registers %}
+  {%- for reg_plan in plan.regs %}
     {%- set outer_loop = loop -%}
-    {%- for offset in reg.offsets %}
-      {%- set index = "{num:>{width}}".format(num=ns.counter, width=num_regs_digits) %}
-      {%- set ns.counter = ns.counter + 1 %}
+    {%- for elem in reg_plan.elements %}
               {{"(" if loop.first and outer_loop.first else " " -}}
-               (addr_hit[{{ index }}] & (|({{ (ip_name ~ interface_name)|upper}}_PERMIT[{{ index }}] & ~reg_be))) 
+               (addr_hit[{{ elem.padded_index }}] & (|({{ plan.permit }}[{{ elem.padded_index }}] & ~reg_be))) 
       {%- if loop.last and outer_loop.last %}));{% else %} |{% endif %}
     {%- endfor %}
   {%- endfor %}
+  {%- endif %}
   end
 
   // Generate write-enables
-  {%- set ns = namespace(re_index=0) -%}
-  {%- for reg in registers  %}
-    {%- for offset in reg.offsets %}
-      {%- set reg_suffix = ('_' ~ loop.index0|string) if reg.offsets|length > 1 %}
-      {%- set regname = "{}{}".format(reg.name, reg_suffix)|lower %}
+  {%- for reg_plan in plan.regs  %}{%- set reg = reg_plan.reg %}
+    {%- if reg_plan.loop %}
+      {%- set name = reg_plan.name %}
+      {%- set field = reg.fields[0] %}
+  for (genvar i = 0; i < {{ reg_plan.loop.size }}; i++) begin : gen_{{ name }}_we
       {%- if reg.needs_read_en %}
-  assign {{ regname }}_re = addr_hit[{{ ns.re_index }}] & reg_re & !reg_error;
+    assign {{ name }}_re[i] = addr_hit[{{ reg_plan.index }} + i] & reg_re & !reg_error;
       {%- endif %}
       {%- if reg.needs_write_en %}
-  assign {{ regname }}_we = addr_hit[{{ ns.re_index }}] & reg_we & !reg_error;
+    assign {{ name }}_we[i] = addr_hit[{{ reg_plan.index }} + i] & reg_we & !reg_error;
       {%- endif %}
-      {%- set ns.re_index = ns.re_index + 1 %}
-      {%- for field in reg.fields %}
-        {%- if field.sw_writable and not reg.async_clk %}
-          {%- set field_name = ('_' ~ field.name|lower ~ reg_suffix) if reg.is_multifields %}
-          {%- set left_expr = "{}{}{}".format(reg.name, reg_suffix, field_name)|lower %}
-          {%- set bit_index = "{}:{}".format(field.msb, field.lsb) if field.width > 1 else field.msb %}
-          {%- set right_expr = "'1" if field.clear_onread else "reg_wdata[{}]".format(bit_index) %}
-  assign {{ left_expr }}_wd = {{ right_expr }};
+      {%- if field.sw_writable %}
+    assign {{ name }}_wd[i] = {{ reg_plan.loop.wd }};
+      {%- endif %}
+  end : gen_{{ name }}_we
+    {%- else %}
+    {%- for elem in reg_plan.elements %}
+      {%- if reg.needs_read_en %}
+  assign {{ elem.name }}_re = addr_hit[{{ elem.index }}] & reg_re & !reg_error;
+      {%- endif %}
+      {%- if reg.needs_write_en %}
+  assign {{ elem.name }}_we = addr_hit[{{ elem.index }}] & reg_we & !reg_error;
+      {%- endif %}
+      {%- for fp in elem.fields %}
+        {%- if fp.field.sw_writable and not reg.async_clk %}
+  assign {{ fp.name }}_wd = {{ fp.wd }};
         {%- endif %}
       {%- endfor %}
     {%- endfor %}
+    {%- endif %}
   {% endfor %}
 
   // Assign write-enables to checker logic vector.
   always_comb begin
-  {%- set ns = namespace(counter=0) %}
-  {%- for reg in registers %}
-    {%- for offset in reg.offsets %}
-      {%- set reg_suffix = ('_' ~ loop.index0|string) if reg.offsets|length > 1 %}
-      {%- set expr = "{}{}{}_we".format(reg.name, reg_suffix, "_gated" if not reg.async_clk and reg.sw_write_en)|lower if reg.needs_write_en else "1'b0" %}
-    reg_we_check[{{ ns.counter }}] = {{ expr }};
-      {%- set ns.counter = ns.counter + 1 %}
+  {%- for reg_plan in plan.regs %}{%- set reg = reg_plan.reg %}
+    {%- if reg_plan.loop %}
+    for (int i = 0; i < {{ reg_plan.loop.size }}; i++) begin : reg_we_check_{{ reg_plan.name }}
+      reg_we_check[{{ reg_plan.index }} + i] = {{ reg_plan.loop.we_check }};
+    end : reg_we_check_{{ reg_plan.name }}
+    {%- else %}
+    {%- for elem in reg_plan.elements %}
+    reg_we_check[{{ elem.index }}] = {{ elem.we_check }};
     {%- endfor %}
+    {%- endif %}
   {%- endfor %}
   end
 
   // Read data return
+  {%- if interface.decoder != "flat" %}
+  logic [DW-1:0] reg_rdata_all [{{ interface.num_regs }}];
+  always_comb begin
+    reg_rdata_all = '{default: '0};
+  {%- for reg_plan in plan.regs %}{%- set reg = reg_plan.reg %}
+    {%- if reg_plan.loop %}
+    for (int i = 0; i < {{ reg_plan.loop.size }}; i++) begin : reg_rdata_{{ reg_plan.name }}
+      reg_rdata_all[{{ reg_plan.index }} + i]{{ reg_plan.loop.rdata }};
+    end : reg_rdata_{{ reg_plan.name }}
+    {%- else %}
+    {%- for elem in reg_plan.elements %}
+      {%- if reg.async_clk %}
+    reg_rdata_all[{{ elem.index }}] = {{ elem.rdata_async }};
+      {%- else %}
+        {%- for fp in elem.fields %}
+    reg_rdata_all[{{ elem.index }}]{{ fp.rdata }};
+        {%- endfor %}
+      {%- endif %}
+    {%- endfor %}
+    {%- endif %}
+  {%- endfor %}
+  end
+  assign reg_rdata_next = (|addr_hit) ? reg_rdata_all[reg_idx] : '1;
+  {%- else %}
   always_comb begin
     reg_rdata_next = '0;
     unique case (1'b1)
-  {%- set ns = namespace(counter=0) %}
-  {%- for reg in registers %}
-    {%- for offset in reg.offsets %}
-      {%- set reg_suffix = ('_' ~ loop.index0|string) if reg.offsets|length > 1 and not (reg.is_homogeneous and reg.is_multifields)  %}
-      addr_hit[{{ ns.counter }}]: begin
-      {%- set ns.counter = ns.counter + 1 %}
+  {%- for reg_plan in plan.regs %}{%- set reg = reg_plan.reg %}
+    {%- if reg_plan.loop %}
+      |addr_hit[{{ reg_plan.index + reg_plan.loop.size - 1 }}:{{ reg_plan.index }}]: begin
+        for (int i = 0; i < {{ reg_plan.loop.size }}; i++) begin : reg_rdata_{{ reg_plan.name }}
+          if (addr_hit[{{ reg_plan.index }} + i]) begin
+            reg_rdata_next{{ reg_plan.loop.rdata }};
+          end
+        end : reg_rdata_{{ reg_plan.name }}
+      end
+{{ space }}
+    {%- else %}
+    {%- for elem in reg_plan.elements %}
+      addr_hit[{{ elem.index }}]: begin
       {%- if reg.async_clk %}
-        reg_rdata_next = DW'({{ "{}{}_qs".format(reg.name, reg_suffix)|lower }});
+        reg_rdata_next = {{ elem.rdata_async }};
       {%- else %}
-        {%- for field in reg.fields %}
-            {%- set field_name = ('_' ~ field.name|lower ~ reg_suffix) if reg.is_multifields %}
-            {%- set index = "{}:{}".format(field.msb, field.lsb) if field.width > 1 else field.msb %}
-            {%- set expr = "{}{}{}_qs".format(reg.name, reg_suffix, field_name)|lower if field.sw_readable else "'0" %}
-        reg_rdata_next{{ "[{}] = {}".format(index, expr)|lower }};
+        {%- for fp in elem.fields %}
+        reg_rdata_next{{ fp.rdata }};
         {%- endfor %}
       {%- endif %}
       end
 {{ space }}
     {%- endfor -%}
+    {%- endif %}
   {%- endfor %}
       default: begin
         reg_rdata_next = '1;
       end
     endcase
   end
+  {%- endif %}
 
   // shadow busy
   logic shadow_busy;
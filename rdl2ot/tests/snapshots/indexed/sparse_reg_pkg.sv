@@ -0,0 +1,90 @@
+// Copyright lowRISC contributors (OpenTitan project).
+// Licensed under the Apache License, Version 2.0, see LICENSE for details.
+// SPDX-License-Identifier: Apache-2.0
+//
+// Register Package auto-generated by `rdl2ot` containing data structure
+
+package sparse_reg_pkg;
+
+  // Address widths within the block
+  parameter int BlockAw = 13;
+
+  // Number of registers for every interface
+  parameter int NumRegs = 6;
+
+  ///////////////////////////////////////////////
+  // Typedefs for registers for  interface //
+  ///////////////////////////////////////////////
+
+  typedef struct packed {
+    logic        q;
+  } sparse_reg2hw_ctrl0_reg_t;
+
+  typedef struct packed {
+    struct packed {
+      logic [3:0]  q;
+    } mode;
+  } sparse_reg2hw_mode_reg_t;
+
+  typedef struct packed {
+    logic        q;
+  } sparse_reg2hw_ctrl1_mreg_t;
+
+  typedef struct packed {
+    logic        q;
+  } sparse_reg2hw_ctrl2_reg_t;
+
+  typedef struct packed {
+    logic        q;
+  } sparse_reg2hw_ctrl3_reg_t;
+
+  typedef struct packed {
+    struct packed {
+      logic [3:0]  d;
+      logic        de;
+    } state;
+  } sparse_hw2reg_mode_reg_t;
+
+  // Register -> HW type for  interface
+  typedef struct packed {
+    sparse_reg2hw_ctrl0_reg_t ctrl0;
+    sparse_reg2hw_mode_reg_t mode;
+    sparse_reg2hw_ctrl1_mreg_t [1:0] ctrl1;
+    sparse_reg2hw_ctrl2_reg_t ctrl2;
+    sparse_reg2hw_ctrl3_reg_t ctrl3;
+  } sparse_reg2hw_t;
+
+  // HW -> register type for  interface
+  typedef struct packed {
+    sparse_hw2reg_mode_reg_t mode;
+  } sparse_hw2reg_t;
+
+  // Register offsets for  interface
+  parameter logic [BlockAw-1:0] SPARSE_CTRL0_OFFSET = 13'h 0;
+  parameter logic [BlockAw-1:0] SPARSE_MODE_OFFSET = 13'h 4;
+  parameter logic [BlockAw-1:0] SPARSE_CTRL1_0_OFFSET = 13'h 8;
+  parameter logic [BlockAw-1:0] SPARSE_CTRL1_1_OFFSET = 13'h c;
+  parameter logic [BlockAw-1:0] SPARSE_CTRL2_OFFSET = 13'h 400;
+  parameter logic [BlockAw-1:0] SPARSE_CTRL3_OFFSET = 13'h 1004;
+
+  // Register index for  interface
+  typedef enum int {
+    SPARSE_CTRL0,
+    SPARSE_MODE,
+    SPARSE_CTRL1_0,
+    SPARSE_CTRL1_1,
+    SPARSE_CTRL2,
+    SPARSE_CTRL3
+  } sparse_id_e;
+
+  // Register width information to check illegal writes for  interface
+  parameter logic [3:0] SPARSE_PERMIT [6] = '{
+    4'b 0001, // index[0] SPARSE_CTRL0
+    4'b 0011, // index[1] SPARSE_MODE
+    4'b 0001, // index[2] SPARSE_CTRL1_0
+    4'b 0001, // index[3] SPARSE_CTRL1_1
+    4'b 0001, // index[4] SPARSE_CTRL2
+    4'b 0001  // index[5] SPARSE_CTRL3
+  };
+
+endpackage
\ No newline at end of file
@@ -0,0 +1,416 @@
+// Copyright lowRISC contributors (OpenTitan project).
+// Licensed under the Apache License, Version 2.0, see LICENSE for details.
+// SPDX-License-Identifier: Apache-2.0
+//
+// Register Top module auto-generated by `rdl2ot`
+
+`include "prim_assert.sv"
+
+module sparse_reg_top (
+  input clk_i,
+  input rst_ni,
+  input  tlul_pkg::tl_h2d_t tl_i,
+  output tlul_pkg::tl_d2h_t tl_o,
+  // To HW
+  output sparse_reg_pkg::sparse_reg2hw_t reg2hw, // Write
+  input  sparse_reg_pkg::sparse_hw2reg_t hw2reg, // Read
+
+  // Integrity check errors
+  output logic intg_err_o
+);
+
+  import sparse_reg_pkg::* ;
+
+  localparam int AW = 13;
+  localparam int DW = 32;
+  localparam int DBW = DW/8;                    // Byte Width
+
+  // register signals
+  logic           reg_we;
+  logic           reg_re;
+  logic [AW-1:0]  reg_addr;
+  logic [DW-1:0]  reg_wdata;
+  logic [DBW-1:0] reg_be;
+  logic [DW-1:0]  reg_rdata;
+  logic           reg_error;
+
+  logic          addrmiss, wr_err;
+
+  logic [DW-1:0] reg_rdata_next;
+  logic reg_busy;
+
+  tlul_pkg::tl_h2d_t tl_reg_h2d;
+  tlul_pkg::tl_d2h_t tl_reg_d2h;
+
+
+  // incoming payload check
+  logic intg_err;
+  tlul_cmd_intg_chk u_chk (
+    .tl_i(tl_i),
+    .err_o(intg_err)
+  );
+
+  // also check for spurious write enables
+  logic reg_we_err;
+  logic [5:0] reg_we_check;
+  prim_reg_we_check #(
+    .OneHotWidth(6)
+  ) u_prim_reg_we_check (
+    .clk_i(clk_i),
+    .rst_ni(rst_ni),
+    .oh_i  (reg_we_check),
+    .en_i  (reg_we && !addrmiss),
+    .err_o (reg_we_err)
+  );
+
+  logic err_q;
+  always_ff @(posedge clk_i or negedge rst_ni) begin
+    if (!rst_ni) begin
+      err_q <= '0;
+    end else if (intg_err || reg_we_err) begin
+      err_q <= 1'b1;
+    end
+  end
+
+  // integrity error output is permanent and should be used for alert generation
+  // register errors are transactional
+  assign intg_err_o = err_q | intg_err | reg_we_err;
+
+  // outgoing integrity generation
+  tlul_pkg::tl_d2h_t tl_o_pre;
+  tlul_rsp_intg_gen #(
+    .EnableRspIntgGen(1),
+    .EnableDataIntgGen(1)
+  ) u_rsp_intg_gen (
+    .tl_i(tl_o_pre),
+    .tl_o(tl_o)
+  );
+
+  assign tl_reg_h2d = tl_i;
+  assign tl_o_pre   = tl_reg_d2h;
+
+  tlul_adapter_reg #(
+    .RegAw(AW),
+    .RegDw(DW),
+    .EnableDataIntgGen(0)
+  ) u_reg_if (
+    .clk_i  (clk_i),
+    .rst_ni (rst_ni),
+
+    .tl_i (tl_reg_h2d),
+    .tl_o (tl_reg_d2h),
+
+    .en_ifetch_i(prim_mubi_pkg::MuBi4False),
+    .intg_error_o(),
+
+    .we_o    (reg_we),
+    .re_o    (reg_re),
+    .addr_o  (reg_addr),
+    .wdata_o (reg_wdata),
+    .be_o    (reg_be),
+    .busy_i  (reg_busy),
+    .rdata_i (reg_rdata),
+    .error_i (reg_error)
+  );
+
+  // cdc oversampling signals
+
+  assign reg_rdata = reg_rdata_next ;
+  assign reg_error = addrmiss | wr_err | intg_err;
+
+  // Define SW related signals
+  // Format: <reg>_<field>_{wd|we|qs}
+  //        or <reg>_{wd|we|qs} if field == 1 or 0
+  logic ctrl0_we;
+  logic ctrl0_qs;
+  logic ctrl0_wd;
+  logic mode_we;
+  logic [3:0] mode_mode_qs;
+  logic [3:0] mode_mode_wd;
+  logic [3:0] mode_state_qs;
+  logic ctrl1_0_we;
+  logic ctrl1_0_qs;
+  logic ctrl1_0_wd;
+  logic ctrl1_1_we;
+  logic ctrl1_1_qs;
+  logic ctrl1_1_wd;
+  logic ctrl2_we;
+  logic ctrl2_qs;
+  logic ctrl2_wd;
+  logic ctrl3_we;
+  logic ctrl3_qs;
+  logic ctrl3_wd;
+
+  // Register instances
+  // R[ctrl0]: V(False)
+  prim_subreg #(
+    .DW    (1),
+    .SwAccess(prim_subreg_pkg::SwAccessRW),
+    .RESVAL  (1'h0),
+    .Mubi    (1'b0)
+  ) u_ctrl0 (
+    .clk_i   (clk_i),
+    .rst_ni  (rst_ni),
+    .we     (ctrl0_we),
+    .wd     (ctrl0_wd),
+    .de     (1'b0),
+    .d      ('0),
+    .qe     (),
+    .q      (reg2hw.ctrl0.q),
+    .ds     (),
+    .qs     (ctrl0_qs)
+  );
+
+
+  // R[mode]: V(False)
+  //   F[mode]: 3:0
+  prim_subreg #(
+    .DW    (4),
+    .SwAccess(prim_subreg_pkg::SwAccessRW),
+    .RESVAL  (4'h3),
+    .Mubi    (1'b0)
+  ) u_mode_mode (
+    .clk_i   (clk_i),
+    .rst_ni  (rst_ni),
+    .we     (mode_we),
+    .wd     (mode_mode_wd),
+    .de     (1'b0),
+    .d      ('0),
+    .qe     (),
+    .q      (reg2hw.mode.mode.q),
+    .ds     (),
+    .qs     (mode_mode_qs)
+  );
+
+  //   F[state]: 11:8
+  prim_subreg #(
+    .DW    (4),
+    .SwAccess(prim_subreg_pkg::SwAccessRO),
+    .RESVAL  (4'h0),
+    .Mubi    (1'b0)
+  ) u_mode_state (
+    .clk_i   (clk_i),
+    .rst_ni  (rst_ni),
+    .we     (1'b0),
+    .wd     ('0),
+    .de     (hw2reg.mode.state.de),
+    .d      (hw2reg.mode.state.d),
+    .qe     (),
+    .q      (),
+    .ds     (),
+    .qs     (mode_state_qs)
+  );
+
+
+  // Subregister 0 of Multireg ctrl1
+  // R[ctrl1_0]: V(False)
+  prim_subreg #(
+    .DW    (1),
+    .SwAccess(prim_subreg_pkg::SwAccessRW),
+    .RESVAL  (1'h0),
+    .Mubi    (1'b0)
+  ) u_ctrl1_0 (
+    .clk_i   (clk_i),
+    .rst_ni  (rst_ni),
+    .we     (ctrl1_0_we),
+    .wd     (ctrl1_0_wd),
+    .de     (1'b0),
+    .d      ('0),
+    .qe     (),
+    .q      (reg2hw.ctrl1[0].q),
+    .ds     (),
+    .qs     (ctrl1_0_qs)
+  );
+
+
+  // Subregister 1 of Multireg ctrl1
+  // R[ctrl1_1]: V(False)
+  prim_subreg #(
+    .DW    (1),
+    .SwAccess(prim_subreg_pkg::SwAccessRW),
+    .RESVAL  (1'h0),
+    .Mubi    (1'b0)
+  ) u_ctrl1_1 (
+    .clk_i   (clk_i),
+    .rst_ni  (rst_ni),
+    .we     (ctrl1_1_we),
+    .wd     (ctrl1_1_wd),
+    .de     (1'b0),
+    .d      ('0),
+    .qe     (),
+    .q      (reg2hw.ctrl1[1].q),
+    .ds     (),
+    .qs     (ctrl1_1_qs)
+  );
+
+
+  // R[ctrl2]: V(False)
+  prim_subreg #(
+    .DW    (1),
+    .SwAccess(prim_subreg_pkg::SwAccessRW),
+    .RESVAL  (1'h0),
+    .Mubi    (1'b0)
+  ) u_ctrl2 (
+    .clk_i   (clk_i),
+    .rst_ni  (rst_ni),
+    .we     (ctrl2_we),
+    .wd     (ctrl2_wd),
+    .de     (1'b0),
+    .d      ('0),
+    .qe     (),
+    .q      (reg2hw.ctrl2.q),
+    .ds     (),
+    .qs     (ctrl2_qs)
+  );
+
+
+  // R[ctrl3]: V(False)
+  prim_subreg #(
+    .DW    (1),
+    .SwAccess(prim_subreg_pkg::SwAccessRW),
+    .RESVAL  (1'h0),
+    .Mubi    (1'b0)
+  ) u_ctrl3 (
+    .clk_i   (clk_i),
+    .rst_ni  (rst_ni),
+    .we     (ctrl3_we),
+    .wd     (ctrl3_wd),
+    .de     (1'b0),
+    .d      ('0),
+    .qe     (),
+    .q      (reg2hw.ctrl3.q),
+    .ds     (),
+    .qs     (ctrl3_qs)
+  );
+
+
+
+  logic [5:0] addr_hit;
+  logic [2:0] reg_idx;
+  // The registers are sparse, the address is decoded by page first.
+  always_comb begin
+    addr_hit = '0;
+    reg_idx = '0;
+    unique case (reg_addr[AW-1:8])
+      0: begin
+        unique case (reg_addr[7:0])
+          8'h0: begin
+            addr_hit[0] = 1'b1;
+            reg_idx = 3'd0;
+          end
+          8'h4: begin
+            addr_hit[1] = 1'b1;
+            reg_idx = 3'd1;
+          end
+          8'h8: begin
+            addr_hit[2] = 1'b1;
+            reg_idx = 3'd2;
+          end
+          8'hc: begin
+            addr_hit[3] = 1'b1;
+            reg_idx = 3'd3;
+          end
+          default: ;
+        endcase
+      end
+      4: begin
+        unique case (reg_addr[7:0])
+          8'h0: begin
+            addr_hit[4] = 1'b1;
+            reg_idx = 3'd4;
+          end
+          default: ;
+        endcase
+      end
+      16: begin
+        unique case (reg_addr[7:0])
+          8'h4: begin
+            addr_hit[5] = 1'b1;
+            reg_idx = 3'd5;
+          end
+          default: ;
+        endcase
+      end
+      default: ;
+    endcase
+  end
+
+  assign addrmiss = (reg_re || reg_we) ? ~|addr_hit : 1'b0 ;
+
+  // Check sub-word write is permitted
+  always_comb begin
+    wr_err = reg_we & (|addr_hit) & (|(SPARSE_PERMIT[reg_idx] & ~reg_be));
+  end
+
+  // Generate write-enables
+  assign ctrl0_we = addr_hit[0] & reg_we & !reg_error;
+  assign ctrl0_wd = reg_wdata[0];
+ 
+  assign mode_we = addr_hit[1] & reg_we & !reg_error;
+  assign mode_mode_wd = reg_wdata[3:0];
+ 
+  assign ctrl1_0_we = addr_hit[2] & reg_we & !reg_error;
+  assign ctrl1_0_wd = reg_wdata[0];
+  assign ctrl1_1_we = addr_hit[3] & reg_we & !reg_error;
+  assign ctrl1_1_wd = reg_wdata[0];
+ 
+  assign ctrl2_we = addr_hit[4] & reg_we & !reg_error;
+  assign ctrl2_wd = reg_wdata[0];
+ 
+  assign ctrl3_we = addr_hit[5] & reg_we & !reg_error;
+  assign ctrl3_wd = reg_wdata[0];
+ 
+
+  // Assign write-enables to checker logic vector.
+  always_comb begin
+    reg_we_check[0] = ctrl0_we;
+    reg_we_check[1] = mode_we;
+    reg_we_check[2] = ctrl1_0_we;
+    reg_we_check[3] = ctrl1_1_we;
+    reg_we_check[4] = ctrl2_we;
+    reg_we_check[5] = ctrl3_we;
+  end
+
+  // Read data return
+  logic [DW-1:0] reg_rdata_all [6];
+  always_comb begin
+    reg_rdata_all = '{default: '0};
+    reg_rdata_all[0][0] = ctrl0_qs;
+    reg_rdata_all[1][3:0] = mode_mode_qs;
+    reg_rdata_all[1][11:8] = mode_state_qs;
+    reg_rdata_all[2][0] = ctrl1_0_qs;
+    reg_rdata_all[3][0] = ctrl1_1_qs;
+    reg_rdata_all[4][0] = ctrl2_qs;
+    reg_rdata_all[5][0] = ctrl3_qs;
+  end
+  assign reg_rdata_next = (|addr_hit) ? reg_rdata_all[reg_idx] : '1;
+
+  // shadow busy
+  logic shadow_busy;
+  assign shadow_busy = 1'b0;
+
+  // register busy
+  assign reg_busy = shadow_busy;
+
+  // Unused signal tieoff
+
+  // wdata / byte enable are not always fully used
+  // add a blanket unused statement to handle lint waivers
+  logic unused_wdata;
+  logic unused_be;
+  assign unused_wdata = ^reg_wdata;
+  assign unused_be = ^reg_be;
+
+  // Assertions for Register Interface
+  `ASSERT_PULSE(wePulse, reg_we, clk_i, !rst_ni)
+  `ASSERT_PULSE(rePulse, reg_re, clk_i, !rst_ni)
+
+  `ASSERT(reAfterRv, $rose(reg_re || reg_we) |=> tl_o_pre.d_valid, clk_i, !rst_ni)
+
+  `ASSERT(en2addrHit, (reg_we || reg_re) |-> $onehot0(addr_hit), clk_i, !rst_ni)
+
+  // this is formulated as an assumption such that the FPV testbenches do disprove this
+  // property by mistake
+  //`ASSUME(reqParity, tl_reg_h2d.a_valid |-> tl_reg_h2d.a_user.chk_en == tlul_pkg::CheckDis)
+
+endmodule
@@ -4,23 +4,58 @@
 
 """Tests."""
 
+import json
+import multiprocessing
+import os
+import random
+import re
+import shutil
+import socket
 import subprocess
 import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import click
+import jinja2
 import pytest
+from jinja2 import ChoiceLoader
+from rdl2ot.cache import BuildCache
+from rdl2ot.environment import compile_templates, create_environment
+from rdl2ot.renderer import _render_tasks, _strip_trailing_spaces
+from rdl2ot.rtl_exporter import OtInterfaceBuilder
+from rdl2ot.watch import _export
+from systemrdl import RDLCompiler
+
+from rdl2ot import (
+    address_map,
+    cli,
+    incremental,
+    model,
+    profiling,
+    rtl_exporter,
+    schema,
+    server,
+    watch,
+)
 
-CLI_TOOL_PATH = Path(__file__).parent.parent / "src/rdl2ot"
 SNAPSHOTS_DIR = Path(__file__).parent / "snapshots"
 
 
-def _run_cli_tool(input_file_path: Path, output_dir_path: Path) -> subprocess.CompletedProcess:
+def _run_cli_tool(
+    input_file_path: Path, output_dir_path: Path, *args: str
+) -> subprocess.CompletedProcess:
     command = [
         sys.executable,  # Use the current Python interpreter
-        str(CLI_TOOL_PATH),
+        "-m",
+        "rdl2ot",
         "export-rtl",
         str(input_file_path),
         str(output_dir_path),
+        *(args or ["--no-cache"]),
     ]
     if "soc" in input_file_path.name:
         command.append("--soc")
@@ -28,6 +63,16 @@ def _run_cli_tool(input_file_path: Path, output_dir_path: Path) -> subprocess.Co
     return subprocess.run(command, capture_output=True, text=True, check=False)  # noqa: S603
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _hermetic(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keep the caches out of the home directory and the exports away from a running server."""
+    tmp_path = tmp_path_factory.mktemp("home")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setenv("RDL2OT_SOCKET", str(tmp_path / "rdl2ot.sock"))
+        yield
+
+
 test_ips = ["lc_ctrl", "uart", "soc_strawberry"]
 
 
@@ -39,11 +84,1016 @@ def test_export_ip(tmp_path: Path, ip_block: str) -> None:
     assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
     assert "Successfully finished!" in cli_result.stdout  # Check for success message
 
-    files = list(tmp_path.glob(f"*{ip_block}*.sv"))
-    for outfile in files:
-        snapshot_file = SNAPSHOTS_DIR / outfile.name
+    # The outputs of a SoC are named after its devices, so they are kept in their own directory.
+    if (SNAPSHOTS_DIR / ip_block).is_dir():
+        snapshot_files = list((SNAPSHOTS_DIR / ip_block).glob("*.sv"))
+    else:
+        snapshot_files = list(SNAPSHOTS_DIR.glob(f"{ip_block}_*.sv"))
+    assert snapshot_files
+    assert sorted(path.name for path in tmp_path.glob("*.sv")) == sorted(
+        path.name for path in snapshot_files
+    )
+    for snapshot_file in snapshot_files:
+        outfile = tmp_path / snapshot_file.name
         snapshot_content = snapshot_file.read_text(encoding="utf-8")
         actual_output_content = outfile.read_text(encoding="utf-8")
         assert actual_output_content == snapshot_content, (
             f"Output mismatch, to debug, run:\nmeld {outfile} {snapshot_file}\n"
         )
+
+
+@pytest.mark.parametrize("ip_block", ["lc_ctrl", "uart", "sparse"])
+def test_export_ip_indexed(tmp_path: Path, ip_block: str) -> None:
+    """Test the dense and paged decoders of the indexed decoder style against their snapshots."""
+    input_rdl = SNAPSHOTS_DIR / f"{ip_block}.rdl"
+    cli_result = _run_cli_tool(input_rdl, tmp_path, "--no-cache", "--decoder", "indexed")
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+
+    snapshot_files = list((SNAPSHOTS_DIR / "indexed").glob(f"{ip_block}_*.sv"))
+    assert snapshot_files
+    for snapshot_file in snapshot_files:
+        outfile = tmp_path / snapshot_file.name
+        assert outfile.read_text(encoding="utf-8") == snapshot_file.read_text(encoding="utf-8"), (
+            f"Output mismatch, to debug, run:\nmeld {outfile} {snapshot_file}\n"
+        )
+
+
+def test_build_cache(tmp_path: Path) -> None:
+    """Test that a second export is restored from the cache and an edit invalidates it."""
+    input_rdl = tmp_path / "uart.rdl"
+    shutil.copyfile(SNAPSHOTS_DIR / "uart.rdl", input_rdl)
+    cache_args = ("--cache-dir", str(tmp_path / "cache"))
+    for out_dir in ["miss", "hit", "edit"]:
+        (tmp_path / out_dir).mkdir()
+
+    cli_result = _run_cli_tool(input_rdl, tmp_path / "miss", *cache_args)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    assert "Compiling file" in cli_result.stdout
+
+    cli_result = _run_cli_tool(input_rdl, tmp_path / "hit", *cache_args)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    assert "Compiling file" not in cli_result.stdout
+    for name in ["rdl.json", "uart_reg_pkg.sv", "uart_reg_top.sv"]:
+        assert (tmp_path / "hit" / name).read_bytes() == (tmp_path / "miss" / name).read_bytes()
+
+    input_rdl.write_text(input_rdl.read_text().replace("TX enable", "TX enabled"))
+    cli_result = _run_cli_tool(input_rdl, tmp_path / "edit", *cache_args)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    assert "Compiling file" in cli_result.stdout
+
+
+def test_build_cache_hit_skips_systemrdl(tmp_path: Path) -> None:
+    """Test that a cache hit never imports systemrdl nor jinja2."""
+    cache_dir = tmp_path / "cache"
+    _run_cli_tool(SNAPSHOTS_DIR / "uart.rdl", tmp_path, "--cache-dir", str(cache_dir))
+    script = (
+        "import sys\n"
+        "from rdl2ot.cli import main\n"
+        f"main(['export-rtl', {str(SNAPSHOTS_DIR / 'uart.rdl')!r}, {str(tmp_path)!r},"
+        f" '--cache-dir', {str(cache_dir)!r}], standalone_mode=False)\n"
+        "assert 'systemrdl' not in sys.modules\n"
+        "assert 'jinja2' not in sys.modules\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
+    assert "Restored" in result.stdout
+
+
+def _imported_modules(*args: str) -> tuple[str, set[str]]:
+    """Return the output of a run of the cli and the modules it imported."""
+    command = [sys.executable, "-X", "importtime", "-m", "rdl2ot", *args]
+    result = subprocess.run(command, capture_output=True, text=True, check=False)  # noqa: S603
+    assert result.returncode == 0, result.stderr
+    modules = re.findall(r"^import time:\s+\d+ \|\s+\d+ \| +(\S+)$", result.stderr, re.MULTILINE)
+    return result.stdout, set(modules)
+
+
+def test_startup_imports(tmp_path: Path) -> None:
+    """Test that `rdl2ot --help` and a no-op export don't import the heavy modules."""
+    cache_args = ("--cache-dir", str(tmp_path / "cache"))
+    _run_cli_tool(SNAPSHOTS_DIR / "uart.rdl", tmp_path, *cache_args)
+    output, modules = _imported_modules(
+        "export-rtl", str(SNAPSHOTS_DIR / "uart.rdl"), str(tmp_path), *cache_args
+    )
+    assert "from cache" in output
+    heavy = {"systemrdl", "jinja2", "rdl2ot.rtl_exporter", "rdl2ot.profiling"}
+    assert not heavy & modules
+    # The help doesn't even need the cache nor the client of the server.
+    _, modules = _imported_modules("--help")
+    assert not {*heavy, "rdl2ot.cache", "rdl2ot.server"} & modules
+    assert "rdl2ot.cli" in modules
+
+
+def test_build_cache_eviction(tmp_path: Path) -> None:
+    """Test that the least recently used entries are evicted first."""
+    cache = BuildCache(tmp_path / "cache", max_size=1024)
+    outputs = tmp_path / "outputs"
+    outputs.mkdir()
+    for name in ["a", "b", "c"]:
+        input_rdl = tmp_path / f"{name}.rdl"
+        input_rdl.write_text(name)
+        output = outputs / f"{name}.sv"
+        output.write_bytes(b"x" * 400)
+        cache.store(input_rdl, {}, [], [output])
+        # Make sure the entries have distinct access times.
+        time.sleep(0.01)
+
+    assert cache.restore(tmp_path / "a.rdl", {}, outputs) is None
+    assert cache.restore(tmp_path / "b.rdl", {}, outputs) == [outputs / "b.sv"]
+    assert cache.restore(tmp_path / "c.rdl", {}, outputs) == [outputs / "c.sv"]
+
+    # An entry removed by a concurrent eviction is skipped.
+    (cache.entries_dir / "removed").symlink_to(tmp_path / "missing")
+    cache.evict()
+
+
+def test_build_cache_errors(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Test that an unreadable entry is a cache miss and an unwritable cache only a warning."""
+    cache = BuildCache(tmp_path / "cache")
+    input_rdl = tmp_path / "a.rdl"
+    input_rdl.write_text("a")
+    output = tmp_path / "a.sv"
+    output.write_text("a")
+    cache.store(input_rdl, {}, [], [output])
+    (entry,) = cache.entries_dir.iterdir()
+
+    # The output is replaced by a directory, as if the entry was being evicted.
+    (entry / "a.sv").unlink()
+    (entry / "a.sv").mkdir()
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    assert cache.restore(input_rdl, {}, out_dir) is None
+
+    cache = BuildCache(tmp_path / "unwritable")
+    (tmp_path / "unwritable").mkdir()
+    (tmp_path / "unwritable" / "entries").write_text("")
+    cache.store(input_rdl, {}, [], [output])
+    assert "Warning: The outputs couldn't be saved in the cache" in capsys.readouterr().out
+
+
+def test_parallel_export(tmp_path: Path) -> None:
+    """Test that rendering with a process pool matches the serial output."""
+    input_rdl = SNAPSHOTS_DIR / "soc_strawberry.rdl"
+    results = {}
+    for jobs in ["1", "4"]:
+        out_dir = tmp_path / jobs
+        out_dir.mkdir()
+        cli_result = _run_cli_tool(input_rdl, out_dir, "--no-cache", "--jobs", jobs)
+        assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+        generated = [line for line in cli_result.stdout.splitlines() if "Generated" in line]
+        results[jobs] = [line.replace(str(out_dir), "") for line in generated]
+
+    assert results["1"] == results["4"]
+    # The depfile names the output directory.
+    for outfile in set((tmp_path / "1").iterdir()) - {tmp_path / "1" / "soc_strawberry.d"}:
+        assert outfile.read_bytes() == (tmp_path / "4" / outfile.name).read_bytes()
+
+
+def test_soc_shared_ip_types(tmp_path: Path) -> None:
+    """Test that the instances of an IP type are rendered once and all recorded in rdl.json."""
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / "soc_apple.rdl", tmp_path)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    generated = [line for line in cli_result.stdout.splitlines() if "Generated" in line]
+    assert len(generated) == len(set(generated))
+
+    # UART_FAST is customised by a dynamic property assignment, so it gets its own RTL.
+    devices = json.loads((tmp_path / "rdl.json").read_text())["devices"]
+    assert [device["ip_name"] for device in devices] == ["uart", "LC_CTRL", "UART_FAST"]
+    assert [instance["name"] for instance in devices[0]["instances"]] == [
+        "UART0",
+        "UART1",
+        "UART_ARR",
+    ]
+    assert [offsets["count"] for offsets in devices[0]["offsets"]] == [1, 1, 2]
+
+    for name in ["uart_reg_pkg.sv", "uart_reg_top.sv"]:
+        snapshot_content = (SNAPSHOTS_DIR / name).read_text(encoding="utf-8")
+        assert (tmp_path / name).read_text(encoding="utf-8") == snapshot_content
+
+
+def test_soc_device_names(tmp_path: Path) -> None:
+    """Test that the devices of a SoC are named and grouped whatever their number of instances."""
+
+    def devices(body: str) -> list[tuple[str, list[str]]]:
+        input_rdl = tmp_path / "soc.rdl"
+        input_rdl.write_text(f'`include "{SNAPSHOTS_DIR / "uart.rdl"}"\naddrmap soc {{{body}}};\n')
+        rdlc = RDLCompiler()
+        rdlc.compile_file(input_rdl)
+        soc = OtInterfaceBuilder().parse_soc(rdlc.elaborate().top)
+        return [
+            (device.ip_name, [inst.name for inst in device.instances]) for device in soc.devices
+        ]
+
+    # A single instance keeps its name, as the package and type names of its RTL derive from it.
+    assert devices("uart UART0;") == [("UART0", ["UART0"])]
+    assert devices("uart UART0; uart UART1;") == [("uart", ["UART0", "UART1"])]
+    # An instance customised by its own properties gets its own device.
+    assert devices('uart UART0; uart UART1; uart UART2; UART2->desc = "Fast";') == [
+        ("uart", ["UART0", "UART1"]),
+        ("UART2", ["UART2"]),
+    ]
+    assert devices("uart UART0 @0x0; uart UART @0x1000; UART.CTRL.TX->reset = 1;") == [
+        ("UART0", ["UART0"]),
+        ("UART", ["UART"]),
+    ]
+    # The names are the stems of the generated files, so they must differ once lowercased.
+    assert devices('uart UART0; uart UART1; uart UART; UART->desc = "Fast";') == [
+        ("uart", ["UART0", "UART1"]),
+        ("UART_1", ["UART"]),
+    ]
+    # Identical anonymous definitions are not merged, unless declared together.
+    anonymous = "addrmap { reg { field {} f; } R0; }"
+    assert devices(f"{anonymous} A; {anonymous} B; {anonymous} C, D;") == [
+        ("A", ["A"]),
+        ("B", ["B"]),
+        ("C", ["C", "D"]),
+    ]
+
+
+def test_address_index(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Test the lookup of addresses across a SoC and the detection of overlaps and gaps."""
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / "soc_apple.rdl", tmp_path)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    index = address_map.AddressIndex.load(tmp_path / "rdl.json")
+
+    location = index.lookup(0x10)
+    assert location.path == "UART0.CTRL"
+    assert [field.name for field in location.fields][-1] == "NCO"
+    location = index.lookup(0xC6)
+    assert (location.path, location.offset) == ("UART_ARR[1].CTRL", 2)
+    location = index.lookup(0x2000 + 0x1C + 4)
+    assert (location.path, location.index) == ("LC_CTRL.regs.TRANSITION_TOKEN[1]", 1)
+    # The dmi interface of lc_ctrl is at 0x1000 in the IP block.
+    location = index.lookup(0x3000 + 0x10)
+    assert (location.path, location.window.name, location.fields) == ("LC_CTRL.dmi.dmi", "dmi", [])
+    assert index.lookup(0x34) is None
+    assert index.lookup(-1) is None
+    addrs = [0x10, 0x34, 0x2020, 0x10, 0x3000]
+    assert index.lookup_many(addrs) == [index.lookup(addr) for addr in addrs]
+    assert index.overlaps() == []
+    assert (0x34, 0x40) in index.gaps()
+
+    data = json.loads((tmp_path / "rdl.json").read_text())
+    data["devices"][0]["interfaces"][0]["regs"][1]["offsets"]["base"] = 0
+    index = address_map.AddressIndex.from_model(model.from_dict(data))
+    overlaps = address_map.report_overlaps(index.spans())
+    assert ("UART1.INTERRUPT_ENABLE", "UART1.INTERRUPT_STATE") in overlaps
+    warning = "Warning: UART1.INTERRUPT_STATE overlaps UART1.INTERRUPT_ENABLE"
+    assert warning in capsys.readouterr().out
+
+
+def test_address_index_sparse(tmp_path: Path) -> None:
+    """Test that the elements of interleaved sparse arrays are found and checked by their stride."""
+    input_rdl = tmp_path / "sparse.rdl"
+    input_rdl.write_text(
+        """
+        addrmap sparse {
+            reg ctrl_t {
+                field {} EN[0:0] = 0;
+            };
+            ctrl_t A[4] @ 0x0 += 0x10;
+            ctrl_t C @ 0x40;
+        };
+        """
+    )
+    rdlc = RDLCompiler()
+    rdlc.compile_file(input_rdl)
+    device = OtInterfaceBuilder().parse_ip_block(rdlc.elaborate().top)
+    index = address_map.AddressIndex.from_model(device)
+
+    assert len(index) == len(device.interfaces[0].regs)
+    location = index.lookup(0x32)
+    assert (location.path, location.index, location.offset) == ("sparse.A[3]", 3, 2)
+    assert index.lookup(0x24) is None
+    assert index.lookup(0x40).path == "sparse.C"
+    assert index.gaps() == [(0x34, 0x40)]
+
+    spans = list(address_map.device_spans(device))
+    assert spans == [(0x0, 0x34, "sparse.A", 0x10, 4), (0x40, 0x44, "sparse.C", 4, 4)]
+    # The elements of B sit in the holes of A, an element of E lands on B[2].
+    spans.append((0x8, 0x3C, "sparse.B", 0x10, 4))
+    assert address_map.check_spans(spans)[0] == []
+    spans.append((0x14, 0x3C, "sparse.E", 0x14, 4))
+    assert address_map.check_spans(spans)[0] == [("sparse.B", "sparse.E")]
+
+    # An address in a hole of A is found in the array interleaved with it.
+    data = model.to_dict(device)
+    data["interfaces"][0]["regs"].append(
+        {
+            **data["interfaces"][0]["regs"][0],
+            "name": "B",
+            "offsets": {"base": 8, "stride": 16, "count": 4},
+        }
+    )
+    index = address_map.AddressIndex.from_model(model.from_dict(data))
+    assert index.lookup(0x28).path == "sparse.B[2]"
+    assert index.lookup(0x30).path == "sparse.A[3]"
+    assert index.overlaps() == []
+
+
+def test_address_index_interleaved(tmp_path: Path) -> None:
+    """Test the lookup of the registers in the holes of a sparse array against a linear scan."""
+    regs = "".join(f"ctrl_t R{i} @ {0x800 + i * 4:#x};" for i in range(16))
+    input_rdl = tmp_path / "interleaved.rdl"
+    input_rdl.write_text(
+        f"""
+        addrmap interleaved {{
+            reg ctrl_t {{
+                field {{}} EN[0:0] = 0;
+            }};
+            ctrl_t A[4] @ 0x0 += 0x100;
+            ctrl_t B[8] @ 0x400 += 0x80;
+            {regs}
+        }};
+        """
+    )
+    rdlc = RDLCompiler()
+    rdlc.compile_file(input_rdl)
+    device = OtInterfaceBuilder().parse_ip_block(rdlc.elaborate().top)
+    # SystemRDL rejects interleaved instances, they are moved into the holes of A in the model.
+    b, *others = device.interfaces[0].regs[1:]
+    b.offsets = range(0x8, 0x408, 0x80)
+    for i, reg in enumerate(others):
+        reg.offsets = range(0x10 + i * 0x40, 0x14 + i * 0x40, 4)
+    index = address_map.AddressIndex.from_model(device)
+
+    def scan(addr: int) -> str | None:
+        for region in index._regions:  # noqa: SLF001
+            element, offset = divmod(addr - region.base, region.stride)
+            if 0 <= element < region.count and offset < region.size:
+                return region.path + (f"[{element}]" if region.count > 1 else "")
+        return None
+
+    assert index.lookup(0x108).path == "interleaved.B[2]"
+    assert index.lookup(0x3D0).path == "interleaved.R15"
+    for addr in range(-4, 0x440):
+        location = index.lookup(addr)
+        assert (location.path if location else None) == scan(addr), hex(addr)
+
+
+def test_reentrant_builder() -> None:
+    """Test that a builder can be reused and parses the same model with several threads."""
+    rdlc = RDLCompiler()
+    rdlc.compile_file(SNAPSHOTS_DIR / "soc_apple.rdl")
+    root = rdlc.elaborate().top
+
+    builder = OtInterfaceBuilder()
+    serial = builder.parse_soc(root)
+    assert builder.parse_soc(root) == serial
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(builder.parse_soc, [root] * 4)) == [serial] * 4
+
+    interfaces = [interface for device in serial.devices for interface in device.interfaces]
+    async_registers = [id(interface.async_registers) for interface in interfaces]
+    assert len(set(async_registers)) == len(interfaces)
+
+
+def test_parallel_parse() -> None:
+    """Test that the devices and interfaces parsed by forked processes match the serial parse."""
+    builder = OtInterfaceBuilder()
+    for name, parse in [("soc_apple", builder.parse_soc), ("lc_ctrl", builder.parse_ip_block)]:
+        rdlc = RDLCompiler()
+        rdlc.compile_file(SNAPSHOTS_DIR / f"{name}.rdl")
+        root = rdlc.elaborate().top
+        assert parse(root, jobs=3) == parse(root)
+
+    # The tasks only run in other processes where they can be forked, without other threads.
+    pids = rtl_exporter._parse_forked([os.getpid] * 2, 2)  # noqa: SLF001
+    forked = "fork" in multiprocessing.get_all_start_methods() and threading.active_count() == 1
+    assert (os.getpid() not in pids) == forked
+
+
+def test_register_parse_cache(tmp_path: Path) -> None:
+    """Test that the instances of a register type are cloned, honouring dynamic assignments."""
+    input_rdl = tmp_path / "regs.rdl"
+    input_rdl.write_text(
+        """
+        addrmap regs {
+            reg ctrl_t {
+                field {} EN[0:0] = 0;
+                field {} MODE[2:1] = 0;
+            };
+            ctrl_t CTRL0;
+            ctrl_t CTRL1[2];
+            ctrl_t CTRL2;
+            CTRL2.MODE->reset = 2;
+        };
+        """
+    )
+    rdlc = RDLCompiler()
+    rdlc.compile_file(input_rdl)
+    regs = OtInterfaceBuilder().parse_ip_block(rdlc.elaborate().top).interfaces[0].regs
+
+    assert [reg.name for reg in regs] == ["CTRL0", "CTRL1", "CTRL2"]
+    assert [list(reg.offsets) for reg in regs] == [[0], [4, 8], [12]]
+    assert [reg.is_multireg for reg in regs] == [False, True, False]
+    assert [field.parent_name for field in regs[1].fields] == ["CTRL1", "CTRL1"]
+    assert regs[1].fields[0] is not regs[0].fields[0]
+    assert [reg.reset for reg in regs] == [0, 0, 4]
+
+
+def test_array_offsets(tmp_path: Path) -> None:
+    """Test that the offsets of multidimensional arrays are flattened into a range."""
+    input_rdl = tmp_path / "arrays.rdl"
+    input_rdl.write_text(
+        """
+        addrmap arrays {
+            reg {
+                field {} EN[0:0] = 0;
+            } CTRL[2][3] @ 0x10;
+        };
+        """
+    )
+    rdlc = RDLCompiler()
+    rdlc.compile_file(input_rdl)
+    reg = OtInterfaceBuilder().parse_ip_block(rdlc.elaborate().top).interfaces[0].regs[0]
+
+    assert reg.offsets == range(0x10, 0x28, 4)
+    assert model.to_dict(reg)["offsets"] == {"base": 0x10, "stride": 4, "count": 6}
+
+
+@pytest.mark.parametrize("ip_block", test_ips)
+def test_model_round_trip(ip_block: str) -> None:
+    """Test that the model is unchanged by a round trip through its json representation."""
+    rdlc = RDLCompiler()
+    rdlc.compile_file(SNAPSHOTS_DIR / f"{ip_block}.rdl")
+    root = rdlc.elaborate().top
+    builder = OtInterfaceBuilder()
+    data = builder.parse_soc(root) if "soc" in ip_block else builder.parse_ip_block(root)
+
+    serialized = json.loads(json.dumps(model.to_dict(data)))
+    schema.validate(schema.versioned(serialized))
+    assert model.from_dict(serialized) == data
+
+
+def test_precompiled_templates(tmp_path: Path) -> None:
+    """Test that the precompiled templates render like the sources and are ignored when stale."""
+    compiled_dir = tmp_path / "compiled"
+    compiled_dir.mkdir()
+    compile_templates(compiled_dir)
+    compiled_env = create_environment(compiled_dir)
+    assert isinstance(compiled_env.loader, ChoiceLoader)
+
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / "uart.rdl", tmp_path)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    ip_block = model.from_dict(json.loads((tmp_path / "rdl.json").read_text()))
+    template_name, data, path = _render_tasks(ip_block, tmp_path)[0]
+    stream = compiled_env.get_template(template_name).render(data)
+    assert stream == path.read_text(encoding="utf-8")
+
+    # The modules compiled by another jinja2 are stale too.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(jinja2, "__version__", "0.0.0")
+        assert not isinstance(create_environment(compiled_dir).loader, ChoiceLoader)
+
+    (compiled_dir / "checksum").write_text("stale")
+    assert not isinstance(create_environment(compiled_dir).loader, ChoiceLoader)
+
+
+def test_bytecode_cache_location(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the compiled templates follow --cache-dir and aren't cached with --no-cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "home"))
+    input_rdl = SNAPSHOTS_DIR / "uart.rdl"
+    cli_result = _run_cli_tool(input_rdl, tmp_path, "--cache-dir", str(tmp_path / "cache"))
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    assert any((tmp_path / "cache" / "bytecode").iterdir())
+
+    cli_result = _run_cli_tool(input_rdl, tmp_path, "--no-cache")
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    assert not (tmp_path / "home").exists()
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_strip_trailing_spaces(seed: int) -> None:
+    """Test that stripping a chunked stream matches stripping the whole string."""
+    rng = random.Random(seed)  # noqa: S311
+    text = "".join(rng.choice([" ", "\n", "a", "  \n"]) for _ in range(2000))
+    cuts = sorted(rng.sample(range(len(text)), 200))
+    chunks = [text[start:end] for start, end in zip([0, *cuts], [*cuts, len(text)], strict=True)]
+    assert "".join(_strip_trailing_spaces(chunks)) == text.replace(" \n", "\n")
+
+
+@pytest.mark.parametrize("ip_block", test_ips)
+def test_render_json(tmp_path: Path, ip_block: str) -> None:
+    """Test that rendering a saved rdl.json matches the export from the RDL."""
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / f"{ip_block}.rdl", tmp_path)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+
+    out_dir = tmp_path / "from_json"
+    out_dir.mkdir()
+    script = (
+        "import sys\n"
+        "from rdl2ot.cli import main\n"
+        f"main(['render-json', {str(tmp_path / 'rdl.json')!r}, {str(out_dir)!r}],"
+        " standalone_mode=False)\n"
+        "assert 'systemrdl' not in sys.modules\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
+
+    files = list(tmp_path.glob("*.sv"))
+    assert files
+    for outfile in files:
+        assert (out_dir / outfile.name).read_bytes() == outfile.read_bytes()
+
+
+def test_render_json_decoder(tmp_path: Path) -> None:
+    """Test that render-json overrides the decoder saved in the model."""
+    indexed_dir = tmp_path / "indexed"
+    indexed_dir.mkdir()
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / "lc_ctrl.rdl", indexed_dir, "--decoder", "indexed")
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / "lc_ctrl.rdl", tmp_path)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+
+    out_dir = tmp_path / "from_json"
+    out_dir.mkdir()
+    args = ["render-json", str(tmp_path / "rdl.json"), str(out_dir), "--decoder", "indexed"]
+    cli.main.main(args, standalone_mode=False)
+    top = "lc_ctrl_regs_reg_top.sv"
+    assert (indexed_dir / top).read_bytes() != (tmp_path / top).read_bytes()
+    files = list(indexed_dir.glob("*.sv"))
+    assert files
+    for outfile in files:
+        assert (out_dir / outfile.name).read_bytes() == outfile.read_bytes()
+
+
+def test_render_json_validation(tmp_path: Path) -> None:
+    """Test that an invalid or outdated rdl.json is rejected."""
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / "uart.rdl", tmp_path)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    data = json.loads((tmp_path / "rdl.json").read_text())
+    schema.validate(data)
+
+    del data["interfaces"][0]["regs"][1]["fields"][0]["lsb"]
+    with pytest.raises(schema.SchemaError, match=r"regs\[1\]\.fields\[0\]: missing key 'lsb'"):
+        schema.validate(data)
+
+    data["schema_version"] = 0
+    with pytest.raises(schema.SchemaError, match="Unsupported schema version"):
+        schema.validate(data)
+
+    data = json.loads((tmp_path / "rdl.json").read_text())
+    data["interfaces"][0]["regs"][0]["offsets"]["stride"] = 0
+    with pytest.raises(schema.SchemaError, match=r"offsets\.stride: expected a positive integer"):
+        schema.validate(data)
+
+
+def test_render_json_unknown_device(tmp_path: Path) -> None:
+    """Test that render-json fails on an unknown device, listing the devices of the model."""
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / "soc_strawberry.rdl", tmp_path)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+
+    args = ["render-json", str(tmp_path / "rdl.json"), str(tmp_path), "--device", "spi"]
+    with pytest.raises(
+        click.ClickException, match="Unknown device spi, expected one of UART, LC_CTRL"
+    ):
+        cli.main.main(args, standalone_mode=False)
+
+
+_LOOP = re.compile(
+    r"for \((?:genvar|int) i = 0; i < (\d+); i\+\+\) begin : (\w+)\n(.*?)\n *end : \2", re.DOTALL
+)
+_WR_ERR_TERM = re.compile(r"addr_hit\[(\d+)\]&\(\|\(\w+\[(\d+)\]&~reg_be\)\)")
+
+
+def _normalize_rtl(text: str, offsets: dict[str, str]) -> list[str]:
+    """Unroll the generate loops of a reg_top and normalize it to compare it to a flat one."""
+    arrays = "|".join(re.findall(r"begin : gen_(\w+?)\n", text)) or "$^"
+    text = _LOOP.sub(
+        lambda m: "\n".join(re.sub(r"\bi\b", str(i), m[3]) for i in range(int(m[1]))), text
+    )
+    text = re.sub(rf"\b({arrays})_(flds_we|gated_we|qe|qs|wd|we|re)\[(\d+)\]", r"\1_\3_\2", text)
+    text = re.sub(r"\b\w+_(OFFSET|STRIDE)\b", lambda m: offsets[m[0]], text)
+    text = re.sub(r"//.*|^ *logic .*|[ \t]", "", text, flags=re.MULTILINE)
+    text = re.sub(r"\d+\*\d+", lambda m: str(eval(m[0])), text)  # noqa: S307
+    text = re.sub(r"\d+\+\d+", lambda m: str(eval(m[0])), text)  # noqa: S307
+    text = re.sub(r"AW'\((\d+)\)", r"\1", text)
+    text = re.sub(r"if\((addr_hit\[\d+\])\)begin", r"\1:begin", text)
+    text = re.sub(r"\bu_\w+\(", "u_(", text)
+
+    # The write errors of the loops are or-ed one by one, so only their terms are compared.
+    start = text.find("wr_err=")
+    if start < 0:
+        return text.splitlines()
+    end = text.index("\nend\n", start)
+    terms = [" ".join(term) for term in sorted(_WR_ERR_TERM.findall(text[start:end]))]
+    lines = [*text[:start].splitlines(), *terms, *text[end:].splitlines()]
+    return [line for line in lines if line and not re.fullmatch(r"end(:\w+)?|\|addr_hit\[.*", line)]
+
+
+@pytest.mark.parametrize("ip_block", ["lc_ctrl", "soc_strawberry"])
+def test_generate_loops(tmp_path: Path, ip_block: str) -> None:
+    """Test that the generate loops are equivalent to the unrolled registers."""
+    input_rdl = SNAPSHOTS_DIR / f"{ip_block}.rdl"
+    for out_dir, args in [("flat", ()), ("loops", ("--generate-loops",))]:
+        (tmp_path / out_dir).mkdir()
+        cli_result = _run_cli_tool(input_rdl, tmp_path / out_dir, "--no-cache", *args)
+        assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+
+    offsets = {}
+    for reg_pkg in (tmp_path / "flat").glob("*_reg_pkg.sv"):
+        text = reg_pkg.read_text(encoding="utf-8")
+        loops_text = (tmp_path / "loops" / reg_pkg.name).read_text(encoding="utf-8")
+        for name, value in re.findall(
+            r"(\w+_(?:OFFSET|STRIDE)) = (?:\d+)?'h ?(\w+);", text + loops_text
+        ):
+            offsets[name] = str(int(value, 16))
+        # The arrays of the generate loops are described by their first offset and stride.
+        for name, count in re.findall(r"(\w+)_COUNT *= (\d+);", loops_text):
+            base, stride = int(offsets[f"{name}_OFFSET"]), int(offsets[f"{name}_STRIDE"])
+            for i in range(int(count)):
+                assert int(offsets[f"{name}_{i}_OFFSET"]) == base + i * stride
+        pattern = r".*_(OFFSET|STRIDE|COUNT) *=.*\n"
+        assert re.sub(pattern, "", loops_text) == re.sub(pattern, "", text)
+
+    num_loops = 0
+    for reg_top in (tmp_path / "flat").glob("*_reg_top.sv"):
+        text = (tmp_path / "loops" / reg_top.name).read_text(encoding="utf-8")
+        num_loops += text.count("begin : gen_")
+        expected = _normalize_rtl(reg_top.read_text(encoding="utf-8"), offsets)
+        assert _normalize_rtl(text, offsets) == expected, reg_top.name
+    assert num_loops
+
+
+def test_indexed_decoder(tmp_path: Path) -> None:
+    """Test that the indexed decoder picks a dense or paged decoder matching the offsets."""
+    input_rdl = tmp_path / "sparse.rdl"
+    input_rdl.write_text(
+        """
+        addrmap sparse {
+            reg ctrl_t {
+                field {} EN[0:0] = 0;
+            };
+            ctrl_t CTRL0 @ 0x0;
+            ctrl_t CTRL1[2] @ 0x8;
+            ctrl_t CTRL2 @ 0x400;
+            ctrl_t CTRL3 @ 0x1004;
+        };
+        """
+    )
+    # The 16-bit registers are dense if they are a bus word apart.
+    for name, stride in [("half_words", 4), ("packed", 2)]:
+        (tmp_path / f"{name}.rdl").write_text(
+            f"""
+            addrmap {name} {{
+                reg {{
+                    regwidth = 16;
+                    field {{}} EN[0:0] = 0;
+                }} HALF[4] @ 0x0 += {stride};
+            }};
+            """
+        )
+    styles = {}
+    for rdl in [input_rdl, SNAPSHOTS_DIR / "uart.rdl", *tmp_path.glob("[hp]*.rdl")]:
+        rdlc = RDLCompiler()
+        rdlc.compile_file(rdl)
+        root = rdlc.elaborate().top
+        assert OtInterfaceBuilder().parse_ip_block(root).interfaces[0].decoder == "flat"
+        styles[rdl.stem] = OtInterfaceBuilder(decoder="indexed").parse_ip_block(root).interfaces[0]
+
+    assert styles["uart"].decoder == "dense"
+    assert styles["half_words"].decoder == "dense"
+    assert styles["packed"].decoder == "flat"
+    interface = styles["sparse"]
+    assert interface.decoder == "paged"
+    hits = {
+        (page << model.DECODER_PAGE_BITS) + offset: index
+        for page, page_hits in interface.decoder_pages
+        for index, offset in page_hits
+    }
+    assert hits == {0x0: 0, 0x8: 1, 0xC: 2, 0x400: 3, 0x1004: 4}
+
+
+def test_profile(tmp_path: Path) -> None:
+    """Test the profiling report of the cli and of a library call of the exporter."""
+    report = tmp_path / "profile.json"
+    pstats_file = tmp_path / "profile.pstats"
+    input_rdl = SNAPSHOTS_DIR / "soc_strawberry.rdl"
+    args = ("--no-cache", "--profile-json", str(report), "--profile-pstats", str(pstats_file))
+    cli_result = _run_cli_tool(input_rdl, tmp_path, *args)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    assert pstats_file.stat().st_size > 0
+
+    depths = {stage["name"]: stage["depth"] for stage in json.loads(report.read_text())["stages"]}
+    assert [depths[name] for name in ["compile", "elaborate", "parse", "render"]] == [1] * 4
+    assert depths["parse device soc_strawberry.LC_CTRL"] == depths["render uart_reg_top.sv"]
+    assert depths["plan uart_reg_top.sv"] == depths["render uart_reg_top.sv"]
+    assert depths["parse interface soc_strawberry.LC_CTRL.dmi"] > depths["parse"] + 1
+
+    rdlc = RDLCompiler()
+    rdlc.compile_file(SNAPSHOTS_DIR / "uart.rdl")
+    root = rdlc.elaborate().top
+    with profiling.Profiler() as profiler:
+        rtl_exporter.run(root, tmp_path, jobs=2)
+    names = [stage.name for stage in profiler.stages]
+    assert names[:3] == ["parse", "parse device uart", "parse interface uart"]
+    assert names[3:] == ["write rdl.json", "render"]
+    assert all(stage.duration > 0 for stage in profiler.stages)
+
+    # The unchanged outputs are neither planned nor rendered.
+    with profiling.Profiler() as profiler:
+        rtl_exporter.run(root, tmp_path)
+    assert not [stage for stage in profiler.stages if stage.name.startswith(("plan ", "render "))]
+
+
+@pytest.mark.parametrize("soc", ["soc_strawberry", "soc_apple"])
+def test_stream_soc(tmp_path: Path, soc: str) -> None:
+    """Test that streaming the devices of a SoC generates the same outputs."""
+    rdlc = RDLCompiler()
+    rdlc.compile_file(SNAPSHOTS_DIR / f"{soc}.rdl")
+    root = rdlc.elaborate().top
+    outputs = {}
+    for stream in [False, True]:
+        out_dir = tmp_path / str(stream)
+        out_dir.mkdir()
+        paths = rtl_exporter.run(root, out_dir, is_soc=True, jobs=2, stream=stream)
+        outputs[stream] = {path.name: path.read_text(encoding="utf-8") for path in paths}
+
+    assert outputs[True] == outputs[False]
+    schema.validate(json.loads(outputs[True]["rdl.json"]))
+
+
+def test_incremental_export(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Test that only the outputs of a changed model are rendered, and only written if changed."""
+    rdlc = RDLCompiler()
+    rdlc.compile_file(SNAPSHOTS_DIR / "soc_strawberry.rdl")
+    root = rdlc.elaborate().top
+    outputs = rtl_exporter.run(root, tmp_path, is_soc=True)
+    mtimes = {path.name: path.stat().st_mtime_ns for path in outputs}
+    capsys.readouterr()
+
+    # The decoder only changes the reg_top of the interfaces made of contiguous registers.
+    outputs = rtl_exporter.run(root, tmp_path, is_soc=True, decoder="indexed")
+    log = capsys.readouterr().out
+    assert f"Generated {tmp_path / 'uart_reg_top.sv'}." in log
+    assert f"Unchanged {tmp_path / 'lc_ctrl_dmi_reg_top.sv'}." in log
+    changed = {path.name for path in outputs if path.stat().st_mtime_ns != mtimes[path.name]}
+    assert changed == {
+        "rdl.json",
+        "soc_strawberry_manifest.json",
+        "uart_reg_top.sv",
+        "lc_ctrl_regs_reg_top.sv",
+    }
+
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / "uart.rdl", tmp_path)
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    depfile = (tmp_path / "uart.d").read_text(encoding="utf-8")
+    assert f"{tmp_path / 'uart_reg_top.sv'}: {SNAPSHOTS_DIR.resolve() / 'uart.rdl'}\n" in depfile
+
+    # An output edited by hand is rendered again.
+    (tmp_path / "uart_reg_top.sv").write_text("truncated", encoding="utf-8")
+    cli_result = _run_cli_tool(SNAPSHOTS_DIR / "uart.rdl", tmp_path)
+    assert f"Generated {tmp_path / 'uart_reg_top.sv'}." in cli_result.stdout
+    assert f"Unchanged {tmp_path / 'uart_reg_pkg.sv'}." in cli_result.stdout
+
+
+def test_shared_out_dir(tmp_path: Path) -> None:
+    """Test that the manifest and depfile of a top are kept by the export of another top."""
+    for ip_block in ["uart", "lc_ctrl", "uart"]:
+        cli_result = _run_cli_tool(SNAPSHOTS_DIR / f"{ip_block}.rdl", tmp_path)
+        assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    assert "Generated" not in cli_result.stdout
+
+    for ip_block in ["uart", "lc_ctrl"]:
+        depfile = (tmp_path / f"{ip_block}.d").read_text(encoding="utf-8")
+        manifest = json.loads((tmp_path / f"{ip_block}_manifest.json").read_text("utf-8"))
+        assert all(name.startswith(ip_block) for name in manifest["outputs"])
+        assert f"{tmp_path / f'{ip_block}_reg_pkg.sv'}: " in depfile
+        assert f"{SNAPSHOTS_DIR.resolve() / f'{ip_block}.rdl'}" in depfile
+
+
+def test_depfile(tmp_path: Path) -> None:
+    """Test that the depfile is identical on a cache miss and hit, and escapes the paths."""
+    input_dir = tmp_path / "a b#c:$d"
+    (input_dir / "out").mkdir(parents=True)
+    shutil.copyfile(SNAPSHOTS_DIR / "uart.rdl", input_dir / "uart.rdl")
+    cache_args = ("--cache-dir", str(tmp_path / "cache"))
+    depfiles = []
+    for _ in range(2):
+        # A relative input path, the depfile lists it resolved.
+        command = [sys.executable, "-m", "rdl2ot", "export-rtl", "uart.rdl", "out", *cache_args]
+        cli_result = subprocess.run(  # noqa: S603
+            command, cwd=input_dir, capture_output=True, text=True, check=False
+        )
+        assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+        depfiles.append((input_dir / "out" / "uart.d").read_text(encoding="utf-8"))
+
+    assert "from cache" in cli_result.stdout
+    assert depfiles[0] == depfiles[1]
+    escaped = str(input_dir.resolve()).replace("$", "$$").replace(" ", "\\ ")
+    escaped = escaped.replace("#", "\\#").replace(":", "\\:")
+    assert f": {escaped}/uart.rdl\n" in depfiles[0]
+
+
+@pytest.mark.parametrize("poll", [False, True])
+def test_watch(tmp_path: Path, capsys: pytest.CaptureFixture, poll: bool) -> None:
+    """Test that the watch mode renders again the outputs of the included file edited."""
+    device = "addrmap {name} {{ reg {{ field {{}} EN[7:0] = {reset}; }} CTRL; }};\n"
+    (tmp_path / "a.rdl").write_text(device.format(name="dev_a", reset=0))
+    (tmp_path / "b.rdl").write_text(device.format(name="dev_b", reset=0))
+    input_rdl = tmp_path / "soc.rdl"
+    input_rdl.write_text(
+        '`include "a.rdl"\n`include "b.rdl"\n'
+        "addrmap soc { dev_a DEV_A @ 0x0; dev_b DEV_B @ 0x100; };\n"
+    )
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    args = (input_rdl, out_dir, True, 1, False, "flat", poll, 0.05, 1)
+    thread = threading.Thread(target=watch.watch, args=args)
+    thread.start()
+    # Edit until the change is handled, as the watcher may not be started yet.
+    reset = 0
+    while thread.is_alive() and reset < 100:  # noqa: PLR2004
+        time.sleep(0.1)
+        reset = reset + 1
+        (tmp_path / "a.rdl").write_text(device.format(name="dev_a", reset=reset))
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+
+    log = capsys.readouterr().out
+    assert "ms after the edit." in log
+    assert f"Generated {out_dir / 'dev_a_reg_top.sv'}." in log.split("Changed:")[1]
+    assert f"Unchanged {out_dir / 'dev_b_reg_top.sv'}." in log.split("Changed:")[1]
+
+
+@pytest.mark.parametrize("poll", [False, True])
+def test_watch_edit_during_export(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture, poll: bool
+) -> None:
+    """Test that a file edited during the first export and a later one is exported again."""
+    device = "addrmap {name} {{ reg {{ field {{}} EN[7:0] = {reset}; }} CTRL; }};\n"
+    (tmp_path / "a.rdl").write_text(device.format(name="dev_a", reset=0))
+    input_rdl = tmp_path / "soc.rdl"
+    input_rdl.write_text('`include "a.rdl"\naddrmap soc { dev_a DEV_A @ 0x0; };\n')
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    resets = iter(range(1, 3))
+
+    def export(*args: object, **kwargs: object) -> list[Path] | None:
+        dependencies = _export(*args, **kwargs)
+        # Only the first export and the export of the first change edit the included file.
+        if (reset := next(resets, None)) is not None:
+            (tmp_path / "a.rdl").write_text(device.format(name="dev_a", reset=reset))
+        return dependencies
+
+    monkeypatch.setattr(watch, "_export", export)
+    args = (input_rdl, out_dir, True, 1, False, "flat", poll, 0.05, 2)
+    thread = threading.Thread(target=watch.watch, args=args, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+
+    log = capsys.readouterr().out
+    assert log.count(f"Changed: {tmp_path / 'a.rdl'}") == 2  # noqa: PLR2004
+    assert ".RESVAL  (8'h2)," in (out_dir / "dev_a_reg_top.sv").read_text()
+
+
+def test_watch_errors(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Test that a failed export is reported and that the watches follow the dependencies."""
+    out_file = tmp_path / "out"
+    out_file.write_text("")
+    assert _export(SNAPSHOTS_DIR / "uart.rdl", out_file) is None
+    assert "Error: The export failed" in capsys.readouterr().out
+
+    try:
+        watcher = watch.InotifyWatcher()
+    except OSError:
+        pytest.skip("inotify is unavailable")
+    for name in ["a", "b"]:
+        (tmp_path / name).mkdir()
+    try:
+        watcher.watch([tmp_path / "a" / "a.rdl", tmp_path / "b" / "b.rdl"])
+        assert sorted(watcher.dirs.values()) == [tmp_path / "a", tmp_path / "b"]
+        watcher.watch([tmp_path / "a" / "a.rdl"])
+        assert list(watcher.dirs.values()) == [tmp_path / "a"]
+        (tmp_path / "a" / "a.rdl").write_text("")
+        assert watcher.wait(timeout=1) == {tmp_path / "a" / "a.rdl"}
+    finally:
+        watcher.close()
+
+
+def test_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that export-rtl forwards the exports to a server, which runs them concurrently."""
+    socket_path = tmp_path / "rdl2ot.sock"
+    # The server redirects the prints of its threads.
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+    with server.create_server(socket_path) as export_server:
+        thread = threading.Thread(target=export_server.serve_forever)
+        thread.start()
+        monkeypatch.setenv("RDL2OT_SOCKET", str(socket_path))
+        cli_result = _run_cli_tool(SNAPSHOTS_DIR / "uart.rdl", tmp_path)
+        assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stdout}"
+        assert f"Generated {tmp_path / 'uart_reg_top.sv'}." in cli_result.stdout
+        cli_result = _run_cli_tool(SNAPSHOTS_DIR / "missing.rdl", tmp_path)
+        assert cli_result.returncode == 1
+        assert "No such file" in cli_result.stdout
+
+        def request(ip_block: str) -> dict:
+            out_dir = tmp_path / ip_block
+            out_dir.mkdir()
+            input_rdl = str(SNAPSHOTS_DIR / f"{ip_block}.rdl")
+            request = {
+                "input_file": input_rdl,
+                "out_dir": str(out_dir),
+                "soc": ip_block.startswith("soc"),
+                # The profiled exports run one at a time, the others alongside them.
+                "options": {"no_cache": True, "jobs": 2, "profile": ip_block != "uart"},
+            }
+            return server.forward(socket_path, request)
+
+        ip_blocks = ["lc_ctrl", "uart", "soc_strawberry"]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            responses = list(executor.map(request, ip_blocks))
+
+        # A client of another rdl2ot is answered the key of the server only.
+        with socket.socket(socket.AF_UNIX) as sock, sock.makefile("rwb") as f:
+            sock.connect(str(socket_path))
+            f.write(json.dumps({"generator": "other"}).encode() + b"\n")
+            f.flush()
+            assert json.loads(f.readline())["generator"] != "other"
+            assert f.readline() == b""
+        export_server.shutdown()
+        thread.join()
+
+    # The prints of the concurrent exports are not mixed.
+    for ip_block, response in zip(ip_blocks, responses, strict=True):
+        assert response["returncode"] == 0
+        generated = [line for line in response["output"].splitlines() if "Generated" in line]
+        assert generated
+        assert all(f"{tmp_path / ip_block}/" in line for line in generated)
+        # Only the profiled exports report their stages, and only their own ones.
+        assert ("Peak (MiB)" in response["output"]) == (ip_block != "uart")
+    assert "parse interface uart" not in responses[0]["output"]
+    name = "uart_reg_top.sv"
+    assert (tmp_path / "uart" / name).read_text() == (SNAPSHOTS_DIR / name).read_text()
+
+
+def test_server_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that export-rtl exports in its own process if the server closes without answering."""
+    socket_path = tmp_path / "rdl2ot.sock"
+    with socket.socket(socket.AF_UNIX) as listener:
+        listener.bind(str(socket_path))
+        listener.listen()
+
+        def crash() -> None:
+            for _ in range(2):
+                connection, _ = listener.accept()
+                connection.close()
+
+        thread = threading.Thread(target=crash)
+        thread.start()
+        assert server.forward(socket_path, {}) is None
+        monkeypatch.setenv("RDL2OT_SOCKET", str(socket_path))
+        cli_result = _run_cli_tool(SNAPSHOTS_DIR / "uart.rdl", tmp_path)
+        thread.join()
+    assert cli_result.returncode == 0, f"CLI exited with error: {cli_result.stderr}"
+    assert "Warning: The rdl2ot server failed to respond" in cli_result.stdout
+    assert f"Generated {tmp_path / 'uart_reg_top.sv'}." in cli_result.stdout
+
+
+def test_server_timeout(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that export-rtl fails rather than exporting alongside a server that times out."""
+    socket_path = tmp_path / "rdl2ot.sock"
+    monkeypatch.setattr(server, "EXPORT_TIMEOUT", 0.1)
+    with socket.socket(socket.AF_UNIX) as listener:
+        listener.bind(str(socket_path))
+        listener.listen()
+
+        def hang() -> None:
+            connection, _ = listener.accept()
+            with connection, connection.makefile("rwb") as f:
+                f.readline()
+                f.write(json.dumps({"generator": server.generator_key()}).encode() + b"\n")
+                f.flush()
+                # Still exporting when the client gives up.
+                f.readline()
+
+        thread = threading.Thread(target=hang)
+        thread.start()
+        response = server.forward(socket_path, {"out_dir": str(tmp_path)})
+        thread.join()
+    assert response["returncode"] == 1
+    assert f"it may still be writing {tmp_path}" in response["output"]
+
+
+def test_write_if_changed_concurrently(tmp_path: Path) -> None:
+    """Test that concurrent writers of a file never mix their outputs."""
+    path = tmp_path / "out.sv"
+    barrier = threading.Barrier(2)
+
+    def write(text: str) -> None:
+        with incremental.write_if_changed(path) as f:
+            f.write(text)
+            # Both writers are writing at the same time.
+            barrier.wait()
+            f.write(text)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(write, ["a" * 1000, "b" * 1000]))
+    assert path.read_text() in {"a" * 2000, "b" * 2000}
+    assert list(tmp_path.iterdir()) == [path]
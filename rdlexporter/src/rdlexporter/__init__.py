@@ -4,8 +4,9 @@
 
 """Init."""
 
+from .batch import export_batch
 from .exporter import RdlExporter
 
-__all__ = ("RdlExporter",)
+__all__ = ("RdlExporter", "export_batch")
 
 __version__ = "0.1.0"
@@ -0,0 +1,10 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Main."""
+
+from rdlexporter.batch import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# Copyright lowRISC contributors.
+# Licensed under the Apache License, Version 2.0, see LICENSE for details.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Export many register models to RDL files across a pool of processes.
+
+Every block is either an RDL file or a builder, a function populating an `RDLCompiler`, typically
+through an `RDLImporter`. The builders must be importable functions to run in a pool of processes.
+
+The user-defined enums and properties header is copied once to the output directory and included
+by every output. A manifest lists the outputs, in the order of the blocks, with the time taken by
+each block. The outputs don't depend on the number of processes.
+
+Usage: python -m rdlexporter OUT_DIR [SOURCES...] [--builder MODULE:FUNCTION] [--header FILE]
+"""
+
+import argparse
+import functools
+import importlib
+import json
+import shutil
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+
+from systemrdl import RDLCompiler
+
+from .exporter import RdlExporter
+
+MANIFEST_NAME = "manifest.json"
+
+Builder = Callable[[RDLCompiler], None]
+
+
+def _export_block(task: tuple, share_definitions: bool) -> dict:
+    """Build or compile a block and export it, returning its manifest entry."""
+    name, source, out_dir, header = task
+    start = time.perf_counter()
+    rdlc = RDLCompiler()
+    if isinstance(source, Path):
+        rdlc.compile_file(source)
+    else:
+        # The header defines the enums and properties the builder refers to, the RDL files
+        # include it themselves.
+        if header:
+            rdlc.compile_file(header)
+        source(rdlc)
+    output = out_dir / f"{name}.rdl"
+    with output.open("w", encoding="utf-8") as f:
+        if header:
+            f.write(f'`include "{header.name}"\n\n')
+        RdlExporter(rdlc, share_definitions=share_definitions).write(f)
+    return {"name": name, "output": output.name, "seconds": time.perf_counter() - start}
+
+
+def export_batch(
+    blocks: Mapping[str, Path | Builder],
+    out_dir: Path,
+    header: Path | None = None,
+    jobs: int = 1,
+    share_definitions: bool = False,
+) -> Path:
+    """Export every block to `out_dir/<name>.rdl`, using `jobs` processes if above one.
+
+    BLOCKS: The RDL file or the builder of every block, by name.
+    HEADER: The user-defined enums and properties, copied to `out_dir` and included by the outputs.
+    SHARE_DEFINITIONS: Emit the identical definitions once, see `RdlExporter.share_definitions`.
+    Returns the path of the manifest.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if header:
+        header = Path(header).resolve()
+        if header.parent != out_dir.resolve():
+            shutil.copyfile(header, out_dir / header.name)
+
+    tasks = [
+        (name, Path(source) if isinstance(source, str) else source, out_dir, header)
+        for name, source in blocks.items()
+    ]
+    export = functools.partial(_export_block, share_definitions=share_definitions)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else nullcontext() as executor:
+        entries = list((executor.map if executor else map)(export, tasks))
+    for entry in entries:
+        print(f"Exported {entry['name']} in {entry['seconds'] * 1000:.1f} ms.")
+
+    manifest = {
+        "header": header.name if header else None,
+        "seconds": time.perf_counter() - start,
+        "blocks": entries,
+    }
+    path = out_dir / MANIFEST_NAME
+    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def _load_builder(spec: str) -> tuple[str, Builder]:
+    """Import a `module:function` builder, the block being named after the function."""
+    module_name, _, function_name = spec.partition(":")
+    if not function_name:
+        print(f"Error: Invalid builder {spec}, expected module:function.")
+        raise ValueError
+    return function_name, getattr(importlib.import_module(module_name), function_name)
+
+
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer, rejected by argparse otherwise."""
+    number = int(value)
+    if number < 1:
+        msg = f"{value} is not a positive integer"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Export the RDL files and the builders given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("sources", type=Path, nargs="*", help="RDL files, named after their stem.")
+    parser.add_argument(
+        "--builder",
+        action="append",
+        default=[],
+        help="A module:function populating an RDLCompiler, named after the function.",
+    )
+    parser.add_argument("--header", type=Path, help="User-defined enums and properties.")
+    parser.add_argument("--jobs", "-j", type=_positive_int, default=1)
+    parser.add_argument("--share-definitions", action="store_true")
+    args = parser.parse_args(argv)
+
+    blocks = {}
+    for name, source in [
+        *((path.stem, path) for path in args.sources),
+        *map(_load_builder, args.builder),
+    ]:
+        if name in blocks:
+            print(f"Error: Two blocks are named {name}.")
+            raise ValueError
+        blocks[name] = source
+    manifest = export_batch(blocks, args.out_dir, args.header, args.jobs, args.share_definitions)
+    print(f"Wrote {manifest}")
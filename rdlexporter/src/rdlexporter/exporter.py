@@ -2,31 +2,160 @@
 # Licensed under the Apache License, Version 2.0, see LICENSE for details.
 # SPDX-License-Identifier: Apache-2.0
 
-"""Exports rdl files."""
+"""Exports rdl files.
 
+The RDL is generated as a stream of chunks, so the time of an export is linear in the size of the
+model and its memory doesn't depend on the size of the output.
+
+By default every register and field is emitted with an anonymous inline definition. With
+`share_definitions`, the registers and fields of an addrmap that have an identical structure are
+emitted once as a named definition at the top of the addrmap, then instantiated by name. The
+references to other instances are left out of the definitions, they are emitted as dynamic
+assignments of every instance.
+
+The export can be restricted to a selection of subtrees, given by their hierarchical paths from a
+root definition, such as `lc_ctrl.regs`. Their ancestors are emitted with only the selected
+children, and the instances the selection refers to are selected too, found through the
+`DependencyIndex` of the compiler. Only the selected subtrees are walked.
+"""
+
+import io
+import itertools
+import warnings
+import weakref
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TextIO
 
 from systemrdl import RDLCompiler
 from systemrdl.ast.cast import AssignmentCast
 from systemrdl.ast.literals import BoolLiteral, BuiltinEnumLiteral, IntLiteral, StringLiteral
 from systemrdl.ast.references import InstRef
-from systemrdl.component import AddressableComponent, Addrmap, Field, Mem, Reg
+from systemrdl.component import AddressableComponent, Addrmap, Component, Field, Mem, Reg
 from systemrdl.rdltypes import AccessType, OnReadType, OnWriteType
 from systemrdl.rdltypes.user_enum import UserEnumMeta
 
+# The number of characters gathered before a write to the output stream.
+BUFFER_SIZE = 64 * 1024
+
+# A reference of a subtree: the path of the referring component within the subtree, the scope the
+# reference is relative to and the path of the instance referred to from that scope.
+Reference = tuple[tuple[str, ...], str, tuple[str, ...]]
+
+
+class DependencyIndex:
+    """The children by name and the references of the components of a compiler.
+
+    The components are indexed lazily, the first time a selection reaches them, so that the cost of
+    an export scales with the selection. The compiler must not change once indexed.
+    """
+
+    def __init__(self, rdlc: RDLCompiler) -> None:
+        """Create an empty index of `rdlc`."""
+        self.rdlc = rdlc
+        # The position and the child of every instance name.
+        self._children: dict[int, dict[str, tuple[int, Component]]] = {}
+        self._references: dict[int, list[Reference]] = {}
+
+    def _indexed_children(self, component: Component) -> dict[str, tuple[int, Component]]:
+        if id(component) not in self._children:
+            self._children[id(component)] = {
+                child.inst_name: (position, child)
+                for position, child in enumerate(component.children)
+            }
+        return self._children[id(component)]
+
+    def children(self, component: Component, names: Iterable[str]) -> list[Component]:
+        """Return the children of a component with the given instance names, in their order."""
+        children = self._indexed_children(component)
+        return [child for _, child in sorted(children[name] for name in names)]
+
+    def resolve(self, path: tuple[str, ...]) -> list[Component]:
+        """Return the components along a path, the first name being a root definition."""
+        chain = []
+        for depth, name in enumerate(path):
+            if depth == 0:
+                component = self.rdlc.root.comp_defs.get(name)
+            else:
+                component = self._indexed_children(chain[-1]).get(name, (0, None))[1]
+            if component is None:
+                print(f"Error: Unknown component {'.'.join(path[: depth + 1])}.")
+                raise RuntimeError
+            chain.append(component)
+        return chain
+
+    def references(self, component: Component) -> list[Reference]:
+        """Return the references of the properties of a component and of its descendants."""
+        if id(component) not in self._references:
+            references = []
+            for obj in component.properties.values():
+                if isinstance(obj, InstRef):
+                    ref = obj.get_value()
+                    scope = ref.ref_root._scope_name or ref.ref_root.type_name  # noqa: SLF001
+                    target = tuple(element[0] for element in ref.ref_elements)
+                    references.append(((), scope.lower(), target))
+            for child in component.children:
+                references.extend(
+                    ((child.inst_name, *path), scope, target)
+                    for path, scope, target in self.references(child)
+                )
+            self._references[id(component)] = references
+        return self._references[id(component)]
+
+
+_indexes: "weakref.WeakKeyDictionary[RDLCompiler, DependencyIndex]" = weakref.WeakKeyDictionary()
+
+
+def dependency_index(rdlc: RDLCompiler) -> DependencyIndex:
+    """Return the dependency index of a compiler, created on the first call."""
+    if rdlc not in _indexes:
+        _indexes[rdlc] = DependencyIndex(rdlc)
+    return _indexes[rdlc]
+
+
+def _is_selected(selection: dict, path: tuple[str, ...]) -> bool:
+    """Return whether a path is in a subtree of a selection."""
+    node = selection
+    for name in path:
+        if name not in node:
+            return False
+        node = node[name]
+        if node is None:
+            return True
+    return False
+
 
 @dataclass
 class RdlExporter:
     """Exports rdl files from AST."""
 
     rdlc: RDLCompiler
-    stream: str = ""
+    # Deprecated: if set, `export` prepends it to the RDL and keeps the whole output in it.
+    stream: str | None = None
+    share_definitions: bool = False
     indent_pos = 0
     indent_width = 4
     indent_str = " "
     dynamic_assignment: dict[str, list[dict]] = field(default_factory=dict)
     ast_path: list[str] = field(default_factory=list)
+    # The type names of the shared definitions in scope, by structural key.
+    definitions: dict[tuple, str] = field(default_factory=dict)
+    type_names: set[str] = field(default_factory=set)
+    _keys: dict[int, tuple | None] = field(default_factory=dict, repr=False)
+    # The next suffix of every base type name, and the root type names of the user.
+    _suffixes: dict[str, Iterator[int]] = field(default_factory=dict, repr=False)
+    _user_types: set[str] | None = field(default=None, repr=False)
+    _in_definition = False
+
+    def __post_init__(self) -> None:
+        """Warn about the deprecated `stream` attribute."""
+        if self.stream is not None:
+            warnings.warn(
+                "RdlExporter.stream is deprecated, use `write` or `generate` instead.",
+                DeprecationWarning,
+                stacklevel=3,
+            )
 
     def _raise_type_error(self, type_name: str) -> None:
         print(f"Error: Unsupported type: {type_name} at this level only supports")
@@ -59,7 +188,7 @@ class RdlExporter:
             else reg.array_dimensions[0].get_value()
         )
 
-    def _emit_dynamic_assignment(self) -> None:
+    def _emit_dynamic_assignment(self) -> Iterator[str]:
         # Nothing to be emited
         current_scope = self.ast_path[-1].lower()
         if current_scope not in self.dynamic_assignment:
@@ -72,45 +201,66 @@ class RdlExporter:
 
             right_expr = "".join([f"{elem[0]}." for elem in scope["ref"].ref_elements]).rstrip(".")
             expr = f"{left_expr} = {right_expr};\n"
-            self.stream += self._indent() + expr
+            yield self._indent() + expr
+
+    def _format_value(self, obj: object) -> str | None:
+        if isinstance(obj, UserEnumMeta):
+            return obj.type_name
+        if isinstance(obj, BuiltinEnumLiteral):
+            return obj.val.name
+        if isinstance(obj, AccessType | OnReadType | OnWriteType):
+            return obj.name
+        if isinstance(obj, StringLiteral):
+            return f'''"{obj.get_value()}"'''
+        if isinstance(obj, BoolLiteral):
+            return str(obj.get_value()).lower()
+        if isinstance(obj, IntLiteral):
+            return f"0x{obj.get_value():x}"
+        if isinstance(obj, str):
+            return f'''"{obj}"'''
+        if isinstance(obj, bool):
+            return str(obj).lower()
+        if isinstance(obj, int):
+            return f"0x{obj:x}"
+        return None
 
-    def _emit_property(self, properties: dict) -> None:
+    def _record_reference(self, name: str, obj: InstRef) -> None:
+        # A definition can be instantiated in several places, its references are recorded for
+        # every instance instead.
+        if self._in_definition:
+            return
+        # This should be emited at a higher scope indicated by `ref_root._scope_name`.
+        ref = obj.get_value()
+        scope = ref.ref_root._scope_name or ref.ref_root.type_name  # noqa: SLF001
+        self.dynamic_assignment.setdefault(scope.lower(), []).append(
+            {
+                "property": name,
+                "ast_path": self.ast_path.copy(),
+                "ref": ref,
+            }
+        )
+
+    def _record_references(self, component: Reg | Field) -> None:
+        """Record the references of an instance of a shared definition and of its fields."""
+        for name, obj in component.properties.items():
+            if isinstance(obj, InstRef):
+                self._record_reference(name, obj)
+        for child in component.children:
+            self.ast_path.append(child.inst_name)
+            self._record_references(child)
+            self.ast_path.pop()
+
+    def _emit_property(self, properties: dict) -> Iterator[str]:
         for name, obj in properties.items():
-            if isinstance(obj, UserEnumMeta):
-                val = obj.type_name
-            elif isinstance(obj, BuiltinEnumLiteral):
-                val = obj.val.name
-            elif isinstance(obj, AccessType | OnReadType | OnWriteType):
-                val = obj.name
-            elif isinstance(obj, StringLiteral):
-                val = f'''"{obj.get_value()}"'''
-            elif isinstance(obj, BoolLiteral):
-                val = str(obj.get_value()).lower()
-            elif isinstance(obj, IntLiteral):
-                val = f"0x{obj.get_value():x}"
-            elif isinstance(obj, str):
-                val = f'''"{obj}"'''
-            elif isinstance(obj, bool):
-                val = str(obj).lower()
-            elif isinstance(obj, int):
-                val = f"0x{obj:x}"
-            elif isinstance(obj, InstRef):
-                # This should be emited at a higher scope indicated by `ref_root._scope_name`.
-                ref = obj.get_value()
-                scope = ref.ref_root._scope_name or ref.ref_root.type_name  # noqa: SLF001
-                self.dynamic_assignment.setdefault(scope.lower(), []).append(
-                    {
-                        "property": name,
-                        "ast_path": self.ast_path.copy(),
-                        "ref": ref,
-                    }
-                )
+            if isinstance(obj, InstRef):
+                self._record_reference(name, obj)
                 continue
-            else:
+            val = self._format_value(obj)
+            if val is None:
                 print(f"Warning: Type {type(obj)} not implemented, skipping it.")
                 continue
 
-            self.stream += self._indent() + f"{name} = {val};\n"
+            yield self._indent() + f"{name} = {val};\n"
 
     def _arrays(self, component: Reg) -> str:
         if not component.is_array:
@@ -123,11 +273,11 @@ class RdlExporter:
         dim = self._get_register_array_dim(component)
         return f"[{dim}]"
 
-    def _emit_parameters(self, parameters: list) -> None:
+    def _emit_parameters(self, parameters: list) -> Iterator[str]:
         if not len(parameters):
             return
 
-        self.stream += "#(\n"
+        yield "#(\n"
         self.indent_pos += self.indent_width
         for index, param in enumerate(parameters):
             val = param.get_value()
@@ -136,91 +286,256 @@ class RdlExporter:
             else:
                 self._raise_type_error(type(param.param_type))
 
-            self.stream += self._indent() + f"{type_} {param.name} = {val}"
+            yield self._indent() + f"{type_} {param.name} = {val}"
             last = index == (len(parameters) - 1)
-            self.stream += ",\n" if not last else "\n"
+            yield ",\n" if not last else "\n"
 
         self.indent_pos -= self.indent_width
-        self.stream += ")"
+        yield ")"
 
-    def _emit_mem(self, mem: Mem) -> None:
+    def _emit_mem(self, mem: Mem) -> Iterator[str]:
         self.ast_path.append(mem.inst_name)
         external_str = "external " if mem.external else ""
-        self.stream += self._indent() + external_str + "mem "
-        self._emit_parameters(mem.parameters)
-        self.stream += "{\n"
+        yield self._indent() + external_str + "mem "
+        yield from self._emit_parameters(mem.parameters)
+        yield "{\n"
         self.indent_pos += self.indent_width
-        self._emit_property(mem.properties)
+        yield from self._emit_property(mem.properties)
         self.indent_pos -= self.indent_width
-        self.stream += self._indent() + f"}} {mem.inst_name}" + self._arrays(mem)
+        yield self._indent() + f"}} {mem.inst_name}" + self._arrays(mem)
         offset = self._get_offset(mem)
-        self.stream += f"{offset};\n"
+        yield f"{offset};\n"
         self.ast_path.pop()
 
-    def _emit_field(self, field: Field) -> None:
-        self.ast_path.append(field.inst_name)
-        self.stream += self._indent() + "field "
-        self._emit_parameters(field.parameters)
-        self.stream += "{\n"
+    def _definition_key(self, component: Reg | Field) -> tuple | None:
+        """Return the structural key of a component, or None if its definition can't be shared."""
+        if id(component) in self._keys:
+            return self._keys[id(component)]
+        key = None
+        children = component.children
+        if not component.parameters and all(isinstance(child, Field) for child in children):
+            properties = tuple(
+                (name, self._format_value(obj))
+                for name, obj in component.properties.items()
+                if not isinstance(obj, InstRef)
+            )
+            children = tuple(
+                (child.inst_name, self._get_field_limits(child), self._definition_key(child))
+                for child in children
+            )
+            if all(value is not None for _, value in properties) and all(
+                child[2] is not None for child in children
+            ):
+                key = (type(component).__name__, properties, children)
+        self._keys[id(component)] = key
+        return key
+
+    def _shared_type(self, component: Reg | Field) -> str | None:
+        if not self.definitions:
+            return None
+        return self.definitions.get(self._definition_key(component))
+
+    def _type_name(self, component: Reg | Field) -> str:
+        """Name a definition after the type it was instantiated from, or its first instance."""
+        original = component.original_def
+        if original and original.type_name:
+            base = original.type_name
+        else:
+            base = f"{component.inst_name.lower()}_t"
+        if self._user_types is None:
+            # The root definitions and enums, which a shared definition must not shadow.
+            self._user_types = set(self.rdlc.root.comp_defs)
+            self._user_types.update(self.rdlc.namespace.type_ns_stack[0])
+        taken = self.type_names | self._user_types
+        name = base
+        suffixes = self._suffixes.setdefault(base, itertools.count(1))
+        while name in taken:
+            name = f"{base}_{next(suffixes)}"
+        self.type_names.add(name)
+        return name
+
+    def _emit_body(self, component: Reg | Field) -> Iterator[str]:
+        yield from self._emit_parameters(component.parameters)
+        yield "{\n"
         self.indent_pos += self.indent_width
-        self._emit_property(field.properties)
+        yield from self._emit_property(component.properties)
+        for child in component.children:
+            if isinstance(child, Field):
+                yield from self._emit_field(child)
+            else:
+                self._raise_type_error(type(child))
         self.indent_pos -= self.indent_width
+        yield self._indent() + "}"
+
+    def _emit_definitions(self, children: list[Component]) -> Iterator[str]:
+        """Emit the registers and fields of an addrmap instantiated several times as definitions."""
+        registers = {}
+        fields = []
+        for child in children:
+            key = self._definition_key(child) if isinstance(child, Reg) else None
+            # The fields of the instances of a same register are only counted once.
+            if isinstance(child, Reg) and (key is None or key not in registers):
+                fields.extend(field for field in child.children if isinstance(field, Field))
+            if key is not None:
+                registers.setdefault(key, []).append(child)
+        field_instances = {}
+        for field_ in fields:
+            key = self._definition_key(field_)
+            if key is not None:
+                field_instances.setdefault(key, []).append(field_)
+
+        # The fields are defined first, as the register definitions instantiate them.
+        for instances in (field_instances, registers):
+            for key, components in instances.items():
+                if len(components) < 2 or key in self.definitions:  # noqa: PLR2004
+                    continue
+                name = self._type_name(components[0])
+                kind = "reg" if isinstance(components[0], Reg) else "field"
+                self._in_definition = True
+                yield self._indent() + f"{kind} {name} "
+                yield from self._emit_body(components[0])
+                yield ";\n\n"
+                self._in_definition = False
+                self.definitions[key] = name
+
+    def _emit_field(self, field: Field) -> Iterator[str]:
+        self.ast_path.append(field.inst_name)
         msb, lsb = self._get_field_limits(field)
-        self.stream += self._indent() + f"}} {field.inst_name}[{msb}:{lsb}];\n"
+        type_name = self._shared_type(field)
+        if type_name:
+            self._record_references(field)
+            yield self._indent() + f"{type_name} {field.inst_name}[{msb}:{lsb}];\n"
+        else:
+            yield self._indent() + "field "
+            yield from self._emit_body(field)
+            yield f" {field.inst_name}[{msb}:{lsb}];\n"
         self.ast_path.pop()
 
-    def _emit_register(self, register: Reg) -> None:
+    def _emit_register(self, register: Reg) -> Iterator[str]:
         self.ast_path.append(register.inst_name)
         external_str = "external " if register.external else ""
-        self.stream += self._indent() + external_str + "reg "
-        self._emit_parameters(register.parameters)
-        self.stream += "{\n"
-        self.indent_pos += self.indent_width
-        self._emit_property(register.properties)
-        for child in register.children:
-            if isinstance(child, Field):
-                self._emit_field(child)
-            else:
-                self._raise_type_error(type(child))
-        self.indent_pos -= self.indent_width
-        self.stream += self._indent() + f"}} {register.inst_name}" + self._arrays(register)
+        type_name = self._shared_type(register)
+        if type_name:
+            self._record_references(register)
+            yield self._indent() + external_str + f"{type_name} {register.inst_name}"
+        else:
+            yield self._indent() + external_str + "reg "
+            yield from self._emit_body(register)
+            yield f" {register.inst_name}"
         offset = self._get_offset(register)
-        self.stream += f"{offset};\n"
+        yield self._arrays(register) + f"{offset};\n"
         self.ast_path.pop()
 
-    def _emit_addrmap(self, name: str, addrmap: Addrmap) -> None:
+    def _emit_addrmap(
+        self, name: str, addrmap: Addrmap, selection: dict | None = None
+    ) -> Iterator[str]:
+        """Emit an addrmap, with only the children in `selection` unless None."""
+        children = addrmap.children
+        if selection is not None:
+            children = dependency_index(self.rdlc).children(addrmap, selection)
         self.ast_path.append(name)
-        self.stream += self._indent() + "addrmap "
-        self.stream += f"{name} " if not self._is_nested() else ""
-        self._emit_parameters(addrmap.parameters)
-        self.stream += "{\n"
+        yield self._indent() + "addrmap "
+        if not self._is_nested():
+            yield f"{name} "
+        yield from self._emit_parameters(addrmap.parameters)
+        yield "{\n"
         self.indent_pos += self.indent_width
-        for child in addrmap.children:
+        # The definitions of the addrmap are visible in the nested addrmaps.
+        outer_definitions = self.definitions
+        if self.share_definitions:
+            self.definitions = dict(outer_definitions)
+            yield from self._emit_definitions(children)
+        for child in children:
             if isinstance(child, Reg):
-                self._emit_register(child)
+                yield from self._emit_register(child)
             elif isinstance(child, Addrmap):
-                self._emit_addrmap(child.inst_name, child)
+                child_selection = None if selection is None else selection[child.inst_name]
+                yield from self._emit_addrmap(child.inst_name, child, child_selection)
             elif isinstance(child, Mem):
-                self._emit_mem(child)
+                yield from self._emit_mem(child)
             else:
                 self._raise_type_error(type(child))
-            self._emit_dynamic_assignment()
-            self.stream += "\n"
+            yield from self._emit_dynamic_assignment()
+            yield "\n"
 
+        self.definitions = outer_definitions
         self.indent_pos -= self.indent_width
-        self.stream += self._indent() + "}"
-        self.stream += f" {name};\n" if self._is_nested() else ";\n"
+        yield self._indent() + "}"
+        yield f" {name};\n" if self._is_nested() else ";\n"
         self.ast_path.pop()
 
-    def export(self, outfile: Path) -> None:
-        """Export the SystemRDL ast to an RDL file."""
+    def _select(self, paths: Iterable[str]) -> dict:
+        """Return the tree of the selected subtrees and of the instances they refer to.
+
+        A subtree selected whole maps to None, the registers and memories are always whole.
+        """
+        index = dependency_index(self.rdlc)
+        selection = {}
+        pending = [tuple(path.split(".")) for path in paths]
+        while pending:
+            path = pending.pop()
+            chain = index.resolve(path)
+            depth = next((d for d, comp in enumerate(chain) if not isinstance(comp, Addrmap)), None)
+            if depth is not None:
+                path, chain = path[: depth + 1], chain[: depth + 1]
+            if _is_selected(selection, path):
+                continue
+            node = selection
+            for name in path[:-1]:
+                node = node.setdefault(name, {})
+            node[path[-1]] = None
+
+            for ref_path, scope, target in index.references(chain[-1]):
+                referrer = (*path, *ref_path)
+                # The target is relative to the closest ancestor named after the scope, as in
+                # `_emit_dynamic_assignment`.
+                for depth in range(len(referrer) - 1, -1, -1):
+                    if referrer[depth].lower() == scope:
+                        pending.append((*referrer[: depth + 1], *target))
+                        break
+        return selection
+
+    def generate(self, select: Iterable[str] | None = None) -> Iterator[str]:
+        """Generate the RDL of the SystemRDL ast as a sequence of chunks.
+
+        SELECT: The paths of the subtrees to export, such as `lc_ctrl.regs`, everything if None.
+        """
+        selection = None if select is None else self._select(select)
         self.ast_path.append(str(self.rdlc.root.inst_name))
         for name, component in self.rdlc.root.comp_defs.items():
+            if selection is not None and name not in selection:
+                continue
             if isinstance(component, Addrmap):
-                self._emit_addrmap(name, component)
+                child_selection = None if selection is None else selection[name]
+                yield from self._emit_addrmap(name, component, child_selection)
             else:
                 self._raise_type_error(type(component))
+        self.ast_path.pop()
+
+    def write(self, stream: TextIO, select: Iterable[str] | None = None) -> None:
+        """Write the RDL of the SystemRDL ast to a text stream, in writes of `BUFFER_SIZE` chars."""
+        buffer = []
+        size = 0
+        for chunk in self.generate(select):
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= BUFFER_SIZE:
+                stream.write("".join(buffer))
+                buffer.clear()
+                size = 0
+        stream.write("".join(buffer))
+
+    def export(self, outfile: Path, select: Iterable[str] | None = None) -> None:
+        """Export the SystemRDL ast to an RDL file, appending it to the file if it exists.
 
-        self.stream.lstrip("\n ")
-        with outfile.open("a") as f:
+        If the deprecated `stream` is set, the RDL is appended to it, then all of it to the file.
+        """
+        with Path(outfile).open("a", encoding="utf-8") as f:
+            if self.stream is None:
+                self.write(f, select)
+                return
+            buffer = io.StringIO(self.stream)
+            buffer.seek(0, io.SEEK_END)
+            self.write(buffer, select)
+            self.stream = buffer.getvalue()
             f.write(self.stream)
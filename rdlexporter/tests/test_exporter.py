@@ -4,15 +4,20 @@
 
 """Unittests."""
 
+import io
+import json
+import shutil
 from pathlib import Path
 
+import pytest
 from systemrdl import RDLCompiler, RDLImporter, rdltypes
 from systemrdl.ast.references import InstRef
 from systemrdl.core.parameter import Parameter
 from systemrdl.messages import FileSourceRef
+from systemrdl.node import AddressableNode, FieldNode, Node
 from systemrdl.rdltypes import AccessType, OnReadType, OnWriteType
 
-from rdlexporter import RdlExporter
+from rdlexporter import RdlExporter, batch, export_batch
 
 SNAPSHOTS_DIR = Path(__file__).parent / "snapshots"
 
@@ -49,6 +54,36 @@ def test_cli_lc_ctrl_from_file(tmp_path: Path) -> None:
     _run_ip_test_from_file(tmp_path, "lc_ctrl")
 
 
+def test_write_stream() -> None:
+    """Test that the chunks generated and the stream written match the snapshot."""
+    snapshot_content = (SNAPSHOTS_DIR / "lc_ctrl.rdl").read_text(encoding="utf-8")
+    rdlc = RDLCompiler()
+    rdlc.compile_file(SNAPSHOTS_DIR / "lc_ctrl.rdl")
+
+    stream = io.StringIO('`include "user_defined.rdl"\n\n')
+    stream.seek(0, io.SEEK_END)
+    RdlExporter(rdlc).write(stream)
+    assert stream.getvalue() == snapshot_content
+
+    chunks = list(RdlExporter(rdlc).generate())
+    assert len(chunks) > 1
+    assert '`include "user_defined.rdl"\n\n' + "".join(chunks) == snapshot_content
+
+
+def test_deprecated_stream(tmp_path: Path) -> None:
+    """Test that the deprecated stream attribute is prepended to the export and holds it."""
+    snapshot_content = (SNAPSHOTS_DIR / "lc_ctrl.rdl").read_text(encoding="utf-8")
+    rdlc = RDLCompiler()
+    rdlc.compile_file(SNAPSHOTS_DIR / "lc_ctrl.rdl")
+
+    output_file = tmp_path / "lc_ctrl.rdl"
+    with pytest.deprecated_call():
+        exporter = RdlExporter(rdlc, '`include "user_defined.rdl"\n\n')
+    exporter.export(output_file)
+    assert exporter.stream == snapshot_content
+    assert output_file.read_text(encoding="utf-8") == snapshot_content
+
+
 def test_importer(tmp_path: Path) -> None:
     """Test with the SystemRDL importer."""
     input_rdl = SNAPSHOTS_DIR / "generic.rdl"
@@ -118,3 +153,190 @@ def test_importer(tmp_path: Path) -> None:
     assert actual_output_content == snapshot_content, (
         f"Output mismatch, to debug, run:\nmeld {output_file} {snapshot_file}\n"
     )
+
+
+def _elaborated_model(input_rdl: Path) -> list[tuple]:
+    """Return the path, position and properties of every node of an RDL file."""
+    rdlc = RDLCompiler()
+    rdlc.compile_file(input_rdl)
+    nodes = []
+    for node in rdlc.elaborate().descendants(unroll=True):
+        position = None
+        if isinstance(node, FieldNode):
+            position = (node.msb, node.lsb)
+        elif isinstance(node, AddressableNode):
+            position = node.absolute_address
+        properties = {}
+        for name in node.list_properties():
+            value = node.get_property(name)
+            properties[name] = value.get_path() if isinstance(value, Node) else str(value)
+        nodes.append((node.get_path(), position, properties))
+    return nodes
+
+
+def test_share_definitions(tmp_path: Path) -> None:
+    """Test that the shared definitions elaborate to the same model as the inline ones."""
+    rdlc = RDLCompiler()
+    rdlc.compile_file(SNAPSHOTS_DIR / "lc_ctrl.rdl")
+    shutil.copy(SNAPSHOTS_DIR / "user_defined.rdl", tmp_path)
+    outputs = {}
+    for share in (False, True):
+        outputs[share] = tmp_path / f"lc_ctrl_{share}.rdl"
+        outputs[share].write_text('`include "user_defined.rdl"\n\n', encoding="utf-8")
+        RdlExporter(rdlc, share_definitions=share).export(outputs[share])
+
+    shared = outputs[True].read_text(encoding="utf-8")
+    assert "field fatal_prog_error_t {" in shared
+    assert "fatal_prog_error_t FATAL_STATE_ERROR[1:1];" in shared
+    assert len(shared) < outputs[False].stat().st_size
+    assert _elaborated_model(outputs[True]) == _elaborated_model(outputs[False])
+
+
+def _build_shared(rdlc: RDLCompiler) -> None:
+    """Build three instances of a register whose field refers to another register."""
+    imp = RDLImporter(rdlc)
+    imp.default_src_ref = None
+    addrmap = imp.create_addrmap_definition("shared")
+
+    field_wen = imp.instantiate_field(imp.create_field_definition("EN"), "EN", 0, 1)
+    imp.assign_property(field_wen, "sw", AccessType.rw)
+    regwen = imp.create_reg_definition("CTRL_WEN")
+    imp.add_child(regwen, field_wen)
+    regwen = imp.instantiate_reg(regwen, "CTRL_WEN", 0x00)
+    imp.add_child(addrmap, regwen)
+
+    field_mode = imp.instantiate_field(imp.create_field_definition("MODE"), "MODE", 0, 4)
+    imp.assign_property(
+        field_mode,
+        "swwe",
+        InstRef(
+            imp.compiler.env,
+            addrmap,
+            [(regwen.inst_name, [], None), (field_wen.inst_name, [], None)],
+        ),
+    )
+    reg = imp.create_reg_definition("CTRL")
+    imp.add_child(reg, field_mode)
+    for index in range(3):
+        imp.add_child(addrmap, imp.instantiate_reg(reg, f"CTRL{index}", 0x04 * (index + 1)))
+    imp.register_root_component(addrmap)
+
+
+def test_share_definitions_references(tmp_path: Path) -> None:
+    """Test that the references of the instances of a shared register are all assigned."""
+    rdlc = RDLCompiler()
+    _build_shared(rdlc)
+    output_file = tmp_path / "shared.rdl"
+    RdlExporter(rdlc, share_definitions=True).export(output_file)
+
+    output = output_file.read_text(encoding="utf-8")
+    assert output.count("reg CTRL {") == 1
+    for index in range(3):
+        assert f"CTRL CTRL{index} @ 0x{0x04 * (index + 1):X};" in output
+        assert f"CTRL{index}.MODE -> swwe = CTRL_WEN.EN;" in output
+    swwe = {path: props.get("swwe") for path, _, props in _elaborated_model(output_file)}
+    assert swwe["shared.CTRL2.MODE"] == "shared.CTRL_WEN.EN"
+
+
+def test_share_definitions_names(tmp_path: Path) -> None:
+    """Test that the names of the shared definitions neither collide nor shadow a user type."""
+    input_file = tmp_path / "names.rdl"
+    input_file.write_text(
+        """
+enum a_1 { ON = 1; };
+addrmap top {
+    reg a_2 { field { sw = r; } EN[0:0]; };
+    reg a { field { sw = rw; } EN[0:0]; };
+    a_2 S0 @ 0x0;
+    a_2 S1 @ 0x4;
+    a R0 @ 0x8;
+    a R1 @ 0xC;
+    a R2 @ 0x10;
+    a R3 @ 0x14;
+    R2.EN -> reset = 1;
+    R3.EN -> reset = 1;
+};
+""",
+        encoding="utf-8",
+    )
+    rdlc = RDLCompiler()
+    rdlc.compile_file(input_file)
+    output_file = tmp_path / "top.rdl"
+    RdlExporter(rdlc, share_definitions=True).export(output_file)
+
+    output = output_file.read_text(encoding="utf-8")
+    assert "a_2 S1 @ 0x4;" in output
+    assert "a R1 @ 0xC;" in output
+    assert "reg a_1 " not in output
+    assert "a_3 R3 @ 0x14;" in output
+    assert _elaborated_model(output_file) == _elaborated_model(input_file)
+
+
+def _build_timer(rdlc: RDLCompiler) -> None:
+    """Build a register model with the importer, as a builder of `export_batch`."""
+    imp = RDLImporter(rdlc)
+    imp.default_src_ref = None
+    addrmap = imp.create_addrmap_definition("timer")
+    field_en = imp.instantiate_field(imp.create_field_definition("EN"), "EN", 0, 1)
+    imp.assign_property(field_en, "sw", AccessType.rw)
+    reg = imp.create_reg_definition("CTRL")
+    imp.add_child(reg, field_en)
+    imp.add_child(addrmap, imp.instantiate_reg(reg, "CTRL", 0x0))
+    imp.register_root_component(addrmap)
+
+
+def test_export_batch(tmp_path: Path) -> None:
+    """Test that a batch export doesn't depend on the number of processes."""
+    blocks = {
+        "uart": SNAPSHOTS_DIR / "uart.rdl",
+        "timer": _build_timer,
+        "lc_ctrl": SNAPSHOTS_DIR / "lc_ctrl.rdl",
+    }
+    header = SNAPSHOTS_DIR / "user_defined.rdl"
+    manifests = {}
+    for jobs in (1, 3):
+        manifest = export_batch(blocks, tmp_path / str(jobs), header, jobs=jobs)
+        manifests[jobs] = json.loads(manifest.read_text(encoding="utf-8"))
+
+    for jobs, manifest in manifests.items():
+        assert manifest["header"] == "user_defined.rdl"
+        assert [block["name"] for block in manifest["blocks"]] == list(blocks)
+        assert (tmp_path / str(jobs) / "user_defined.rdl").is_file()
+    for block in manifests[1]["blocks"]:
+        output = (tmp_path / "1" / block["output"]).read_text(encoding="utf-8")
+        assert output == (tmp_path / "3" / block["output"]).read_text(encoding="utf-8")
+    uart = (tmp_path / "1" / "uart.rdl").read_text(encoding="utf-8")
+    assert uart == (SNAPSHOTS_DIR / "uart.rdl").read_text(encoding="utf-8")
+    assert _elaborated_model(tmp_path / "1" / "timer.rdl")[-1][0] == "timer.CTRL.EN"
+
+
+def test_batch_jobs(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Test that the batch command line rejects a number of jobs below one."""
+    for jobs in ["0", "-1", "x"]:
+        with pytest.raises(SystemExit):
+            batch.main([str(tmp_path), "--jobs", jobs])
+        assert "--jobs" in capsys.readouterr().err
+
+
+def test_select(tmp_path: Path) -> None:
+    """Test that a selection only exports its subtrees and the instances they refer to."""
+    rdlc = RDLCompiler()
+    rdlc.compile_file(SNAPSHOTS_DIR / "lc_ctrl.rdl")
+    output = io.StringIO()
+    RdlExporter(rdlc).write(output, ["lc_ctrl.dmi"])
+    assert "} dmi;" in output.getvalue()
+    assert "ALERT_TEST" not in output.getvalue()
+
+    rdlc = RDLCompiler()
+    _build_shared(rdlc)
+    output_file = tmp_path / "shared.rdl"
+    RdlExporter(rdlc).export(output_file, ["shared.CTRL1.MODE"])
+    nodes = {path: props for path, _, props in _elaborated_model(output_file)}
+    assert list(nodes) == [
+        "shared",
+        "shared.CTRL_WEN",
+        "shared.CTRL_WEN.EN",
+        "shared.CTRL1",
+        "shared.CTRL1.MODE",
+    ]
+    assert nodes["shared.CTRL1.MODE"]["swwe"] == "shared.CTRL_WEN.EN"